@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Batch Orchestrator
+Crawl many colleges at once through one global, fairly shared work queue per provider
+"""
+
+import sys
+import time
+import threading
+import logging
+from collections import deque
+from typing import Dict, List, Optional, Any, Callable, Set, TextIO
+
+from live_linkedin_fetcher import LiveLinkedInFetcher
+from dedup import canonical_profile_url, IdentityIndex
+from json_stream import NDJSONWriter
+
+logger = logging.getLogger(__name__)
+
+class FairQueue:
+    """
+    Work queue that serves colleges round-robin
+    
+    Each college has its own FIFO of tasks; get() takes one task from the
+    college at the head of the rotation and moves that college to the back,
+    so a college with hundreds of queued scrapes cannot starve the others.
+    """
+    
+    def __init__(self):
+        self._tasks: Dict[str, deque] = {}
+        self._rotation = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+    
+    def put(self, college: str, task: Any):
+        """Queue a task on behalf of a college"""
+        with self._cond:
+            if college not in self._tasks or not self._tasks[college]:
+                self._tasks.setdefault(college, deque())
+                self._rotation.append(college)
+            self._tasks[college].append(task)
+            self._cond.notify()
+    
+    def get(self) -> Optional[Any]:
+        """Wait for the next task in round-robin order; None once the queue is closed"""
+        with self._cond:
+            while not self._rotation and not self._closed:
+                self._cond.wait()
+            if not self._rotation:
+                return None
+            
+            college = self._rotation.popleft()
+            task = self._tasks[college].popleft()
+            if self._tasks[college]:
+                self._rotation.append(college)
+            return task
+    
+    def close(self):
+        """Wake all waiting workers and make get() return None when empty"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+class CollegeJob:
+    """Per-college crawl state shared by the workers handling its tasks"""
+    
+    def __init__(self, college_name: str, limit: int, methods: List[str]):
+        self.college_name = college_name
+        self.limit = limit
+        self.methods = methods
+        self.identities = IdentityIndex()
+        self.seen_urls: Set[str] = set()
+        self.hunter_found = 0
+        self.pending = 0
+        self.stream: Optional[NDJSONWriter] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.lock = threading.Lock()
+    
+    @property
+    def students(self) -> List[Dict[str, Any]]:
+        return self.identities.profiles
+    
+    @property
+    def full(self) -> bool:
+        return len(self.identities) >= self.limit
+    
+    @property
+    def phase_limit(self) -> int:
+        return LiveLinkedInFetcher._phase_limit(self.limit, self.methods)
+
+class BatchProgress:
+    """Counts scheduled and finished tasks and renders a progress/ETA line"""
+    
+    def __init__(self, total_colleges: int):
+        self.total_colleges = total_colleges
+        self.colleges_done = 0
+        self.tasks_scheduled = 0
+        self.tasks_done = 0
+        self.students = 0
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def scheduled(self, count: int = 1):
+        with self._lock:
+            self.tasks_scheduled += count
+    
+    def task_done(self):
+        with self._lock:
+            self.tasks_done += 1
+    
+    def college_done(self, students: int):
+        with self._lock:
+            self.colleges_done += 1
+            self.students += students
+    
+    def eta_seconds(self) -> Optional[float]:
+        """
+        Remaining time at the current task throughput
+        
+        Tasks are discovered as the crawl proceeds (a search result adds scrape
+        tasks), so the estimate can grow early on before settling down.
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self.started_at
+            if not self.tasks_done or elapsed <= 0:
+                return None
+            rate = self.tasks_done / elapsed
+            return (self.tasks_scheduled - self.tasks_done) / rate
+    
+    def render(self) -> str:
+        """One-line progress summary"""
+        eta = self.eta_seconds()
+        with self._lock:
+            elapsed = time.monotonic() - self.started_at
+            rate = self.tasks_done / elapsed if elapsed > 0 else 0.0
+            eta_text = self._format_duration(eta) if eta is not None else '--:--'
+            return (f"[{self.colleges_done}/{self.total_colleges} colleges] "
+                    f"{self.tasks_done}/{self.tasks_scheduled} tasks, {self.students} students, "
+                    f"{rate:.1f} tasks/s, elapsed {self._format_duration(elapsed)}, ETA {eta_text}")
+    
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+class BatchOrchestrator:
+    """
+    Schedule the Hunter.io, search and scrape requests of many colleges together
+    
+    Every unit of work (a Hunter domain lookup, a search results page, a profile scrape)
+    is a task in the FairQueue of the provider it calls. A fixed pool of workers
+    per provider drains its queue, pacing requests with the fetcher's shared provider
+    rate limiters, so each provider is kept busy up to its global rate limit for
+    the whole batch instead of idling while another college's phase runs.
+    """
+    
+    def __init__(self, fetcher: LiveLinkedInFetcher = None, hunter_workers: int = 2,
+                 scrape_workers: int = None, progress_interval: float = 2.0,
+                 progress_stream: TextIO = None):
+        """
+        Initialize the orchestrator
+        
+        Args:
+            fetcher: Live fetcher whose clients, rate limiters and result files are used
+                (one is created, and closed after each run, when omitted)
+            hunter_workers: Concurrent Hunter.io requests
+            scrape_workers: Concurrent scraping service requests (defaults to the service's concurrency)
+            progress_interval: Seconds between progress lines (0 disables the display)
+            progress_stream: Where progress lines are written (defaults to stderr)
+        """
+        self.fetcher = fetcher or LiveLinkedInFetcher()
+        self._owns_fetcher = fetcher is None
+        self.hunter_workers = hunter_workers
+        self.scrape_workers = scrape_workers or self.fetcher.scrape_client.max_concurrency
+        self.progress_interval = progress_interval
+        self.progress_stream = progress_stream or sys.stderr
+        self.progress: Optional[BatchProgress] = None
+    
+    def run(self, college_names: List[str], limit: int = 50, methods: List[str] = None,
+            on_college_done: Callable[[str, List[Dict[str, Any]]], None] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Crawl a batch of colleges
+        
+        Args:
+            college_names: Colleges to crawl
+            limit: Maximum number of students per college
+            methods: List of methods to use ['hunter', 'search', 'both']
+            on_college_done: Called with (college name, students) as each college completes
+        
+        Returns:
+            Dictionary mapping college names to their student profiles
+        """
+        if methods is None:
+            methods = ['both']
+        
+        college_names = list(dict.fromkeys(college_names))
+        logger.info(f"Starting batch crawl of {len(college_names)} colleges, {limit} students each")
+        
+        self.progress = BatchProgress(len(college_names))
+        self._queues = {'hunter': FairQueue(), 'scrape': FairQueue()}
+        self._on_college_done = on_college_done
+        self._results: Dict[str, List[Dict[str, Any]]] = {}
+        self._remaining = len(college_names)
+        self._state_lock = threading.Lock()
+        self._all_done = threading.Event()
+        
+        jobs = [CollegeJob(college, limit, methods) for college in college_names]
+        # Seed tasks interleaved so the first requests already cover every college
+        for job in jobs:
+            self._seed(job)
+        if not college_names:
+            self._all_done.set()
+        
+        workers = ([threading.Thread(target=self._worker, args=('hunter',), daemon=True)
+                    for _ in range(self.hunter_workers)] +
+                   [threading.Thread(target=self._worker, args=('scrape',), daemon=True)
+                    for _ in range(self.scrape_workers)])
+        for worker in workers:
+            worker.start()
+        
+        try:
+            while not self._all_done.wait(self.progress_interval or None):
+                self._show_progress()
+        finally:
+            for work_queue in self._queues.values():
+                work_queue.close()
+            for worker in workers:
+                worker.join()
+        
+        self._show_progress()
+        self.fetcher._log_usage()
+        if self._owns_fetcher:
+            self.fetcher.close()
+        logger.info(f"Batch finished: {self.progress.students} students from {len(college_names)} colleges")
+        return {college: self._results.get(college, []) for college in college_names}
+    
+    def _seed(self, job: CollegeJob):
+        """Queue the initial Hunter domain lookups and search queries for a college"""
+        job.started_at = time.monotonic()
+        # Accepted profiles are appended here as they arrive, so the output can be tailed mid-batch
+        job.stream = self.fetcher.open_results_stream(job.college_name)
+        
+        if 'hunter' in job.methods or 'both' in job.methods:
+            for domain in self.fetcher.college_domains(job.college_name):
+                self._schedule(job, 'hunter', self._run_hunter_domain, domain)
+        
+        if 'search' in job.methods or 'both' in job.methods:
+            for query in self.fetcher._search_queries(job.college_name):
+                self._schedule(job, 'scrape', self._run_search_page, query, 0)
+        
+        if not job.pending:
+            self._finish(job)
+    
+    def _schedule(self, job: CollegeJob, provider: str, handler: Callable, *args):
+        """Add a task to a provider's queue, counting it against the college"""
+        with job.lock:
+            job.pending += 1
+        self.progress.scheduled()
+        self._queues[provider].put(job.college_name, (job, handler, args))
+    
+    def _worker(self, provider: str):
+        """Drain one provider's queue until the batch is finished"""
+        work_queue = self._queues[provider]
+        while True:
+            task = work_queue.get()
+            if task is None:
+                return
+            
+            job, handler, args = task
+            try:
+                # Skip work for colleges that already have enough students
+                if not job.full:
+                    handler(job, *args)
+            except Exception as e:
+                logger.error(f"Task failed for {job.college_name}: {e}")
+            finally:
+                self.progress.task_done()
+                with job.lock:
+                    job.pending -= 1
+                    finished = job.pending == 0
+                if finished:
+                    self._finish(job)
+    
+    def _run_hunter_domain(self, job: CollegeJob, domain: str):
+        with job.lock:
+            if job.hunter_found >= job.phase_limit:
+                return
+        
+        domain_profiles = self.fetcher._hunter_domain_profiles(domain, job.phase_limit)
+        with job.lock:
+            job.hunter_found += len(domain_profiles)
+        
+        for profile in domain_profiles:
+            if profile.get('linkedin_url'):
+                self._schedule(job, 'scrape', self._run_hunter_enrich, profile, domain)
+            else:
+                # Nothing to scrape, so tag it here rather than spend a scrape slot
+                self._add_student(job, self.fetcher._enrich_hunter_profile(profile, job.college_name, domain))
+    
+    def _run_hunter_enrich(self, job: CollegeJob, profile: Dict[str, Any], domain: str):
+        self._add_student(job, self.fetcher._enrich_hunter_profile(profile, job.college_name, domain))
+    
+    def _run_search_page(self, job: CollegeJob, query: str, page: int):
+        with job.lock:
+            if len(job.seen_urls) >= job.phase_limit:
+                return
+        
+        planner = self.fetcher.query_planner
+        urls = planner.page(query, page)
+        
+        new_urls = []
+        with job.lock:
+            for url in urls:
+                key = canonical_profile_url(url)
+                if key not in job.seen_urls and len(job.seen_urls) < job.phase_limit:
+                    job.seen_urls.add(key)
+                    new_urls.append(url)
+            wants_more = len(job.seen_urls) < job.phase_limit
+        
+        for url in new_urls:
+            self._schedule(job, 'scrape', self._run_profile_scrape, url)
+        
+        # Follow a query onto its next page only while it keeps turning up new profiles
+        if wants_more and planner.worth_next_page(page, urls, len(new_urls)):
+            self._schedule(job, 'scrape', self._run_search_page, query, page + 1)
+    
+    def _run_profile_scrape(self, job: CollegeJob, url: str):
+        profile = self.fetcher._scrape_search_profile(url, job.college_name)
+        if profile:
+            self._add_student(job, profile)
+    
+    def _add_student(self, job: CollegeJob, profile: Dict[str, Any]):
+        """Keep a new profile while the college needs more; merge a repeat into the profile it repeats"""
+        with job.lock:
+            if job.identities.add(profile, accept_new=not job.full):
+                job.stream.write(profile)
+    
+    def _finish(self, job: CollegeJob):
+        """Save a completed college's results and signal when the whole batch is done"""
+        job.finished_at = time.monotonic()
+        students = job.students
+        
+        try:
+            students = self.fetcher._finish_stream(job.stream, job.identities)
+            logger.info(f"Finished {job.college_name}: {len(students)} students "
+                        f"in {job.finished_at - job.started_at:.1f}s")
+            with self.fetcher.telemetry.stage('save'):
+                self.fetcher._save_results(job.college_name, json_filename=job.stream.path)
+            if self._on_college_done:
+                self._on_college_done(job.college_name, students)
+        except Exception as e:
+            logger.error(f"Error saving results for {job.college_name}: {e}")
+        
+        self.progress.college_done(len(students))
+        
+        with self._state_lock:
+            self._results[job.college_name] = students
+            self._remaining -= 1
+            all_done = self._remaining == 0
+        if all_done:
+            self._all_done.set()
+    
+    def _show_progress(self):
+        if self.progress_interval and self.progress:
+            self.progress_stream.write(self.progress.render() + '\n')
+            self.progress_stream.flush()
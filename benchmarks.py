@@ -0,0 +1,1320 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmarks
+Measure fetcher performance against local stub providers - no API keys needed
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import logging
+
+from stub_providers import StubProviderServer
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+def _unthrottled():
+    """Rate limiter that never holds back requests to the local stub"""
+    from rate_limiter import RateLimiter
+    return RateLimiter('stub', rate=1e6, burst=1000000)
+
+def _profile_urls(count: int):
+    """Build a batch of distinct LinkedIn profile URLs"""
+    return [f"https://www.linkedin.com/in/student-{i+1}" for i in range(count)]
+
+def benchmark_scrape(profiles: int = 40, latency: float = 0.25, workers: int = 8):
+    """Compare sequential and concurrent ScrapeAPIClient batches"""
+    from scrape_api_client import ScrapeAPIClient
+    
+    urls = _profile_urls(profiles)
+    
+    with StubProviderServer(latency=latency) as server:
+        client = ScrapeAPIClient(api_key='stub', base_url=server.url, max_concurrency=workers,
+                                 rate_limiter=_unthrottled())
+        
+        start = time.perf_counter()
+        sequential = client.scrape_multiple_profiles(urls)
+        sequential_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        results = client.scrape_profiles_concurrently(urls, max_workers=workers)
+        concurrent_time = time.perf_counter() - start
+    
+    concurrent = [result['profile'] for result in results if result['profile']]
+    in_order = [p['linkedin_url'] for p in concurrent] == [p['linkedin_url'] for p in sequential]
+    
+    print(f"Scrape benchmark: {profiles} profiles, {latency:.2f}s stub latency")
+    print(f"  Sequential:           {sequential_time:7.2f}s  ({len(sequential)} profiles)")
+    print(f"  Concurrent ({workers:2d} workers): {concurrent_time:7.2f}s  ({len(concurrent)} profiles)")
+    print(f"  Speedup:              {sequential_time / concurrent_time:7.2f}x")
+    print(f"  Same results, same order: {in_order}")
+
+def benchmark_transport(count: int = 200):
+    """Compare one-connection-per-call requests.get with the pooled shared transport"""
+    import requests
+    from http_transport import PooledTransport
+    
+    with StubProviderServer() as server:
+        params = {'api_key': 'stub', 'url': 'https://www.linkedin.com/in/student-1'}
+        
+        start = time.perf_counter()
+        for _ in range(count):
+            requests.get(server.url, params=params, timeout=30).raise_for_status()
+        unpooled_time = time.perf_counter() - start
+        
+        transport = PooledTransport()
+        start = time.perf_counter()
+        for _ in range(count):
+            transport.get(server.url, params=params, timeout=30).raise_for_status()
+        pooled_time = time.perf_counter() - start
+        stats = transport.connection_stats()
+        transport.close()
+    
+    print(f"Transport benchmark: {count} sequential requests")
+    print(f"  requests.get:      {unpooled_time:7.3f}s  ({count} connections opened)")
+    print(f"  PooledTransport:   {pooled_time:7.3f}s  ({stats['connections_opened']} connections opened)")
+    print(f"  Connection reuse:  {stats['reused_requests']}/{stats['requests']} requests ({stats['reuse_ratio']:.1%})")
+    print(f"  Speedup:           {unpooled_time / pooled_time:7.2f}x")
+
+def benchmark_throttle(clients: int = 8, retry_after: float = 1.0, rate: float = 5.0):
+    """Throttle many concurrent requests at once and check the shared limiter waits about one Retry-After"""
+    import threading
+    import requests
+    from rate_limiter import RateLimiter
+    
+    limiter = RateLimiter('stub', rate=rate, burst=clients)
+    lock = threading.Lock()
+    in_flight = threading.Barrier(clients)
+    sent = []
+    
+    def request(throttled):
+        # Every client's first attempt is answered with a 429 once all of them are in flight; retries succeed
+        response = requests.Response()
+        with lock:
+            sent.append(time.perf_counter())
+        response.status_code = 200 if throttled else 429
+        if not throttled:
+            in_flight.wait()
+            response.headers['Retry-After'] = f"{retry_after:g}"
+            throttled.append(True)
+        return response
+    
+    def client():
+        limiter.send(request, [])
+    
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    retries = sorted(sent)[clients:]
+    first_retry = retries[0] - start
+    # Retries resume after one Retry-After and are then paced at no less than the once-halved rate
+    expected = retry_after + (clients - 1) / (rate / 2)
+    
+    print(f"Throttle benchmark: {clients} concurrent requests answered 429 with Retry-After {retry_after:g}s, "
+          f"limit {rate:g} req/s")
+    print(f"  First retry after:  {first_retry:6.2f}s")
+    print(f"  All retries done:   {elapsed:6.2f}s (at most {expected:.2f}s expected)")
+    print(f"  Rate afterwards:    {limiter.bucket.rate:6.2f} req/s")
+    print(f"  Throttled requests: {limiter.throttled}")
+    return first_retry < retry_after * 1.25 and elapsed < expected + 0.5 and limiter.throttled == clients
+
+def _synthetic_students(count: int, seed: int = 7):
+    """Deterministic student dictionaries shaped like the fetchers' output"""
+    return list(_iter_synthetic_students(count, seed))
+
+def _iter_synthetic_students(count: int, seed: int = 7):
+    """Generate _synthetic_students lazily, one dictionary at a time"""
+    import random
+    
+    rng = random.Random(seed)
+    colleges = ["HKB College of Engineering", "RV College of Engineering", "BMS College of Engineering",
+                "PES University", "MS Ramaiah Institute of Technology"]
+    degrees = ["B.E. Computer Science", "B.E. Mechanical Engineering", "B.E. Electronics", "MBA", "M.Tech"]
+    locations = ["Bangalore, India", "Mysore, India", "Chennai, India", "Hyderabad, India"]
+    skills = ["Python", "Java", "SQL", "AutoCAD", "MATLAB", "React", "Machine Learning", "Embedded C"]
+    
+    for i in range(count):
+        yield {
+            'name': f"Student {i}",
+            'college': rng.choice(colleges),
+            'degree': rng.choice(degrees),
+            'graduation_year': str(rng.randint(2015, 2027)),
+            'location': rng.choice(locations),
+            'headline': f"Engineer at Company {rng.randint(1, 500)}",
+            'profile_url': f"https://www.linkedin.com/in/student-{i}",
+            'connections': rng.randint(10, 500),
+            'skills': rng.sample(skills, 3),
+            'experience': [{'title': 'Intern', 'company': f"Company {rng.randint(1, 500)}", 'duration': '6 months'}],
+            'method': rng.choice(['Hunter.io', 'Google Search + Scraping'])
+        }
+
+def _parse_profile_reference(html_content, linkedin_url):
+    """
+    Original select_one-per-selector extraction over html.parser
+    
+    The pre-ProfileParser scrape path, kept here as the reference the
+    parse benchmark checks ProfileParser output against.
+    
+    Args:
+        html_content: HTML content of the LinkedIn profile
+        linkedin_url: Original LinkedIn URL
+    
+    Returns:
+        Dictionary containing parsed profile data
+    """
+    from bs4 import BeautifulSoup
+    
+    try:
+        soup = BeautifulSoup(html_content, 'html.parser')
+        
+        profile_data = {
+            'linkedin_url': linkedin_url,
+            'name': '',
+            'headline': '',
+            'location': '',
+            'about': '',
+            'experience': [],
+            'education': [],
+            'skills': [],
+            'connections': '',
+            'source': 'Scrape API',
+            'raw_data_available': True
+        }
+        
+        # Extract name
+        name_selectors = [
+            'h1[class*="text-heading-xlarge"]',
+            '.pv-text-details__left-panel h1',
+            'h1.text-heading-xlarge',
+            '.top-card-layout__title',
+            '.pv-top-card--list li:first-child h1'
+        ]
+        
+        for selector in name_selectors:
+            name_elem = soup.select_one(selector)
+            if name_elem:
+                profile_data['name'] = name_elem.get_text(strip=True)
+                break
+        
+        # Extract headline
+        headline_selectors = [
+            'div[class*="text-body-medium break-words"]',
+            '.pv-text-details__left-panel .text-body-medium',
+            '.top-card-layout__headline',
+            '.pv-top-card--list-bullet .text-body-medium'
+        ]
+        
+        for selector in headline_selectors:
+            headline_elem = soup.select_one(selector)
+            if headline_elem:
+                profile_data['headline'] = headline_elem.get_text(strip=True)
+                break
+        
+        # Extract location
+        location_selectors = [
+            'span[class*="text-body-small inline t-black--light break-words"]',
+            '.pv-text-details__left-panel .text-body-small',
+            '.top-card-layout__first-subline',
+            '.pv-top-card__location'
+        ]
+        
+        for selector in location_selectors:
+            location_elem = soup.select_one(selector)
+            if location_elem:
+                location_text = location_elem.get_text(strip=True)
+                # Clean up location text
+                if 'connections' not in location_text.lower():
+                    profile_data['location'] = location_text
+                    break
+        
+        # Extract about section
+        about_selectors = [
+            '#about + * .pv-shared-text-with-see-more',
+            '.pv-about__summary-text',
+            'section[data-section="summary"] .pv-shared-text-with-see-more'
+        ]
+        
+        for selector in about_selectors:
+            about_elem = soup.select_one(selector)
+            if about_elem:
+                profile_data['about'] = about_elem.get_text(strip=True)
+                break
+        
+        # Extract experience
+        experience_items = soup.select('.pv-entity__summary-info, .pv-profile-section__list-item')
+        for item in experience_items[:5]:  # Limit to first 5 experiences
+            title_elem = item.select_one('h3, .pv-entity__summary-info-v2 h3')
+            company_elem = item.select_one('.pv-entity__secondary-title, .pv-entity__summary-info-v2 .text-body-small')
+            
+            if title_elem:
+                experience = {
+                    'title': title_elem.get_text(strip=True),
+                    'company': company_elem.get_text(strip=True) if company_elem else '',
+                    'duration': ''
+                }
+                
+                # Try to extract duration
+                duration_elem = item.select_one('.pv-entity__bullet-item, .pv-entity__date-range')
+                if duration_elem:
+                    experience['duration'] = duration_elem.get_text(strip=True)
+                
+                profile_data['experience'].append(experience)
+        
+        # Extract education
+        education_items = soup.select('.pv-profile-section.education .pv-entity__summary-info')
+        for item in education_items:
+            school_elem = item.select_one('h3')
+            degree_elem = item.select_one('.pv-entity__degree-name .pv-entity__comma-item')
+            
+            if school_elem:
+                education = {
+                    'school': school_elem.get_text(strip=True),
+                    'degree': degree_elem.get_text(strip=True) if degree_elem else '',
+                    'field_of_study': '',
+                    'dates': ''
+                }
+                
+                # Try to extract field of study
+                field_elem = item.select_one('.pv-entity__fos .pv-entity__comma-item')
+                if field_elem:
+                    education['field_of_study'] = field_elem.get_text(strip=True)
+                
+                # Try to extract dates
+                dates_elem = item.select_one('.pv-entity__dates .pv-entity__comma-item')
+                if dates_elem:
+                    education['dates'] = dates_elem.get_text(strip=True)
+                
+                profile_data['education'].append(education)
+        
+        # Extract skills
+        skill_items = soup.select('.pv-skill-category-entity__name-text, .pv-skill-entity__skill-name')
+        for item in skill_items[:10]:  # Limit to first 10 skills
+            skill_text = item.get_text(strip=True)
+            if skill_text and skill_text not in profile_data['skills']:
+                profile_data['skills'].append(skill_text)
+        
+        # Extract connections count
+        connections_elem = soup.select_one('.t-bold .t-black, .pv-top-card--list-bullet .t-bold')
+        if connections_elem:
+            connections_text = connections_elem.get_text(strip=True)
+            if 'connection' in connections_text.lower():
+                profile_data['connections'] = connections_text
+        
+        # Clean up empty fields
+        profile_data = {k: v for k, v in profile_data.items() if v}
+        
+        logger.info(f"Successfully parsed LinkedIn profile for: {profile_data.get('name', 'Unknown')}")
+        return profile_data
+    
+    except Exception as e:
+        logger.error(f"Error parsing LinkedIn HTML: {e}")
+        return {}
+
+def _timed(func, repeats: int) -> float:
+    """Best-of-N wall time of func() in seconds"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_parse(repeats: int = 5):
+    """Time the parse-once ProfileParser against the original extraction on saved profile pages"""
+    from profile_parser import ProfileParser, PARSER_BACKENDS, available_backend
+    
+    fixtures = sorted(glob.glob(os.path.join(FIXTURES_DIR, 'profiles', '*.html')))
+    backends = [backend for backend in PARSER_BACKENDS if available_backend(backend) == backend]
+    parsers = {backend: ProfileParser(backend) for backend in backends}
+    all_identical = True
+    
+    print(f"Parse benchmark: {len(fixtures)} fixtures, best of {repeats}")
+    print(f"  {'fixture':<24} {'size':>8} {'reference':>10} " + ' '.join(f"{b:>12}" for b in backends))
+    
+    for path in fixtures:
+        with open(path, encoding='utf-8') as f:
+            html_content = f.read()
+        url = f"https://www.linkedin.com/in/{os.path.basename(path)[:-5]}"
+        
+        expected = _parse_profile_reference(html_content, url)
+        reference_time = _timed(lambda: _parse_profile_reference(html_content, url), repeats)
+        
+        cells = []
+        for backend, parser in parsers.items():
+            identical = parser.parse(html_content, url) == expected
+            all_identical = all_identical and identical
+            elapsed = _timed(lambda: parser.parse(html_content, url), repeats)
+            cells.append(f"{elapsed * 1000:8.1f}ms{'' if identical else ' !='}")
+        
+        print(f"  {os.path.basename(path):<24} {len(html_content) // 1024:>6}KB {reference_time * 1000:8.1f}ms " + ' '.join(f"{c:>12}" for c in cells))
+    
+    print(f"  Output identical to reference: {all_identical}")
+    return all_identical
+
+def benchmark_pipeline(profiles: int = 60, latency: float = 0.1, fetch_workers: int = 8, parse_workers: int = None):
+    """Compare in-thread parsing with the fetch/parse process-pool pipeline on large rendered pages"""
+    import tracemalloc
+    from scrape_api_client import ScrapeAPIClient
+    from scrape_pipeline import ScrapePipeline
+    
+    with open(os.path.join(FIXTURES_DIR, 'profiles', 'large_rendered.html'), encoding='utf-8') as f:
+        page = f.read()
+    urls = _profile_urls(profiles)
+    
+    with StubProviderServer(latency=latency, profile_html=page) as server:
+        client = ScrapeAPIClient(api_key='stub', base_url=server.url, max_concurrency=fetch_workers,
+                                 rate_limiter=_unthrottled())
+        
+        start = time.perf_counter()
+        threaded = client.scrape_profiles_concurrently(urls, max_workers=fetch_workers)
+        threaded_time = time.perf_counter() - start
+        
+        pipeline = ScrapePipeline(client, fetch_workers=fetch_workers, parse_workers=parse_workers)
+        tracemalloc.start()
+        start = time.perf_counter()
+        piped = pipeline.scrape_all(urls)
+        pipeline_time = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    identical = [r['profile'] for r in threaded] == [r['profile'] for r in piped]
+    
+    print(f"Pipeline benchmark: {profiles} profiles of {len(page) // 1024}KB, {latency:.2f}s stub latency")
+    print(f"  Threads, parse in fetch thread: {threaded_time:7.2f}s")
+    print(f"  Fetch threads + {pipeline.parse_workers} parser processes: {pipeline_time:7.2f}s  "
+          f"(queue bound {pipeline.queue_size}, peak traced memory {peak / 1024 / 1024:.1f}MB)")
+    print(f"  Speedup: {threaded_time / pipeline_time:.2f}x")
+    print(f"  Same results: {identical}")
+
+def _save_row_by_row(data, db_path: str):
+    """save_to_database as it was before bulk loading: one INSERT per student, no unique key"""
+    import json
+    import sqlite3
+    
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, college TEXT, degree TEXT,
+            graduation_year TEXT, location TEXT, headline TEXT, profile_url TEXT, connections INTEGER,
+            skills TEXT, experience TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    for student in data:
+        conn.execute('''
+            INSERT INTO students (name, college, degree, graduation_year, location,
+                                  headline, profile_url, connections, skills, experience)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (student.get('name'), student.get('college'), student.get('degree'), student.get('graduation_year'),
+              student.get('location'), student.get('headline'), student.get('profile_url'), student.get('connections'),
+              json.dumps(student.get('skills', [])), json.dumps(student.get('experience', []))))
+    conn.commit()
+    count = conn.execute('SELECT COUNT(*) FROM students').fetchone()[0]
+    conn.close()
+    return count
+
+def benchmark_database(count: int = 100000):
+    """Compare row-by-row inserts with the bulk upsert path of StudentDataProcessor.save_to_database"""
+    import sqlite3
+    import tempfile
+    from data_processor import StudentDataProcessor
+    
+    students = _synthetic_students(count)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        _save_row_by_row(students, os.path.join(tmp, 'legacy.db'))
+        legacy_rows = _save_row_by_row(students, os.path.join(tmp, 'legacy.db'))
+        legacy_time = time.perf_counter() - start
+        
+        processor = StudentDataProcessor()
+        processor.data_directory = tmp
+        start = time.perf_counter()
+        processor.save_to_database(students, 'bulk.db')
+        first_load = time.perf_counter() - start
+        start = time.perf_counter()
+        processor.save_to_database(students, 'bulk.db')
+        repeat_load = time.perf_counter() - start
+        
+        # Students without a profile URL are keyed by email, or by name and college
+        urlless = [{'name': 'No Url', 'college': 'HKBK College', 'email': 'no.url@hkbk.edu.in'},
+                   {'name': 'No Url', 'college': 'HKBK College', 'profile_url': ''},
+                   {'name': 'No Url', 'college': 'Other College'}]
+        processor.save_to_database(urlless, 'urlless.db')
+        processor.save_to_database(urlless, 'urlless.db')
+        processor.close()
+        
+        conn = sqlite3.connect(os.path.join(tmp, 'bulk.db'))
+        bulk_rows = conn.execute('SELECT COUNT(*) FROM students').fetchone()[0]
+        conn.close()
+        conn = sqlite3.connect(os.path.join(tmp, 'urlless.db'))
+        urlless_rows = conn.execute('SELECT COUNT(*) FROM students').fetchone()[0]
+        conn.close()
+    
+    print(f"Database benchmark: {count} students, loaded twice")
+    print(f"  Row-by-row inserts: {legacy_time:7.2f}s  ({legacy_rows} rows after two loads, no indexes)")
+    print(f"  Bulk upsert:        {first_load + repeat_load:7.2f}s  ({bulk_rows} rows after two loads, "
+          f"unique key + college/year indexes; first {first_load:.2f}s, repeat {repeat_load:.2f}s)")
+    print(f"  Speedup:            {legacy_time / (first_load + repeat_load):7.2f}x")
+    print(f"  Idempotent: {bulk_rows == count} (students without a URL: {urlless_rows == len(urlless)})")
+    return bulk_rows == count and urlless_rows == len(urlless)
+
+def benchmark_export(count: int = 100000):
+    """Compare peak memory of building a list for json.dump with streaming NDJSON export and reading"""
+    import json
+    import tempfile
+    import tracemalloc
+    from json_stream import write_ndjson, read_ndjson
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        tracemalloc.start()
+        start = time.perf_counter()
+        with open(os.path.join(tmp, 'students.json'), 'w', encoding='utf-8') as f:
+            json.dump(_synthetic_students(count), f, indent=2, ensure_ascii=False, default=str)
+        list_time = time.perf_counter() - start
+        _, list_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        path = os.path.join(tmp, 'students.jsonl')
+        tracemalloc.start()
+        start = time.perf_counter()
+        written = write_ndjson(path, _iter_synthetic_students(count))
+        stream_time = time.perf_counter() - start
+        _, stream_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        tracemalloc.start()
+        start = time.perf_counter()
+        read_back = sum(1 for _ in read_ndjson(path))
+        read_time = time.perf_counter() - start
+        _, read_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    mb = 1024 * 1024
+    print(f"Export benchmark: {count} students")
+    print(f"  list + json.dump(indent=2): {list_time:6.2f}s  peak {list_peak / mb:7.1f}MB")
+    print(f"  NDJSON writer (generator):  {stream_time:6.2f}s  peak {stream_peak / mb:7.1f}MB  ({written} records)")
+    print(f"  NDJSON reader:              {read_time:6.2f}s  peak {read_peak / mb:7.1f}MB  ({read_back} records)")
+
+def benchmark_records(count: int = 100000):
+    """Compare the memory held by parsed student dictionaries with slotted StudentProfile records"""
+    import json
+    import tracemalloc
+    from student_record import StudentProfile
+    
+    # Parse from JSON so every dictionary owns its own strings, as after read_ndjson
+    lines = [json.dumps(student) for student in _iter_synthetic_students(count)]
+    
+    tracemalloc.start()
+    dicts = [json.loads(line) for line in lines]
+    dict_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    records = [StudentProfile.from_dict(json.loads(line)) for line in lines]
+    record_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    from_time = _timed(lambda: [StudentProfile.from_dict(student) for student in dicts], 1)
+    start = time.perf_counter()
+    round_trip = [record.to_dict() for record in records]
+    to_time = time.perf_counter() - start
+    consistent = all(StudentProfile.from_dict(d) == r for d, r in zip(round_trip[:1000], records))
+    
+    mb = 1024 * 1024
+    print(f"Record benchmark: {count} students held in memory")
+    print(f"  dictionaries:         {dict_bytes / mb:7.1f}MB  ({dict_bytes / count:5.0f} bytes/student)")
+    print(f"  StudentProfile slots: {record_bytes / mb:7.1f}MB  ({record_bytes / count:5.0f} bytes/student)")
+    print(f"  from_dict {from_time:.2f}s, to_dict {to_time:.2f}s")
+    print(f"  Round trip consistent: {consistent}")
+    del dicts
+    return consistent
+
+def _duplicated_students(count: int, seed: int = 11):
+    """Synthetic crawl where about a third of the people also appear as URL, Hunter or initial-name variants"""
+    import random
+    
+    rng = random.Random(seed)
+    first_names = ["Priya", "Rahul", "Ananya", "Vikram", "Sneha", "Arjun", "Kavya", "Rohan", "Divya", "Karthik",
+                   "Meera", "Aditya", "Pooja", "Siddharth", "Lakshmi", "Nikhil", "Shreya", "Varun", "Isha", "Manoj"]
+    last_names = ["Sharma", "Rao", "Iyer", "Reddy", "Nair", "Gupta", "Menon", "Kumar", "Hegde", "Patil",
+                  "Shetty", "Joshi", "Pillai", "Bhat", "Das", "Kulkarni", "Verma", "Naidu", "Kamath", "Gowda"]
+    
+    records = []
+    for person, student in enumerate(_iter_synthetic_students(count, seed)):
+        first, last = rng.choice(first_names), f"{rng.choice(last_names)}{person}"
+        slug = f"{first}-{last}".lower()
+        student.update(name=f"{first} {last}", profile_url=f"https://www.linkedin.com/in/{slug}",
+                       person=person, data_quality='high')
+        records.append(student)
+        
+        variant = rng.random()
+        if variant < 0.1:
+            records.append({'name': f"{first} {last}", 'college': student['college'], 'person': person,
+                            'linkedin_url': f"http://in.linkedin.com/in/{slug.upper()}/?trk=search"})
+        elif variant < 0.2:
+            records.append({'first_name': first, 'last_name': last, 'college': student['college'], 'person': person,
+                            'email': f"{first}.{last}@example.edu".lower(), 'method': 'Hunter.io', 'data_quality': 'low'})
+        elif variant < 0.3:
+            records.append({'name': f"{first[0]}. {last}", 'college': student['college'], 'person': person,
+                            'skills': ['Leadership'], 'method': 'Google Search + Scraping'})
+    rng.shuffle(records)
+    return records
+
+def benchmark_dedup(count: int = 100000):
+    """Measure fuzzy deduplication throughput and accuracy on synthetic duplicates, and its scaling"""
+    from dedup import deduplicate, IdentityIndex
+    
+    def run(size: int):
+        records = _duplicated_students(size)
+        start = time.perf_counter()
+        unique = deduplicate(records)
+        elapsed = time.perf_counter() - start
+        people = len({record['person'] for record in records})
+        return len(records), people, len(unique), elapsed
+    
+    quarter = run(count // 4)
+    total, people, unique, elapsed = run(count)
+    
+    print(f"Dedup benchmark: {count} people")
+    print(f"  {total} profiles -> {unique} merged ({people} actual people, "
+          f"{unique - people:+d} vs truth)")
+    print(f"  {elapsed:.2f}s ({total / elapsed:,.0f} profiles/s)")
+    print(f"  Scaling: {quarter[0]} profiles in {quarter[3]:.2f}s -> {total} in {elapsed:.2f}s "
+          f"({elapsed / quarter[3]:.1f}x time for {total / quarter[0]:.1f}x data)")
+    
+    # Same name at the same college but different emails or URLs: different people, in batch and streaming dedup
+    namesakes = [{'name': 'Rahul Kumar', 'college': 'HKB College of Engineering', 'email': 'rahul.kumar@x.edu'},
+                 {'name': 'Rahul Kumar', 'college': 'HKB College of Engineering', 'email': 'rahul.kumar2@x.edu'},
+                 {'name': 'Priya Rao', 'college': 'HKB College of Engineering',
+                  'profile_url': 'https://www.linkedin.com/in/priya-rao'},
+                 {'name': 'Priya Rao', 'college': 'HKB College of Engineering',
+                  'profile_url': 'https://www.linkedin.com/in/priya-rao-2'}]
+    identities = IdentityIndex()
+    streamed = sum(identities.add(dict(record)) for record in namesakes)
+    kept_apart = len(deduplicate(namesakes)) == len(namesakes) == streamed
+    print(f"  Namesakes with different emails/URLs kept apart: {'yes' if kept_apart else 'NO'}")
+    return unique == people and kept_apart
+
+def benchmark_excel(count: int = 20000):
+    """Compare peak memory of pandas' in-memory Excel export with the streaming write-only workbook"""
+    import tempfile
+    import tracemalloc
+    import pandas as pd
+    from excel_export import write_excel
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        tracemalloc.start()
+        start = time.perf_counter()
+        df = pd.json_normalize(_synthetic_students(count))
+        df.to_excel(os.path.join(tmp, 'pandas.xlsx'), sheet_name='Students', index=False, engine='openpyxl')
+        pandas_time = time.perf_counter() - start
+        _, pandas_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del df
+        
+        tracemalloc.start()
+        start = time.perf_counter()
+        written = write_excel(os.path.join(tmp, 'streamed.xlsx'), _iter_synthetic_students(count))
+        stream_time = time.perf_counter() - start
+        _, stream_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    mb = 1024 * 1024
+    print(f"Excel benchmark: {count} students (timings include tracemalloc overhead)")
+    print(f"  pandas DataFrame.to_excel:   {pandas_time:6.2f}s  peak {pandas_peak / mb:7.1f}MB  (one sheet)")
+    print(f"  write-only streaming sheets: {stream_time:6.2f}s  peak {stream_peak / mb:7.1f}MB  ({written} students, 3 sheets)")
+
+def benchmark_search(limits=(2, 20, 100), results_per_query: int = 60, seed: int = 5):
+    """Compare the old fixed per-query split with the query planner on paid searches and URLs found"""
+    import random
+    import tempfile
+    from live_linkedin_fetcher import LiveLinkedInFetcher
+    from query_planner import QueryPlanner, SearchResultCache, SEARCH_PAGE_SIZE
+    
+    # Fake search engine: each query ranks its own overlapping sample of one college's students
+    rng = random.Random(seed)
+    population = _profile_urls(results_per_query * 3)
+    queries = LiveLinkedInFetcher._search_queries("HKB College of Engineering")
+    rankings = {query: rng.sample(population, results_per_query) for query in queries}
+    
+    def search(query: str, page: int):
+        start = page * SEARCH_PAGE_SIZE
+        return rankings[query][start:start + SEARCH_PAGE_SIZE]
+    
+    def old_scheme(limit: int):
+        # One first-page search per query for limit // len(queries) results, deduplicated afterwards
+        calls = 0
+        urls = []
+        for query in queries:
+            urls.extend(search(query, 0)[:limit // len(queries)])
+            calls += 1
+            if len(urls) >= limit:
+                break
+        return calls, len(set(urls))
+    
+    print(f"Search benchmark: {len(queries)} queries, {results_per_query} results each")
+    print(f"  {'limit':>5s}  {'old calls':>9s} {'old found':>9s}  {'planner calls':>13s} {'found':>5s}  {'cached rerun calls':>18s}")
+    with tempfile.TemporaryDirectory() as tmp:
+        ok = True
+        for limit in limits:
+            old_calls, old_found = old_scheme(limit)
+            cache = SearchResultCache(os.path.join(tmp, f"search-{limit}.db"))
+            runs = []
+            for _ in range(2):
+                planner = QueryPlanner(search, cache)
+                found = len(list(planner.discover(queries, limit)))
+                runs.append((planner.pages_fetched, found))
+            cache.close()
+            ok = ok and runs[0][1] == runs[1][1] == min(limit, len(population)) and runs[1][0] == 0
+            print(f"  {limit:5d}  {old_calls:9d} {old_found:9d}  {runs[0][0]:13d} {runs[0][1]:5d}  {runs[1][0]:18d}")
+    return ok
+
+def benchmark_hunter(emails: int = 1000, latency: float = 0.2, page_size: int = 100, workers: int = 4):
+    """Compare single-page and sequentially paged domain search with concurrent pages and the domain cache"""
+    import tempfile
+    from hunter_api_client import HunterAPIClient
+    from hunter_cache import DomainSearchCache
+    
+    domain = 'hkbk.edu.in'
+    
+    with StubProviderServer(latency=latency, domain_emails=emails) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        def client(workers: int, cache: DomainSearchCache = None):
+            return HunterAPIClient('stub', base_url=server.url, rate_limiter=_unthrottled(), cache=cache,
+                                   page_size=page_size, max_concurrency=workers)
+        
+        def run(hunter: HunterAPIClient):
+            start = time.perf_counter()
+            data = hunter.search_domain(domain, limit=emails)
+            return time.perf_counter() - start, len(data['data']['emails']), data['meta']['requests']
+        
+        start = time.perf_counter()
+        single = client(1)._domain_page(domain, 0, page_size)[0]
+        single_time = time.perf_counter() - start
+        
+        sequential = run(client(1))
+        concurrent = run(client(workers))
+        
+        cache = DomainSearchCache(os.path.join(tmp, 'hunter.db'))
+        cold = run(client(workers, cache))
+        warm = run(client(workers, cache))
+        cache.ttl = 0
+        revalidated = run(client(workers, cache))
+        cache.close()
+    
+    print(f"Hunter benchmark: {emails} addresses at one domain, {page_size} per page, {latency:.2f}s stub latency")
+    print(f"  {'Single request (old):':28s} {single_time:6.2f}s  {len(single):5d} emails  1 request")
+    for label, (seconds, found, sent) in (('Sequential pages', sequential), (f"Concurrent ({workers} workers)", concurrent),
+                                          ('Concurrent + cache (cold)', cold), ('Cached (fresh)', warm),
+                                          ('Cached (stale, ETag match)', revalidated)):
+        print(f"  {label + ':':28s} {seconds:6.2f}s  {found:5d} emails  {sent} requests")
+    return all(found == emails for _, found, _ in (sequential, concurrent, cold, warm, revalidated))
+
+def benchmark_verify(addresses: int = 200, latency: float = 0.05, workers: int = 8):
+    """Compare a hand-written verify_email loop with the bulk verifier, cold and on a cached rerun"""
+    import tempfile
+    from hunter_api_client import HunterAPIClient
+    from email_verifier import BulkEmailVerifier, VerificationCache
+    
+    # A college list as collected: a quarter of the rows repeat an address in another spelling
+    unique = [f"{'bounce' if i % 10 == 0 else 'student'}{i}@hkbk.edu.in" for i in range(addresses)]
+    emails = unique + [f"  {email.upper()} " for email in unique[:addresses // 3]]
+    
+    with StubProviderServer(latency=latency) as server, tempfile.TemporaryDirectory() as tmp:
+        client = HunterAPIClient('stub', base_url=server.url, rate_limiter=_unthrottled())
+        
+        start = time.perf_counter()
+        looped = [client.verify_email(email) for email in emails]
+        loop_time = time.perf_counter() - start
+        
+        def run():
+            verifier = BulkEmailVerifier(client, cache, max_workers=workers)
+            start = time.perf_counter()
+            stats = verifier.verify_to_file(emails, os.path.join(tmp, 'verified.jsonl'))
+            return time.perf_counter() - start, stats
+        
+        cache = VerificationCache(os.path.join(tmp, 'verifications.db'))
+        cold_time, cold = run()
+        warm_time, warm = run()
+        statuses = cache.stats()['statuses']
+        cache.close()
+    
+    print(f"Verify benchmark: {len(emails)} rows, {addresses} unique addresses, {latency:.2f}s stub latency")
+    print(f"  {'verify_email loop:':28s} {loop_time:6.2f}s  {len(looped)} requests")
+    print(f"  {f'Bulk ({workers} workers, cold):':28s} {cold_time:6.2f}s  {cold['verified']} requests, "
+          f"{cold['duplicates']} duplicates skipped")
+    print(f"  {'Bulk rerun (cached):':28s} {warm_time:6.2f}s  {warm['verified']} requests, {warm['cached']} from cache")
+    print(f"  Statuses: {statuses}")
+    return cold['verified'] == addresses and warm['cached'] == addresses
+
+def _synthetic_colleges(count: int, seed: int = 3):
+    """Deterministic (name, domain, acronym) triples shaped like a national college list"""
+    import random
+    
+    rng = random.Random(seed)
+    syllables = ['ra', 'ma', 'vi', 'sha', 'kri', 'na', 'de', 'sa', 'ga', 'la', 'ti', 'pu', 'ja', 'ya', 'ba', 'su']
+    kinds = ['College of Engineering', 'Institute of Technology', 'University', 'College of Arts and Science',
+             'Institute of Management', 'Polytechnic College', 'College of Pharmacy']
+    seen = set()
+    colleges = []
+    while len(colleges) < count:
+        founder = ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).title()
+        place = ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 3))).title()
+        name = f"{founder} {place} {rng.choice(kinds)}"
+        if name in seen:
+            continue
+        seen.add(name)
+        acronym = ''.join(word[0] for word in name.split() if word not in ('of', 'and')).upper() + str(len(colleges))
+        colleges.append((name, f"{founder.lower()}{len(colleges)}.edu.in", acronym))
+    return colleges
+
+def benchmark_colleges(count: int = 40000, lookups: int = 2000):
+    """Compare the old linear substring scan with the indexed college registry at national scale"""
+    import random
+    from college_registry import College, CollegeRegistry
+    
+    colleges = _synthetic_colleges(count)
+    mapping = {name: [domain] for name, domain, _ in colleges}
+    
+    start = time.perf_counter()
+    registry = CollegeRegistry(College(name, [domain], [acronym]) for name, domain, acronym in colleges)
+    build_time = time.perf_counter() - start
+    
+    def linear_scan(college_name: str):
+        # The previous get_college_domains: exact key, then substring scan, then a guessed domain
+        if college_name in mapping:
+            return mapping[college_name]
+        college_lower = college_name.lower()
+        for name, domains in mapping.items():
+            if name.lower() in college_lower or college_lower in name.lower():
+                return domains
+        return [f"{college_name.lower().replace(' ', '')}.edu.in"]
+    
+    def typo(name: str) -> str:
+        founder = name.split()[0]
+        position = rng.randrange(1, len(founder))
+        return name.replace(founder, founder[:position] + 'x' + founder[position + 1:], 1)
+    
+    rng = random.Random(9)
+    sample = rng.sample(colleges, lookups)
+    queries = {
+        'exact name': [(name, domain) for name, domain, _ in sample],
+        'lowercase, abbreviated': [(name.lower().replace('Institute', 'Inst.').replace('institute', 'inst.'), domain)
+                                   for name, domain, _ in sample],
+        'acronym alias': [(acronym, domain) for _, domain, acronym in sample],
+        'one typo': [(typo(name), domain) for name, domain, _ in sample],
+        'unknown college': [(f"Zzyzx {i} College of Engineering", None) for i in range(lookups)],
+    }
+    
+    print(f"College benchmark: {count} colleges, registry built in {build_time:.2f}s")
+    print(f"  {'query kind':24s} {'scan us':>9s} {'scan ok':>8s} {'index us':>9s} {'index ok':>9s}")
+    ok = True
+    for kind, pairs in queries.items():
+        scan_pairs = pairs[:max(lookups // 20, 1)]    # The scan is far too slow to run on every query
+        start = time.perf_counter()
+        # An unknown college always gets a guessed domain from the scan, which counts as wrong
+        scan_correct = sum(linear_scan(query) == [domain] for query, domain in scan_pairs)
+        scan_time = (time.perf_counter() - start) / len(scan_pairs)
+        
+        start = time.perf_counter()
+        index_correct = 0
+        for query, domain in pairs:
+            college = registry.resolve(query)
+            index_correct += (college.domains if college else []) == ([domain] if domain else [])
+        index_time = (time.perf_counter() - start) / len(pairs)
+        
+        ok = ok and index_correct >= 0.95 * len(pairs)
+        print(f"  {kind:24s} {scan_time * 1e6:9.0f} {scan_correct / len(scan_pairs):8.0%} "
+              f"{index_time * 1e6:9.0f} {index_correct / len(pairs):9.0%}")
+    return ok
+
+def benchmark_telemetry(profiles: int = 200, latency: float = 0.02, workers: int = 8, observations: int = 200000):
+    """Measure telemetry overhead and check its counts and percentiles against a stub-server crawl"""
+    import random
+    from scrape_api_client import ScrapeAPIClient
+    from telemetry import Telemetry, LatencyHistogram
+    
+    # Percentile error on a long-tailed latency distribution
+    rng = random.Random(13)
+    samples = [rng.lognormvariate(-1.5, 0.8) for _ in range(observations)]
+    histogram = LatencyHistogram()
+    start = time.perf_counter()
+    for seconds in samples:
+        histogram.observe(seconds)
+    observe_time = (time.perf_counter() - start) / observations
+    samples.sort()
+    errors = {q: abs(histogram.quantile(q) / samples[int(q * observations)] - 1) for q in (0.5, 0.95, 0.99)}
+    
+    # A real crawl: every profile is one request, and the telemetry must agree
+    urls = _profile_urls(profiles)
+    telemetry = Telemetry()
+    with StubProviderServer(latency=latency) as server:
+        client = ScrapeAPIClient(api_key='stub', base_url=server.url, max_concurrency=workers,
+                                 rate_limiter=_unthrottled(), telemetry=telemetry)
+        start = time.perf_counter()
+        results = client.scrape_profiles_concurrently(urls, max_workers=workers)
+        crawl_time = time.perf_counter() - start
+    
+    counted = telemetry.request_count('scrapingbee', 'profile')
+    stages = telemetry.snapshot()['stages']
+    
+    print(f"Telemetry benchmark: {observations} histogram observations, {profiles} stub scrapes "
+          f"({latency:.2f}s latency, {workers} workers)")
+    print(f"  Cost per observation:   {observe_time * 1e6:6.2f}us")
+    print(f"  Percentile error:       " + '  '.join(f"p{int(q * 100)} {error:.1%}" for q, error in errors.items()))
+    print(f"  Crawl time:             {crawl_time:6.2f}s")
+    print(f"  Requests sent/counted:  {client.requests_sent}/{counted}")
+    print()
+    for line in telemetry.report_lines():
+        print(f"  {line}")
+    
+    ok = counted == client.requests_sent == len(results) and stages['fetch']['count'] == profiles
+    return ok and all(error < 0.15 for error in errors.values())
+
+def benchmark_e2e(colleges: int = 4, limit: int = 40, latency: float = 0.05, jitter: float = 0.05,
+                  error_rate: float = 0.02, throttle_every: int = 100, throttle_burst: int = 3,
+                  recordings: str = None, seed: int = 1):
+    """Drive whole crawls (discovery, scraping, parsing, exports) against stub providers with injected faults"""
+    import tempfile
+    import tracemalloc
+    from live_linkedin_fetcher import LiveLinkedInFetcher
+    from batch_orchestrator import BatchOrchestrator
+    from hunter_api_client import get_college_registry
+    from college_registry import College
+    
+    names = [f"Stub College {i + 1}" for i in range(colleges)]
+    registry = get_college_registry()
+    for i, name in enumerate(names):
+        registry.add(College(name, [f"stub{i + 1}.edu.in"]))
+    
+    def crawl(label: str, run):
+        # A fresh server per scenario so both see the same seeded faults
+        with StubProviderServer(latency=latency, recordings=recordings, latency_jitter=jitter,
+                                error_rate=error_rate, throttle_every=throttle_every,
+                                throttle_burst=throttle_burst, retry_after=0.2, seed=seed) as server, \
+                tempfile.TemporaryDirectory() as tmp:
+            fetcher = LiveLinkedInFetcher('stub', 'stub', use_cache=False,
+                                          rate_limits={'hunter': (1000, 100), 'scrapingbee': (1000, 100)},
+                                          hunter_base_url=server.url, scrape_base_url=server.url,
+                                          results_dir=tmp)
+            tracemalloc.start()
+            start = time.perf_counter()
+            students = run(fetcher)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            served = server.stats()
+        
+        snapshot = fetcher.telemetry.snapshot()
+        requests_made = sum(entry['requests'] for entry in snapshot['requests'])
+        retries = sum(limiter.retries for limiter in fetcher.rate_limiters.values())
+        save = snapshot['stages'].get('save', {}).get('sum', 0.0)
+        print(f"  {label}")
+        print(f"    {students} students in {elapsed:.2f}s ({students / elapsed:.1f}/s), "
+              f"{requests_made} requests ({requests_made / elapsed:.1f}/s), peak traced memory {peak / 1024 / 1024:.1f}MB")
+        print(f"    Injected: {served['throttled']} x 429, {served['errors']} x 503; client retries: {retries}; "
+              f"exports: {save:.2f}s")
+        for line in fetcher.telemetry.report_lines():
+            print(f"    {line}")
+        return students
+    
+    print(f"End-to-end benchmark: {colleges} colleges x {limit} students, {latency:.2f}s (+{jitter:.2f}s) latency, "
+          f"{error_rate:.0%} 503s, {throttle_burst} x 429 every {throttle_every} requests")
+    print(f"  Profiles replayed from: {recordings or 'built-in template'}")
+    single = crawl('Sequential fetch_college_students, 1 college',
+                   lambda fetcher: len(fetcher.fetch_college_students(names[0], limit=limit, methods=['both'])))
+    batch = crawl(f"BatchOrchestrator, {colleges} colleges",
+                  lambda fetcher: sum(len(students) for students in BatchOrchestrator(fetcher, progress_interval=0)
+                                      .run(names, limit=limit, methods=['both']).values()))
+    # Recorded pages repeat the same few people, so only template runs must fill every college
+    return recordings is not None or (single == limit and batch == colleges * limit)
+
+# Dependencies that must only load when the exporter or backend that needs them is used
+HEAVY_MODULES = ('pandas', 'numpy', 'selenium', 'openpyxl', 'pyarrow', 'bs4', 'requests')
+
+_STARTUP_PROBE = """
+import os, runpy, sys
+sys.argv = {argv!r}
+sys.path.insert(0, os.path.dirname(sys.argv[0]))
+try:
+    runpy.run_path(sys.argv[0], run_name={run_name!r})
+finally:
+    print('HEAVY:' + ','.join(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)
+"""
+
+def benchmark_startup(runs: int = 5, budget: float = 0.5):
+    """Time cold CLI invocations and check which heavy dependencies each one imports"""
+    import statistics
+    import subprocess
+    import tempfile
+    
+    here = os.path.dirname(os.path.abspath(__file__))
+    cli = os.path.join(here, 'run_student_fetcher.py')
+    # (label, argv, run name, heavy modules it may import; None = any, and no time budget)
+    cases = [
+        ('single (JSON)', [cli, 'single', 'HKB College of Engineering', '--limit', '5'], '__main__', ()),
+        ('multiple (JSON + SQLite)', [cli, 'multiple', 'HKB College of Engineering', 'RV College of Engineering'],
+         '__main__', ()),
+        ('--help', [cli, '--help'], '__main__', ()),
+        ('single --format csv', [cli, 'single', 'HKB College of Engineering', '--format', 'csv'], '__main__', None),
+        ('import live_linkedin_fetcher', [os.path.join(here, 'live_linkedin_fetcher.py')], 'live_linkedin_fetcher',
+         ('bs4', 'requests')),
+    ]
+    
+    def cold_start(code: str):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', code], cwd=tmp, capture_output=True, text=True)
+        return time.perf_counter() - start, result
+    
+    print(f"Startup benchmark: median of {runs} cold runs, {budget:.2f}s budget for commands without heavy imports")
+    print(f"  {'Command':30s} {'Median':>8s}  Heavy modules imported")
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        interpreter = statistics.median(cold_start('pass')[0] for _ in range(runs))
+        print(f"  {'python -c pass':30s} {interpreter:7.3f}s  -")
+        
+        for label, argv, run_name, allowed in cases:
+            code = _STARTUP_PROBE.format(argv=argv, run_name=run_name, heavy=HEAVY_MODULES)
+            runs_timed = [cold_start(code) for _ in range(runs)]
+            median = statistics.median(seconds for seconds, _ in runs_timed)
+            result = runs_timed[-1][1]
+            reported = [line[6:] for line in result.stderr.splitlines() if line.startswith('HEAVY:')]
+            loaded = [module for module in (reported[-1] if reported else '').split(',') if module]
+            
+            problems = []
+            if not reported or result.returncode != 0:
+                problems.append('failed')
+            if allowed is not None:
+                problems += [f"imports {module}" for module in loaded if module not in allowed]
+                if not allowed and median >= budget:
+                    problems.append('over budget')
+            ok = ok and not problems
+            print(f"  {label:30s} {median:7.3f}s  {', '.join(loaded) or '-'}"
+                  f"{'  <- ' + '; '.join(problems) if problems else ''}")
+    return ok
+
+def benchmark_browsers(colleges: int = 4, limit: int = 50, latency: float = 0.3, sizes=(1, 2, 4),
+                       max_pages: int = 5):
+    """Compare search page throughput of SeleniumLinkedInScraper for several browser pool sizes"""
+    from data_processor import SeleniumLinkedInScraper
+    
+    names = [f"Stub College {i + 1}" for i in range(colleges)]
+    pages = colleges * -(-limit // 10)
+    print(f"Browser pool benchmark: {colleges} colleges x {limit} students ({pages} search pages), "
+          f"{latency:.2f}s page latency, browsers recycled every {max_pages} pages")
+    
+    ok = True
+    baseline = None
+    with StubProviderServer(latency=latency, search_results=limit) as server:
+        print(f"  {'Browsers':>8s} {'Warm start':>10s} {'Search':>8s} {'Pages/s':>8s} {'Speedup':>8s} "
+              f"{'Launches':>8s} {'Recycles':>8s}")
+        for size in sizes:
+            start = time.perf_counter()
+            scraper = SeleniumLinkedInScraper(browsers=size, max_pages_per_browser=max_pages,
+                                              search_url=server.people_search_url, page_delay=(0.0, 0.0))
+            warm = time.perf_counter() - start
+            if not scraper.pool.alive:
+                scraper.close()
+                print("Browser benchmark needs Chrome and chromedriver")
+                return False
+            
+            start = time.perf_counter()
+            results = scraper.search_colleges(names, limit=limit)
+            elapsed = time.perf_counter() - start
+            scraper.close()
+            stats = scraper.pool.stats()
+            
+            baseline = baseline or elapsed
+            ok = ok and all(len(students) == limit for students in results.values())
+            print(f"  {size:8d} {warm:9.2f}s {elapsed:7.2f}s {pages / elapsed:8.1f} {baseline / elapsed:7.1f}x "
+                  f"{stats['launches']:8d} {stats['recycles']:8d}")
+    # More browsers must load pages faster
+    return ok and (len(sizes) < 2 or elapsed < baseline)
+
+def benchmark_extraction(pages: int = 20):
+    """Compare reading search result cards element by element against one execute_script call per page"""
+    from urllib.parse import urlencode
+    from browser_pool import chrome_driver
+    from data_processor import SeleniumLinkedInScraper
+    
+    commands = [0]
+    
+    def counting_driver():
+        # Every WebDriver command, element lookups and attribute reads included, goes through execute()
+        driver = chrome_driver()
+        execute = driver.execute
+        
+        def counted(*args, **kwargs):
+            commands[0] += 1
+            return execute(*args, **kwargs)
+        driver.execute = counted
+        return driver
+    
+    with StubProviderServer(search_results=pages * 10) as server:
+        scraper = SeleniumLinkedInScraper(browsers=1, search_url=server.people_search_url, page_delay=(0.0, 0.0),
+                                          driver_factory=counting_driver)
+        if not scraper.pool.alive:
+            scraper.close()
+            print("Extraction benchmark needs Chrome and chromedriver")
+            return False
+        
+        def measure(driver, page: int):
+            driver.get(f"{server.people_search_url}?{urlencode({'keywords': 'Stub College', 'page': page})}")
+            timings = {}
+            for mode, extract in (('elements', scraper._extract_results), ('script', scraper._harvest_results)):
+                before = commands[0]
+                start = time.perf_counter()
+                students, _ = extract(driver, 'Stub College')
+                timings[mode] = (time.perf_counter() - start, commands[0] - before, students)
+            return timings
+        
+        try:
+            measured = scraper.pool.map(measure, range(1, pages + 1))
+        finally:
+            scraper.close()
+    
+    print(f"Extraction benchmark: {pages} local search pages, 10 result cards each")
+    print(f"  {'Mode':10s} {'ms/page':>8s} {'Commands/page':>14s} {'Cards':>6s}")
+    per_page = {}
+    for mode in ('elements', 'script'):
+        seconds = sum(timings[mode][0] for timings in measured) / pages
+        calls = sum(timings[mode][1] for timings in measured) / pages
+        cards = sum(len(timings[mode][2]) for timings in measured)
+        per_page[mode] = seconds
+        print(f"  {mode:10s} {seconds * 1000:8.2f} {calls:14.1f} {cards:6d}")
+    print(f"  Speedup: {per_page['elements'] / per_page['script']:.1f}x")
+    
+    identical = all(timings['elements'][2] == timings['script'][2] for timings in measured)
+    if not identical:
+        print("  Extraction modes disagree on some cards")
+    return identical and per_page['script'] < per_page['elements']
+
+def benchmark_columnar(count: int = 100000):
+    """Compare counting students per college from NDJSON and CSV against a Parquet/Arrow column scan"""
+    import csv
+    import tempfile
+    from collections import Counter
+    from json_stream import write_ndjson, read_ndjson
+    from columnar_export import columnar_available, export_columnar, load_columnar
+    
+    if not columnar_available():
+        print("Columnar benchmark needs pyarrow: pip install pyarrow")
+        return False
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {ext: os.path.join(tmp, f"students.{ext}") for ext in ('jsonl', 'csv', 'parquet', 'arrow')}
+        write_ndjson(paths['jsonl'], _iter_synthetic_students(count))
+        with open(paths['csv'], 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['name', 'college', 'degree', 'graduation_year', 'location',
+                                                   'headline', 'profile_url', 'connections', 'skills', 'method'],
+                                    extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(_iter_synthetic_students(count))
+        
+        start = time.perf_counter()
+        export_columnar(read_ndjson(paths['jsonl']), paths['parquet'])
+        parquet_export = time.perf_counter() - start
+        start = time.perf_counter()
+        export_columnar(read_ndjson(paths['jsonl']), paths['arrow'])
+        arrow_export = time.perf_counter() - start
+        
+        def scan_ndjson():
+            return Counter(student['college'] for student in read_ndjson(paths['jsonl']))
+        
+        def scan_csv():
+            with open(paths['csv'], newline='', encoding='utf-8') as f:
+                return Counter(row['college'] for row in csv.DictReader(f))
+        
+        def scan_columnar(path):
+            column = load_columnar(path, ['college']).column('college')
+            return Counter(column.to_pandas().value_counts().to_dict())
+        
+        expected = scan_ndjson()
+        timings = {
+            'NDJSON (json.loads per line)': _timed(scan_ndjson, 3),
+            'CSV (DictReader)': _timed(scan_csv, 3),
+            'Parquet (one column)': _timed(lambda: scan_columnar(paths['parquet']), 3),
+            'Arrow IPC (memory-mapped)': _timed(lambda: scan_columnar(paths['arrow']), 3),
+        }
+        consistent = scan_csv() == expected and all(scan_columnar(paths[ext]) == expected for ext in ('parquet', 'arrow'))
+        sizes = {ext: os.path.getsize(path) for ext, path in paths.items()}
+    
+    mb = 1024 * 1024
+    print(f"Columnar benchmark: {count} students, count per college")
+    for label, seconds in timings.items():
+        print(f"  {label:30s} {seconds * 1000:8.1f}ms")
+    print(f"  Export from NDJSON: Parquet {parquet_export:.2f}s, Arrow {arrow_export:.2f}s")
+    print("  File sizes: " + ", ".join(f"{ext} {size / mb:.1f}MB" for ext, size in sizes.items()))
+    print(f"  Results identical: {consistent}")
+    return consistent
+
+def main():
+    """Benchmark CLI"""
+    parser = argparse.ArgumentParser(description="Offline performance benchmarks using local stub providers")
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show fetcher logging')
+    
+    subparsers = parser.add_subparsers(dest='command', help='Available benchmarks')
+    
+    scrape_parser = subparsers.add_parser('scrape', help='Sequential vs concurrent profile scraping')
+    scrape_parser.add_argument('--profiles', type=int, default=40, help='Number of profiles (default: 40)')
+    scrape_parser.add_argument('--latency', type=float, default=0.25, help='Stub response latency in seconds (default: 0.25)')
+    scrape_parser.add_argument('--workers', type=int, default=8, help='Concurrent workers (default: 8)')
+    
+    transport_parser = subparsers.add_parser('transport', help='Per-call connections vs pooled keep-alive transport')
+    transport_parser.add_argument('--requests', type=int, default=200, help='Number of requests (default: 200)')
+    
+    throttle_parser = subparsers.add_parser('throttle', help='Concurrent 429s against one shared rate limiter')
+    throttle_parser.add_argument('--clients', type=int, default=8, help='Requests throttled at once (default: 8)')
+    throttle_parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds (default: 1)')
+    
+    parse_parser = subparsers.add_parser('parse', help='Profile HTML extraction on saved fixtures')
+    parse_parser.add_argument('--repeats', type=int, default=5, help='Timing repeats per fixture (default: 5)')
+    
+    pipeline_parser = subparsers.add_parser('pipeline', help='In-thread parsing vs process-pool parse pipeline')
+    pipeline_parser.add_argument('--profiles', type=int, default=60, help='Number of profiles (default: 60)')
+    pipeline_parser.add_argument('--latency', type=float, default=0.1, help='Stub response latency in seconds (default: 0.1)')
+    pipeline_parser.add_argument('--fetch-workers', type=int, default=8, help='Concurrent downloads (default: 8)')
+    pipeline_parser.add_argument('--parse-workers', type=int, default=None, help='Parser processes (default: CPU count)')
+    
+    database_parser = subparsers.add_parser('database', help='Row-by-row inserts vs bulk SQLite upserts')
+    database_parser.add_argument('--students', type=int, default=100000, help='Number of students (default: 100000)')
+    
+    export_parser = subparsers.add_parser('export', help='In-memory JSON export vs streaming NDJSON')
+    export_parser.add_argument('--students', type=int, default=100000, help='Number of students (default: 100000)')
+    
+    records_parser = subparsers.add_parser('records', help='Student dictionaries vs slotted StudentProfile memory')
+    records_parser.add_argument('--students', type=int, default=100000, help='Number of students (default: 100000)')
+    
+    dedup_parser = subparsers.add_parser('dedup', help='Fuzzy deduplication accuracy and scaling')
+    dedup_parser.add_argument('--students', type=int, default=100000, help='Number of people (default: 100000)')
+    
+    excel_parser = subparsers.add_parser('excel', help='pandas Excel export vs streaming write-only workbook')
+    excel_parser.add_argument('--students', type=int, default=20000, help='Number of students (default: 20000)')
+    
+    columnar_parser = subparsers.add_parser('columnar', help='Row-format re-reads vs Parquet/Arrow column scans')
+    columnar_parser.add_argument('--students', type=int, default=100000, help='Number of students (default: 100000)')
+    
+    search_parser = subparsers.add_parser('search', help='Fixed per-query search split vs cached query planner')
+    search_parser.add_argument('--limits', type=int, nargs='+', default=[2, 20, 100],
+                               help='Target profile counts (default: 2 20 100)')
+    
+    hunter_parser = subparsers.add_parser('hunter', help='Single-page vs paginated, concurrent and cached domain search')
+    hunter_parser.add_argument('--emails', type=int, default=1000, help='Addresses at the domain (default: 1000)')
+    hunter_parser.add_argument('--latency', type=float, default=0.2, help='Stub response latency in seconds (default: 0.2)')
+    hunter_parser.add_argument('--workers', type=int, default=4, help='Concurrent page requests (default: 4)')
+    
+    verify_parser = subparsers.add_parser('verify', help='verify_email loop vs concurrent, cached bulk verification')
+    verify_parser.add_argument('--addresses', type=int, default=200, help='Unique addresses (default: 200)')
+    verify_parser.add_argument('--latency', type=float, default=0.05, help='Stub response latency in seconds (default: 0.05)')
+    verify_parser.add_argument('--workers', type=int, default=8, help='Concurrent verifications (default: 8)')
+    
+    colleges_parser = subparsers.add_parser('colleges', help='Linear college name scan vs indexed college registry')
+    colleges_parser.add_argument('--colleges', type=int, default=40000, help='Registered colleges (default: 40000)')
+    colleges_parser.add_argument('--lookups', type=int, default=2000, help='Queries per kind (default: 2000)')
+    
+    telemetry_parser = subparsers.add_parser('telemetry', help='Telemetry overhead, percentile accuracy and request counts')
+    telemetry_parser.add_argument('--profiles', type=int, default=200, help='Profiles to scrape (default: 200)')
+    telemetry_parser.add_argument('--latency', type=float, default=0.02, help='Stub latency per request (default: 0.02s)')
+    telemetry_parser.add_argument('--workers', type=int, default=8, help='Concurrent scrapes (default: 8)')
+    
+    e2e_parser = subparsers.add_parser('e2e', help='Whole crawls against stub providers with latency, 503s and 429 bursts')
+    e2e_parser.add_argument('--colleges', type=int, default=4, help='Colleges in the batch crawl (default: 4)')
+    e2e_parser.add_argument('--limit', type=int, default=40, help='Students per college (default: 40)')
+    e2e_parser.add_argument('--latency', type=float, default=0.05, help='Stub latency per request (default: 0.05s)')
+    e2e_parser.add_argument('--jitter', type=float, default=0.05, help='Extra random latency (default: up to 0.05s)')
+    e2e_parser.add_argument('--error-rate', type=float, default=0.02, help='Share of 503 responses (default: 0.02)')
+    e2e_parser.add_argument('--throttle-every', type=int, default=100, help='Requests per 429 burst (default: 100)')
+    e2e_parser.add_argument('--throttle-burst', type=int, default=3, help='429s per burst (default: 3)')
+    e2e_parser.add_argument('--recordings', help='Directory of recorded responses to replay (e.g. fixtures)')
+    
+    startup_parser = subparsers.add_parser('startup', help='CLI cold start time and heavy-import budget')
+    startup_parser.add_argument('--runs', type=int, default=5, help='Runs per command (default: 5)')
+    startup_parser.add_argument('--budget', type=float, default=0.5, help='Seconds a light command may take (default: 0.5)')
+    
+    browsers_parser = subparsers.add_parser('browsers', help='Selenium search throughput by browser pool size (needs Chrome)')
+    browsers_parser.add_argument('--colleges', type=int, default=4, help='Colleges to search (default: 4)')
+    browsers_parser.add_argument('--limit', type=int, default=50, help='Students per college (default: 50)')
+    browsers_parser.add_argument('--latency', type=float, default=0.3, help='Stub latency per page (default: 0.3s)')
+    browsers_parser.add_argument('--sizes', type=int, nargs='+', default=[1, 2, 4], help='Pool sizes (default: 1 2 4)')
+    browsers_parser.add_argument('--max-pages', type=int, default=5,
+                                 help='Pages per browser before it is recycled (default: 5)')
+    
+    extraction_parser = subparsers.add_parser('extraction', help='Selenium result card extraction: per element vs one script (needs Chrome)')
+    extraction_parser.add_argument('--pages', type=int, default=20, help='Search pages to extract (default: 20)')
+    
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    
+    if args.command == 'scrape':
+        benchmark_scrape(args.profiles, args.latency, args.workers)
+    elif args.command == 'transport':
+        benchmark_transport(args.requests)
+    elif args.command == 'throttle':
+        if not benchmark_throttle(args.clients, args.retry_after):
+            sys.exit(1)
+    elif args.command == 'pipeline':
+        benchmark_pipeline(args.profiles, args.latency, args.fetch_workers, args.parse_workers)
+    elif args.command == 'export':
+        benchmark_export(args.students)
+    elif args.command == 'database':
+        if not benchmark_database(args.students):
+            sys.exit(1)
+    elif args.command == 'records':
+        if not benchmark_records(args.students):
+            sys.exit(1)
+    elif args.command == 'dedup':
+        if not benchmark_dedup(args.students):
+            sys.exit(1)
+    elif args.command == 'excel':
+        benchmark_excel(args.students)
+    elif args.command == 'columnar':
+        if not benchmark_columnar(args.students):
+            sys.exit(1)
+    elif args.command == 'search':
+        if not benchmark_search(args.limits):
+            sys.exit(1)
+    elif args.command == 'hunter':
+        if not benchmark_hunter(args.emails, args.latency, workers=args.workers):
+            sys.exit(1)
+    elif args.command == 'verify':
+        if not benchmark_verify(args.addresses, args.latency, args.workers):
+            sys.exit(1)
+    elif args.command == 'colleges':
+        if not benchmark_colleges(args.colleges, args.lookups):
+            sys.exit(1)
+    elif args.command == 'telemetry':
+        if not benchmark_telemetry(args.profiles, args.latency, args.workers):
+            sys.exit(1)
+    elif args.command == 'e2e':
+        if not benchmark_e2e(args.colleges, args.limit, args.latency, args.jitter, args.error_rate,
+                             args.throttle_every, args.throttle_burst, args.recordings):
+            sys.exit(1)
+    elif args.command == 'startup':
+        if not benchmark_startup(args.runs, args.budget):
+            sys.exit(1)
+    elif args.command == 'browsers':
+        if not benchmark_browsers(args.colleges, args.limit, args.latency, args.sizes, args.max_pages):
+            sys.exit(1)
+    elif args.command == 'extraction':
+        if not benchmark_extraction(args.pages):
+            sys.exit(1)
+    elif args.command == 'parse':
+        if not benchmark_parse(args.repeats):
+            sys.exit(1)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Browser Pool
+Bounded pool of reusable headless Chrome workers fed from a shared work queue
+"""
+
+import time
+import queue
+import random
+import threading
+import logging
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Any, Callable, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+def chrome_driver(headless: bool = True):
+    """
+    Start a Chrome WebDriver with the scraper's usual options
+    
+    Images are not loaded: search pages are read, never looked at, and
+    skipping them saves bandwidth and renderer memory.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    
+    chrome_options = Options()
+    
+    if headless:
+        chrome_options.add_argument('--headless')
+    
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.debug(f"Error closing browser: {e}")
+
+def _responsive(driver) -> bool:
+    """Whether the browser still answers WebDriver commands"""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+class BrowserPool:
+    """
+    A fixed number of browsers, each driven by its own worker thread
+    
+    WebDriver sessions are not thread-safe, so every worker owns one browser
+    and takes jobs from a shared queue: a slow page only holds up its own
+    browser, and throughput grows with the pool size. All browsers are
+    launched in parallel by start() (warm start), so the first jobs do not
+    wait for Chrome to boot one instance at a time. A browser is replaced
+    after max_pages jobs, since a long-lived Chrome keeps growing, and
+    straight away if it stops responding.
+    """
+    
+    def __init__(self, size: int = 2, driver_factory: Callable[[], Any] = None, max_pages: int = 50,
+                 headless: bool = True, page_delay: Tuple[float, float] = (0.0, 0.0),
+                 on_launch: Callable[[Any], None] = None):
+        """
+        Initialize the pool (browsers are launched by start())
+        
+        Args:
+            size: Number of browsers
+            driver_factory: Returns a new WebDriver (default: headless Chrome via chrome_driver())
+            max_pages: Jobs a browser runs before it is replaced with a fresh one
+            headless: Run the default Chrome without a window
+            page_delay: (min, max) seconds each browser pauses between jobs
+            on_launch: Called with every new browser before it takes jobs (e.g. to open a start page)
+        """
+        self.size = max(1, size)
+        self.driver_factory = driver_factory or (lambda: chrome_driver(headless))
+        self.max_pages = max(1, max_pages)
+        self.page_delay = page_delay
+        self.on_launch = on_launch
+        
+        self._jobs: queue.Queue = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._warm = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._alive = 0
+        self._closed = False
+        
+        self.launches = 0
+        self.launch_failures = 0
+        self.recycles = 0
+        self.pages = 0
+        self.failures = 0
+        self.launch_time = 0.0
+    
+    def start(self) -> 'BrowserPool':
+        """Launch every browser and wait until each one is ready (or has failed to start)"""
+        if self._threads:
+            return self
+        
+        start = time.perf_counter()
+        self._alive = self.size
+        for index in range(self.size):
+            thread = threading.Thread(target=self._work, args=(index,), name=f"browser-{index}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+        for _ in range(self.size):
+            self._warm.acquire()
+        
+        if self.alive:
+            logger.info(f"Warm-started {self.alive}/{self.size} browsers in {time.perf_counter() - start:.2f}s")
+        else:
+            logger.error("No browser could be started")
+            logger.info("Please ensure Chrome and ChromeDriver are installed and in PATH")
+        return self
+    
+    @property
+    def alive(self) -> int:
+        """Workers with a running browser"""
+        with self._lock:
+            return self._alive
+    
+    def submit(self, job: Callable[..., Any], *args) -> Future:
+        """
+        Queue job(driver, *args) for the next free browser
+        
+        Returns:
+            Future with the job's return value or exception; cancelling it
+            before a browser picks it up skips the job
+        """
+        future = Future()
+        with self._lock:
+            if self._closed or not self._alive:
+                raise RuntimeError("Browser pool has no running browsers")
+            self._jobs.put((future, job, args))
+        return future
+    
+    def map(self, job: Callable[..., Any], items: Iterable[Any]) -> List[Any]:
+        """Run job(driver, item) for every item across the pool; results in input order"""
+        futures = [self.submit(job, item) for item in items]
+        return [future.result() for future in futures]
+    
+    def _launch(self, index: int):
+        start = time.perf_counter()
+        try:
+            driver = self.driver_factory()
+            if self.on_launch:
+                self.on_launch(driver)
+        except Exception as e:
+            logger.error(f"Error starting browser {index}: {e}")
+            with self._lock:
+                self.launch_failures += 1
+            return None
+        
+        with self._lock:
+            self.launches += 1
+            self.launch_time += time.perf_counter() - start
+        return driver
+    
+    def _work(self, index: int):
+        """Worker loop: one browser, jobs from the shared queue until a stop marker arrives"""
+        driver = self._launch(index)
+        if driver is None:
+            self._retire()
+            self._warm.release()
+            return
+        self._warm.release()
+        
+        pages = 0
+        try:
+            while driver is not None:
+                item = self._jobs.get()
+                if item is None:
+                    break
+                future, job, args = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                
+                try:
+                    future.set_result(job(driver, *args))
+                except Exception as e:
+                    future.set_exception(e)
+                    with self._lock:
+                        self.failures += 1
+                    if not _responsive(driver):
+                        logger.warning(f"Browser {index} stopped responding; replacing it")
+                        pages = self.max_pages
+                pages += 1
+                with self._lock:
+                    self.pages += 1
+                
+                if pages >= self.max_pages:
+                    _quit(driver)
+                    driver = self._launch(index)
+                    pages = 0
+                    with self._lock:
+                        self.recycles += 1
+                elif self.page_delay[1] > 0:
+                    time.sleep(random.uniform(*self.page_delay))
+        finally:
+            if driver is not None:
+                _quit(driver)
+            self._retire()
+    
+    def _retire(self):
+        """Count a worker out; the last one fails whatever is still queued"""
+        with self._lock:
+            self._alive -= 1
+            if self._alive:
+                return
+            while True:
+                try:
+                    item = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None and item[0].set_running_or_notify_cancel():
+                    item[0].set_exception(RuntimeError("Browser pool has no running browsers"))
+    
+    def stats(self) -> Dict[str, Any]:
+        """Browsers running, launches (and their mean time), recycles, jobs run and jobs failed"""
+        with self._lock:
+            return {'browsers': self._alive, 'launches': self.launches, 'launch_failures': self.launch_failures,
+                    'mean_launch_time': round(self.launch_time / self.launches, 3) if self.launches else 0.0,
+                    'recycles': self.recycles, 'pages': self.pages, 'failures': self.failures}
+    
+    def close(self):
+        """Let queued jobs finish, then quit every browser"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+    
+    def __enter__(self) -> 'BrowserPool':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+College Registry
+Indexed college name to email domain resolver with aliases and ranked fuzzy matching
+"""
+
+import re
+import csv
+import json
+import math
+import logging
+from typing import Dict, List, Optional, Any, Iterable, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Spellings seen in college names, mapped to the word they abbreviate
+ABBREVIATIONS = {
+    'engg': 'engineering', 'eng': 'engineering', 'engr': 'engineering',
+    'inst': 'institute', 'instt': 'institute',
+    'tech': 'technology', 'techn': 'technology',
+    'univ': 'university', 'uni': 'university',
+    'coll': 'college', 'clg': 'college',
+    'sci': 'science', 'mgmt': 'management', 'govt': 'government',
+    'intl': 'international', 'natl': 'national',
+}
+STOPWORDS = frozenset({'of', 'the', 'and', 'for', 'in', 'at', '&'})
+
+MIN_SCORE = 0.6             # Below this a match is too uncertain to spend a paid lookup on
+FUZZY_WEIGHT = 0.8          # Credit for a token matched with one typo
+_MIN_FUZZY_LENGTH = 4       # Shorter tokens (initials, "rv", "iit") must match exactly
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+def name_tokens(name: str) -> Tuple[str, ...]:
+    """
+    Normalized tokens of a college name
+    
+    Lowercases, drops punctuation and stopwords, expands common
+    abbreviations and joins runs of single letters, so 'M.S. Ramaiah Inst.
+    of Tech.' and 'MS Ramaiah Institute of Technology' give the same tokens.
+    """
+    tokens = []
+    initials = ''
+    for word in _NON_ALNUM.split(name.lower()):
+        if len(word) == 1 and word.isalpha():
+            initials += word
+            continue
+        if initials:
+            tokens.append(initials)
+            initials = ''
+        if word and word not in STOPWORDS:
+            tokens.append(ABBREVIATIONS.get(word, word))
+    if initials:
+        tokens.append(initials)
+    return tuple(tokens)
+
+def guess_domain(college_name: str) -> str:
+    """Made-up '<name>.edu.in' domain for a college missing from the registry"""
+    clean_name = college_name.lower().replace(' ', '').replace('college', '').replace('engineering', '').replace('of', '')
+    return f"{clean_name}.edu.in"
+
+def _deletions(token: str) -> Set[str]:
+    """The token with each one of its characters removed"""
+    return {token[:i] + token[i + 1:] for i in range(len(token))}
+
+class College:
+    """One institution: display name, email domains and alternative names"""
+    
+    __slots__ = ('name', 'domains', 'aliases')
+    
+    def __init__(self, name: str, domains: List[str], aliases: List[str] = None):
+        self.name = name
+        self.domains = list(domains)
+        self.aliases = list(aliases or [])
+    
+    def __repr__(self) -> str:
+        return f"College(name={self.name!r}, domains={self.domains!r})"
+
+class CollegeRegistry:
+    """
+    College names resolved to email domains through an inverted token index
+    
+    Every name and alias is indexed by its normalized tokens. A lookup first
+    tries an exact normalized match, then scores candidates by IDF-weighted
+    token overlap (rare words like 'ramaiah' count far more than 'college'),
+    with single-typo tokens found through a deletion index rather than a
+    scan of the vocabulary. Candidates are only drawn from the query's
+    rarer tokens, so the cost of a lookup depends on the query, not on how
+    many institutions are loaded; a name made only of common words
+    ('College of Engineering') matches nothing.
+    """
+    
+    def __init__(self, colleges: Iterable[College] = ()):
+        self.colleges: List[College] = []
+        self._doc_college: List[int] = []                   # Indexed name/alias -> college
+        self._doc_tokens: List[frozenset] = []
+        self._exact: Dict[Tuple[str, ...], int] = {}        # Normalized name/alias -> college
+        self._postings: Dict[str, List[int]] = {}           # Token -> indexed names containing it
+        self._deletes: Dict[str, Set[str]] = {}             # One-deletion variant -> tokens
+        for college in colleges:
+            self.add(college)
+    
+    def __len__(self) -> int:
+        return len(self.colleges)
+    
+    def add(self, college: College):
+        """Index a college under its name and aliases"""
+        index = len(self.colleges)
+        self.colleges.append(college)
+        for variant in [college.name] + college.aliases:
+            tokens = name_tokens(variant)
+            if not tokens:
+                continue
+            self._exact.setdefault(tokens, index)
+            doc = len(self._doc_tokens)
+            self._doc_college.append(index)
+            self._doc_tokens.append(frozenset(tokens))
+            for token in set(tokens):
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = []
+                    if len(token) >= _MIN_FUZZY_LENGTH:
+                        for variant_key in _deletions(token) | {token}:
+                            self._deletes.setdefault(variant_key, set()).add(token)
+                postings.append(doc)
+    
+    @classmethod
+    def from_mapping(cls, domains: Dict[str, List[str]], aliases: Dict[str, List[str]] = None) -> 'CollegeRegistry':
+        """Build a registry from {name: [domains]} and optional {name: [aliases]}"""
+        aliases = aliases or {}
+        return cls(College(name, college_domains, aliases.get(name)) for name, college_domains in domains.items())
+    
+    @classmethod
+    def load(cls, path: str) -> 'CollegeRegistry':
+        """
+        Load a registry file
+        
+        JSON files hold either {name: [domains]} or a list of
+        {"name", "domains", "aliases"} objects; CSV files have name, domains
+        and aliases columns, with several values separated by ';'.
+        
+        Args:
+            path: .json or .csv file
+        
+        Returns:
+            CollegeRegistry
+        """
+        registry = cls()
+        if path.lower().endswith('.csv'):
+            with open(path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    registry.add(College(row['name'], _split(row.get('domains')), _split(row.get('aliases'))))
+        else:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                data = [{'name': name, 'domains': domains} for name, domains in data.items()]
+            for entry in data:
+                registry.add(College(entry['name'], entry.get('domains', []), entry.get('aliases')))
+        logger.info(f"Loaded {len(registry)} colleges from {path}")
+        return registry
+    
+    def match(self, name: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Rank the colleges a name may refer to
+        
+        Args:
+            name: College name as written by the user, in any spelling
+            limit: Maximum number of matches
+        
+        Returns:
+            [{'name', 'domains', 'score', 'college'}], best first; score is
+            1.0 for an exact normalized name or alias match
+        """
+        return [self._match(college, round(score, 3)) for college, score, _ in self._rank(name)[:limit]]
+    
+    def _rank(self, name: str) -> List[Tuple[int, float, float]]:
+        """
+        Score every candidate college
+        
+        Returns:
+            [(college index, score, coverage)] by descending score, where
+            coverage is the share of the query's weight the college's best
+            name explains with exactly matching tokens
+        """
+        tokens = name_tokens(name)
+        if not tokens:
+            return []
+        
+        exact = self._exact.get(tokens)
+        if exact is not None:
+            return [(exact, 1.0, 1.0)]
+        
+        doc_count = len(self._doc_tokens)
+        if not doc_count:
+            return []
+        
+        weights: Dict[str, float] = {}
+        
+        def idf(token: str) -> float:
+            weight = weights.get(token)
+            if weight is None:
+                weight = weights[token] = math.log(1 + doc_count / len(self._postings[token]))
+            return weight
+        
+        # Each query token's candidates in the vocabulary, with the credit a hit earns
+        expansions = []
+        query_weight = 0.0
+        for token in set(tokens):
+            if token in self._postings:
+                options = [(token, 1.0)]
+            else:
+                options = [(candidate, FUZZY_WEIGHT) for candidate in self._fuzzy(token)]
+            expansions.append(options)
+            query_weight += max((idf(candidate) for candidate, _ in options), default=math.log(1 + doc_count))
+        
+        # Draw candidates from the query's rare exact tokens, or failing that its typo
+        # neighbours; words as common as 'college' are only checked on those candidates
+        cap = max(64, doc_count // 50)
+        docs = set()
+        for credit_wanted in (1.0, FUZZY_WEIGHT):
+            for options in expansions:
+                for candidate, credit in options:
+                    if credit == credit_wanted and len(self._postings[candidate]) <= cap:
+                        docs.update(self._postings[candidate])
+            if docs:
+                break
+        
+        best: Dict[int, float] = {}
+        coverage: Dict[int, float] = {}
+        for doc in docs:
+            doc_tokens = self._doc_tokens[doc]
+            overlap = 0.0
+            exact_overlap = 0.0
+            matched = set()
+            for options in expansions:
+                for candidate, credit in options:
+                    if candidate in doc_tokens and candidate not in matched:
+                        overlap += credit * idf(candidate)
+                        if credit == 1.0:
+                            exact_overlap += idf(candidate)
+                        matched.add(candidate)
+                        break
+            unmatched = sum(idf(token) for token in doc_tokens if token not in matched)
+            score = overlap / (query_weight + unmatched)
+            college = self._doc_college[doc]
+            if score > best.get(college, 0.0):
+                best[college] = score
+            coverage[college] = max(coverage.get(college, 0.0), exact_overlap / query_weight)
+        
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        return [(college, score, coverage[college]) for college, score in ranked]
+    
+    def resolve(self, name: str, min_score: float = MIN_SCORE) -> Optional[College]:
+        """
+        The college a name refers to, or None if that is uncertain
+        
+        The best match is accepted if it reaches min_score without tying
+        another college, or if it is the only college whose name contains
+        every word of the query (e.g. 'Manipal').
+        """
+        ranked = self._rank(name)
+        if not ranked:
+            return None
+        
+        college, score, _ = ranked[0]
+        if score >= min_score and (len(ranked) == 1 or ranked[1][1] < score):
+            return self.colleges[college]
+        
+        covering = [college for college, _, coverage in ranked if coverage >= 0.999]
+        if len(covering) == 1:
+            return self.colleges[covering[0]]
+        return None
+    
+    def domains(self, name: str, allow_guess: bool = False, min_score: float = MIN_SCORE) -> List[str]:
+        """
+        Email domains of the college a name refers to
+        
+        Args:
+            name: College name in any spelling
+            allow_guess: Fall back to a made-up '<name>.edu.in' domain when the
+                college is not in the registry
+            min_score: Lowest match score accepted
+        
+        Returns:
+            Domains of the best match; empty if unknown and guessing is not allowed
+        """
+        college = self.resolve(name, min_score)
+        if college is not None:
+            return college.domains
+        if allow_guess:
+            domain = guess_domain(name)
+            logger.warning(f"No registered domain for {name}, guessing: {domain}")
+            return [domain]
+        logger.warning(f"No registered domain for {name}; skipping Hunter.io lookup "
+                       f"(add it to the college registry or allow guessed domains)")
+        return []
+    
+    def _fuzzy(self, token: str) -> Set[str]:
+        """Vocabulary tokens one insertion, deletion or substitution away from token"""
+        if len(token) < _MIN_FUZZY_LENGTH - 1:
+            return set()
+        found = set(self._deletes.get(token, ()))
+        for variant in _deletions(token):
+            found.update(self._deletes.get(variant, ()))
+        return {candidate for candidate in found if abs(len(candidate) - len(token)) <= 1}
+    
+    def _match(self, index: int, score: float) -> Dict[str, Any]:
+        college = self.colleges[index]
+        return {'name': college.name, 'domains': college.domains, 'score': score, 'college': college}
+
+def _split(value: Optional[str]) -> List[str]:
+    return [part.strip() for part in (value or '').split(';') if part.strip()]
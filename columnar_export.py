@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Columnar Export
+Write student records to Parquet or Arrow IPC with typed list columns and memory-map them back
+"""
+
+import os
+import re
+import logging
+import importlib.util
+from itertools import islice
+from typing import Dict, List, Optional, Any, Iterable
+
+# Optional dependency (pip install pyarrow), imported on first use by _require_pyarrow
+pa = ipc = pq = None
+
+logger = logging.getLogger(__name__)
+
+# Low-cardinality text columns stored as dictionary indices into a small set of values
+DICTIONARY_COLUMNS = ['college', 'degree', 'location', 'method', 'source', 'student_status', 'data_quality']
+STRING_COLUMNS = ['name', 'graduation_year', 'headline', 'profile_url', 'email']
+
+EXPERIENCE_FIELDS = ['title', 'company', 'duration', 'description']
+EDUCATION_FIELDS = ['school', 'degree', 'field_of_study', 'dates']
+
+DEFAULT_BATCH_SIZE = 50000
+
+def columnar_available() -> bool:
+    """Whether pyarrow is installed (checked without importing it)"""
+    return pa is not None or importlib.util.find_spec('pyarrow') is not None
+
+def _require_pyarrow():
+    global pa, ipc, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Columnar export needs pyarrow: pip install pyarrow")
+        pa, ipc, pq = pyarrow, pyarrow.ipc, pyarrow.parquet
+
+def student_schema() -> 'pa.Schema':
+    """Arrow schema for exported students"""
+    _require_pyarrow()
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    fields = [pa.field(column, pa.string()) for column in STRING_COLUMNS]
+    fields += [pa.field(column, dictionary) for column in DICTIONARY_COLUMNS]
+    fields += [
+        pa.field('connections', pa.int64()),
+        pa.field('skills', pa.list_(pa.string())),
+        pa.field('experience', pa.list_(pa.struct([pa.field(name, pa.string()) for name in EXPERIENCE_FIELDS]))),
+        pa.field('education', pa.list_(pa.struct([pa.field(name, pa.string()) for name in EDUCATION_FIELDS]))),
+    ]
+    return pa.schema(fields)
+
+def _to_int(value: Any) -> Optional[int]:
+    """Connections arrive as ints or scraped text like '1,204 connections' / '500+'"""
+    if value is None or isinstance(value, int):
+        return value
+    digits = re.sub(r'[^\d]', '', str(value))
+    return int(digits) if digits else None
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None or value == '' else str(value)
+
+def _entries(items: Any, fields: List[str]) -> List[Dict[str, Optional[str]]]:
+    return [{name: _text(item.get(name)) for name in fields} for item in (items or []) if isinstance(item, dict)]
+
+def _encode_dictionary(values: List[Optional[str]], dictionary: Dict[str, int]) -> 'pa.DictionaryArray':
+    """
+    Dictionary-encode against a dictionary that only ever grows
+    
+    Each batch's dictionary is then a prefix of the next one's, which Arrow
+    IPC files can store as deltas instead of rejecting as a replacement.
+    """
+    indices = []
+    for value in values:
+        if value is None:
+            indices.append(None)
+        else:
+            index = dictionary.get(value)
+            if index is None:
+                index = dictionary[value] = len(dictionary)
+            indices.append(index)
+    return pa.DictionaryArray.from_arrays(pa.array(indices, pa.int32()), pa.array(list(dictionary), pa.string()))
+
+def _record_batch(records: List[Dict[str, Any]], schema: 'pa.Schema',
+                  dictionaries: Dict[str, Dict[str, int]]) -> 'pa.RecordBatch':
+    """Convert a chunk of student dictionaries column by column"""
+    columns = {column: [_text(record.get(column)) for record in records] for column in STRING_COLUMNS}
+    columns['profile_url'] = [_text(record.get('profile_url') or record.get('linkedin_url')) for record in records]
+    columns['graduation_year'] = [_text(record.get('graduation_year') or record.get('graduationYear')) for record in records]
+    for column in DICTIONARY_COLUMNS:
+        columns[column] = [_text(record.get(column)) for record in records]
+    columns['connections'] = [_to_int(record.get('connections')) for record in records]
+    columns['skills'] = [[str(skill) for skill in (record.get('skills') or [])] for record in records]
+    columns['experience'] = [_entries(record.get('experience'), EXPERIENCE_FIELDS) for record in records]
+    columns['education'] = [_entries(record.get('education'), EDUCATION_FIELDS) for record in records]
+    
+    arrays = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            arrays.append(_encode_dictionary(columns[field.name], dictionaries.setdefault(field.name, {})))
+        else:
+            arrays.append(pa.array(columns[field.name], field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def export_columnar(records: Iterable[Dict[str, Any]], path: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Stream student records into a Parquet (.parquet) or Arrow IPC (.arrow/.feather) file
+    
+    Records are converted and written one batch at a time, so any iterable
+    (including read_ndjson over a huge crawl) is exported in bounded memory.
+    
+    Args:
+        records: Student dictionaries
+        path: Output file; the extension picks the format
+        batch_size: Records per row group / record batch
+    
+    Returns:
+        Number of records written
+    """
+    _require_pyarrow()
+    schema = student_schema()
+    is_parquet = not path.endswith(('.arrow', '.feather'))
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    if is_parquet:
+        writer = pq.ParquetWriter(path, schema, compression='zstd', use_dictionary=True)
+    else:
+        # Uncompressed so the file can be memory-mapped without decoding
+        writer = ipc.new_file(path, schema, options=ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+    
+    written = 0
+    dictionaries: Dict[str, Dict[str, int]] = {}
+    records = iter(records)
+    try:
+        while True:
+            chunk = list(islice(records, batch_size))
+            if not chunk:
+                break
+            batch = _record_batch(chunk, schema, dictionaries)
+            if is_parquet:
+                writer.write_batch(batch)
+            else:
+                writer.write(batch)
+            written += len(chunk)
+    finally:
+        writer.close()
+    
+    logger.info(f"Exported {written} students to {path}")
+    return written
+
+def load_columnar(path: str, columns: List[str] = None) -> 'pa.Table':
+    """
+    Memory-map an exported file back as an Arrow table
+    
+    Arrow IPC files are zero-copy: only the pages of the columns actually
+    touched are read from disk. Parquet files are memory-mapped and only the
+    requested columns are decoded.
+    
+    Args:
+        path: File written by export_columnar
+        columns: Columns to load (default: all)
+    
+    Returns:
+        Arrow table; call .to_pandas() for a DataFrame with categorical columns
+    """
+    _require_pyarrow()
+    if path.endswith(('.arrow', '.feather')):
+        table = ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        return table.select(columns) if columns else table
+    return pq.read_table(path, columns=columns, memory_map=True)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Crawl Journal
+Append-only JSONL checkpoint of completed crawl work so interrupted runs can resume
+"""
+
+import os
+import json
+import time
+import threading
+import logging
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Kind of the line finish() appends once a crawl has completed
+FINISHED_KIND = '_finished'
+
+def journal_finished(path: str) -> bool:
+    """Whether a journal is empty or ends with a finish() marker, so nothing in it is awaiting a resume"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 4096))
+        lines = f.read().splitlines()
+    if not lines:
+        return True
+    try:
+        return json.loads(lines[-1]).get('kind') == FINISHED_KIND
+    except (ValueError, AttributeError):
+        return False
+
+class CrawlJournal:
+    """
+    Record of finished Hunter lookups, search queries and scraped profiles
+    
+    Every completed unit of work is appended as one JSON line and flushed
+    straight away, so a crash loses at most the request in flight. Reopening
+    the journal with resume=True indexes it; callers check get() before
+    paying for a request again. Only the byte offset of each entry is kept
+    in memory and values are read back from the file on a hit. A torn final
+    line from a crash is skipped on load.
+    
+    A journal is finished once finish() has been called. Opening an
+    unfinished one without resume raises FileExistsError rather than
+    discarding an interrupted crawl, unless overwrite is set.
+    """
+    
+    def __init__(self, path: str, resume: bool = False, fsync: bool = False, overwrite: bool = False):
+        """
+        Open the journal
+        
+        Args:
+            path: JSONL file to append to
+            resume: Load the entries of an unfinished journal; otherwise (or if its crawl
+                finished) a previous journal is discarded
+            fsync: Force each entry to disk (survives power loss, not just a crash)
+            overwrite: Discard a previous journal even if its crawl never finished
+        
+        Raises:
+            FileExistsError: The journal holds an unfinished crawl and neither
+                resume nor overwrite was given
+        """
+        self.path = path
+        self.fsync = fsync
+        self.replayed = 0
+        self._offsets: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._reader = None
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        exists = os.path.exists(path)
+        finished = exists and journal_finished(path)
+        if exists and not resume and not overwrite and not finished:
+            raise FileExistsError(f"{path} holds an unfinished crawl; resume it or start fresh to discard it")
+        if resume and finished:
+            # A completed crawl has nothing to resume; replaying it would skip all of the new run's work
+            resume = False
+        
+        if resume and exists:
+            self._load()
+            logger.info(f"Resuming from {path}: {len(self._offsets)} completed tasks")
+        elif exists:
+            logger.info(f"Starting a fresh crawl journal at {path}")
+        
+        self._file = open(path, 'ab' if resume else 'wb')
+        self._size = self._file.seek(0, os.SEEK_END)
+        if self._size and not self._ends_with_newline():
+            # Start after a line torn by a crash instead of gluing the next entry onto it
+            self._write(b'\n')
+    
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+    
+    def _load(self):
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                    if entry['kind'] != FINISHED_KIND:
+                        self._offsets[(entry['kind'], entry['key'])] = offset
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"Skipping unreadable journal line {line_number} in {self.path}")
+                offset += len(line)
+    
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._size += len(data)
+    
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """
+        Look up the result of a completed task
+        
+        Args:
+            kind: Task type ('hunter', 'search', 'profile')
+            key: Task identifier within its type
+        
+        Returns:
+            The recorded result (a fresh copy on every call), or None if the
+            task has not been completed
+        """
+        with self._lock:
+            offset = self._offsets.get((kind, key))
+            if offset is None:
+                return None
+            if self._reader is None:
+                self._reader = open(self.path, 'rb')
+            self._reader.seek(offset)
+            line = self._reader.readline()
+            self.replayed += 1
+        return json.loads(line)['value']
+    
+    def record(self, kind: str, key: str, value: Any):
+        """
+        Append the result of a completed task
+        
+        Args:
+            kind: Task type ('hunter', 'search', 'profile')
+            key: Task identifier within its type
+            value: JSON-serializable result
+        """
+        line = json.dumps({'kind': kind, 'key': key, 'value': value, 'recorded_at': time.time()},
+                          ensure_ascii=False, default=str)
+        data = (line + '\n').encode('utf-8')
+        with self._lock:
+            self._offsets[(kind, key)] = self._size
+            self._write(data)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._offsets)
+    
+    def finish(self):
+        """Mark the crawl complete, so a later run may start a fresh journal here, and close the file"""
+        line = json.dumps({'kind': FINISHED_KIND, 'recorded_at': time.time()})
+        with self._lock:
+            if not self._file.closed:
+                self._write((line + '\n').encode('utf-8'))
+        self.close()
+    
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            self._file.close()
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
@@ -6,30 +6,57 @@ Handles data processing, export, and alternative data collection methods
 
 import json
 import csv
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 import time
 import random
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Tuple, TYPE_CHECKING
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import os
+import threading
+import weakref
 from datetime import datetime
+from itertools import islice
+from urllib.parse import urlparse, urlencode
 import sqlite3
 
+from json_stream import write_json_array, write_ndjson
+from student_record import StudentProfile, student_dicts
+from dedup import deduplicate
+
+# pandas, openpyxl, pyarrow, requests, BeautifulSoup and Selenium are imported
+# by the exporters and collectors that use them, so a JSON-only run starts in milliseconds
+if TYPE_CHECKING:
+    import pandas as pd
+    from bs4 import BeautifulSoup
+
 logger = logging.getLogger(__name__)
 
+# Insert a student, or refresh the stored row when its student_key is already known
+STUDENT_UPSERT_SQL = '''
+    INSERT INTO students (name, college, degree, graduation_year, location,
+                          headline, profile_url, connections, skills, experience, student_key)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (student_key) DO UPDATE SET
+        name = excluded.name,
+        college = excluded.college,
+        degree = excluded.degree,
+        graduation_year = excluded.graduation_year,
+        location = excluded.location,
+        headline = excluded.headline,
+        profile_url = excluded.profile_url,
+        connections = excluded.connections,
+        skills = excluded.skills,
+        experience = excluded.experience
+'''
+
+# Reused for every row; json.dumps(..., default=str) would build a new encoder per call
+_encode_json = json.JSONEncoder(default=str).encode
+
 class StudentDataProcessor:
     """Process and export student data in various formats"""
     
     def __init__(self):
         self.data_directory = "data"
+        self._db_connections: Dict[str, sqlite3.Connection] = {}
         self.ensure_data_directory()
     
     def ensure_data_directory(self):
@@ -37,17 +64,30 @@ class StudentDataProcessor:
         if not os.path.exists(self.data_directory):
             os.makedirs(self.data_directory)
     
-    def export_to_json(self, data: List[Dict], filename: str = None) -> str:
-        """Export data to JSON format"""
+    def export_to_json(self, data: Iterable[Dict], filename: str = None) -> str:
+        """Export data to JSON format, streaming records from any iterable"""
         if filename is None:
             filename = f"students_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         filepath = os.path.join(self.data_directory, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        if filename.endswith(('.jsonl', '.ndjson')):
+            return self.export_to_ndjson(data, filename)
+        
+        count = write_json_array(filepath, student_dicts(data))
+        
+        logger.info(f"Data exported to JSON: {filepath} ({count} records)")
+        return filepath
+    
+    def export_to_ndjson(self, data: Iterable[Dict], filename: str = None) -> str:
+        """Export data as JSON Lines, one flushed record per line; data may be a generator"""
+        if filename is None:
+            filename = f"students_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
         
-        logger.info(f"Data exported to JSON: {filepath}")
+        filepath = os.path.join(self.data_directory, filename)
+        count = write_ndjson(filepath, student_dicts(data))
+        
+        logger.info(f"Data exported to NDJSON: {filepath} ({count} records)")
         return filepath
     
     def export_to_csv(self, data: List[Dict], filename: str = None) -> str:
@@ -58,7 +98,9 @@ class StudentDataProcessor:
         filepath = os.path.join(self.data_directory, filename)
         
         if data:
-            df = pd.json_normalize(data)
+            import pandas as pd
+            
+            df = pd.json_normalize(list(student_dicts(data)))
             df.to_csv(filepath, index=False, encoding='utf-8')
             
             logger.info(f"Data exported to CSV: {filepath}")
@@ -67,77 +109,194 @@ class StudentDataProcessor:
         
         return filepath
     
-    def export_to_excel(self, data: List[Dict], filename: str = None) -> str:
-        """Export data to Excel format"""
+    def export_to_excel(self, data: Iterable[Dict], filename: str = None) -> str:
+        """
+        Export data to Excel format
+        
+        The workbook is streamed in write-only mode straight from data (which
+        may be a generator), with experience and skills on their own sheets.
+        """
         if filename is None:
             filename = f"students_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
+        from excel_export import write_excel
+        
         filepath = os.path.join(self.data_directory, filename)
+        count = write_excel(filepath, data)
         
-        if data:
-            df = pd.json_normalize(data)
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                df.to_sheet('Students', index=False)
-            
-            logger.info(f"Data exported to Excel: {filepath}")
+        if count:
+            logger.info(f"Data exported to Excel: {filepath} ({count} records)")
         else:
             logger.warning("No data to export")
         
         return filepath
     
-    def save_to_database(self, data: List[Dict], db_name: str = "students.db"):
-        """Save data to SQLite database"""
+    def export_to_parquet(self, data: Iterable[Dict], filename: str = None) -> str:
+        """
+        Export data to a columnar Parquet file (or Arrow IPC for .arrow/.feather)
+        
+        Repeated text such as college and degree is dictionary-encoded and
+        skills/experience are stored as typed list columns, so a single column
+        can later be scanned without parsing any JSON. Requires pyarrow.
+        """
+        if filename is None:
+            filename = f"students_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+        
+        from columnar_export import export_columnar
+        
+        filepath = os.path.join(self.data_directory, filename)
+        count = export_columnar(data, filepath)
+        
+        logger.info(f"Data exported to Parquet: {filepath} ({count} records)")
+        return filepath
+    
+    def load_parquet(self, filepath: str, columns: List[str] = None) -> 'pd.DataFrame':
+        """Memory-map an exported Parquet/Arrow file into a DataFrame, optionally only some columns"""
+        from columnar_export import load_columnar
+        
+        return load_columnar(filepath, columns).to_pandas()
+    
+    def save_to_database(self, data: List[Dict], db_name: str = "students.db", batch_size: int = 10000) -> int:
+        """
+        Bulk-load students into the SQLite database
+        
+        Rows are written with executemany in batches inside a single
+        transaction. A student whose key is already stored is updated in place
+        rather than inserted again, so re-running a college is idempotent. The
+        key is the profile_url, or for students without one their email, or
+        failing that their name and college.
+        
+        Args:
+            data: Student dictionaries
+            db_name: Database file inside the data directory
+            batch_size: Rows handed to each executemany call
+        
+        Returns:
+            Number of rows inserted or updated
+        """
         db_path = os.path.join(self.data_directory, db_name)
+        conn = self._get_connection(db_path)
+        
+        rows = (self._student_row(student) for student in data)
+        written = 0
+        
+        with conn:  # One transaction for the whole load; rolled back on error
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                conn.executemany(STUDENT_UPSERT_SQL, batch)
+                written += len(batch)
+        
+        logger.info(f"Data saved to database: {db_path} ({written} rows)")
+        return written
+    
+    def _get_connection(self, db_path: str) -> sqlite3.Connection:
+        """Open (once per processor) a tuned connection with the students schema in place"""
+        conn = self._db_connections.get(db_path)
+        if conn is not None:
+            return conn
         
         conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Create table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS students (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT,
-                college TEXT,
-                degree TEXT,
-                graduation_year TEXT,
-                location TEXT,
-                headline TEXT,
-                profile_url TEXT,
-                connections INTEGER,
-                skills TEXT,
-                experience TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Insert data
-        for student in data:
-            cursor.execute('''
-                INSERT INTO students (name, college, degree, graduation_year, location, 
-                                    headline, profile_url, connections, skills, experience)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                student.get('name'),
-                student.get('college'),
-                student.get('degree'),
-                student.get('graduation_year'),
-                student.get('location'),
-                student.get('headline'),
-                student.get('profile_url'),
-                student.get('connections'),
-                json.dumps(student.get('skills', [])),
-                json.dumps(student.get('experience', []))
-            ))
-        
-        conn.commit()
-        conn.close()
-        
-        logger.info(f"Data saved to database: {db_path}")
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')   # Safe with WAL; skips an fsync per commit
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-65536')    # 64 MB page cache
+        conn.execute('PRAGMA mmap_size=268435456')  # 256 MB memory-mapped I/O
+        
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS students (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT,
+                    college TEXT,
+                    degree TEXT,
+                    graduation_year TEXT,
+                    location TEXT,
+                    headline TEXT,
+                    profile_url TEXT,
+                    connections INTEGER,
+                    skills TEXT,
+                    experience TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    student_key TEXT
+                )
+            ''')
+        
+            has_unique_key = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_students_key'"
+            ).fetchone()
+            if not has_unique_key:
+                self._add_student_keys(conn, db_path)
+        
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_students_college ON students (college)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_students_graduation_year ON students (graduation_year)')
+        
+        self._db_connections[db_path] = conn
+        return conn
+    
+    def _add_student_keys(self, conn: sqlite3.Connection, db_path: str):
+        """Key the rows of a database written before student keys, keeping the newest row per key"""
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(students)')]
+        if 'student_key' not in columns:
+            conn.execute('ALTER TABLE students ADD COLUMN student_key TEXT')
+        
+        # Email was never stored, so older URL-less rows are keyed by name and college
+        rows = conn.execute('SELECT id, name, college, profile_url FROM students WHERE student_key IS NULL')
+        conn.executemany('UPDATE students SET student_key = ? WHERE id = ?',
+                         [(self._student_key({'name': name, 'college': college, 'profile_url': url}), row_id)
+                          for row_id, name, college, url in rows.fetchall()])
+        
+        removed = conn.execute('''
+            DELETE FROM students WHERE id NOT IN (SELECT MAX(id) FROM students GROUP BY student_key)
+        ''').rowcount
+        if removed:
+            logger.info(f"Removed {removed} duplicate students from {db_path}")
+        conn.execute('DROP INDEX IF EXISTS idx_students_profile_url')
+        conn.execute('CREATE UNIQUE INDEX idx_students_key ON students (student_key)')
+    
+    @staticmethod
+    def _student_key(student: Dict) -> str:
+        """Identity a stored row is upserted on: profile URL, else email, else name and college"""
+        url = (student.get('profile_url') or student.get('linkedin_url') or '').strip()
+        if url:
+            return url
+        email = (student.get('email') or '').strip().lower()
+        if email:
+            return f"email:{email}"
+        name = ' '.join((student.get('name') or '').split()).lower()
+        college = ' '.join((student.get('college') or '').split()).lower()
+        return f"name:{name}|{college}"
+    
+    @classmethod
+    def _student_row(cls, student: Dict) -> tuple:
+        """Column values for one student, in STUDENT_UPSERT_SQL order"""
+        return (
+            student.get('name'),
+            student.get('college'),
+            student.get('degree'),
+            student.get('graduation_year'),
+            student.get('location'),
+            student.get('headline'),
+            student.get('profile_url') or student.get('linkedin_url') or None,
+            student.get('connections'),
+            _encode_json(student.get('skills', [])),
+            _encode_json(student.get('experience', [])),
+            cls._student_key(student)
+        )
+    
+    def close(self):
+        """Close any open database connections"""
+        for conn in self._db_connections.values():
+            conn.close()
+        self._db_connections.clear()
 
 class AlternativeDataCollector:
     """Alternative methods for collecting student data"""
     
     def __init__(self):
+        import requests
+        
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -185,6 +344,8 @@ class AlternativeDataCollector:
             response = self.session.get(college_url, timeout=10)
             response.raise_for_status()
             
+            from bs4 import BeautifulSoup
+            
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # This would need to be customized based on each college's website structure
@@ -196,7 +357,7 @@ class AlternativeDataCollector:
             logger.error(f"Error scraping college website: {e}")
             return []
     
-    def _extract_students_from_college_page(self, soup: BeautifulSoup, college_url: str) -> List[Dict]:
+    def _extract_students_from_college_page(self, soup: 'BeautifulSoup', college_url: str) -> List[Dict]:
         """Extract student information from college webpage"""
         # Mock implementation - would need to be customized per college
         return [
@@ -208,111 +369,254 @@ class AlternativeDataCollector:
             }
         ]
 
+# LinkedIn people search, and the number of result cards on each of its pages
+LINKEDIN_SEARCH_URL = 'https://www.linkedin.com/search/results/people/'
+RESULTS_PER_PAGE = 10
+
+# Reads every result card on a page in one WebDriver call, as a list of plain
+# objects; cards missing a title, headline or location come back as null
+HARVEST_RESULTS_SCRIPT = """
+return Array.from(document.querySelectorAll('.entity-result__item'), function (card) {
+    var link = card.querySelector('.entity-result__title-text a');
+    var headline = card.querySelector('.entity-result__primary-subtitle');
+    var location = card.querySelector('.entity-result__secondary-subtitle');
+    if (!link || !headline || !location) {
+        return null;
+    }
+    return {
+        name: link.getAttribute('aria-label') || link.innerText,
+        profile_url: link.href,
+        headline: headline.innerText,
+        location: location.innerText
+    };
+});
+"""
+
+# 'script' reads a page with HARVEST_RESULTS_SCRIPT; 'elements' queries each card
+# element by element, 5 WebDriver round-trips per card
+EXTRACTION_MODES = ('script', 'elements')
+
 class SeleniumLinkedInScraper:
-    """Selenium-based LinkedIn scraper (use with caution)"""
+    """
+    Selenium-based LinkedIn scraper (use with caution)
     
-    def __init__(self, headless: bool = True):
-        self.headless = headless
-        self.driver = None
-        self.setup_driver()
+    Search result pages are spread across a BrowserPool, so several pages
+    load at once, and each page's cards are read with a single script
+    rather than element by element. Point search_url at a local server
+    (e.g. the stub providers) to run it against fixture pages instead of
+    linkedin.com.
+    """
     
-    def setup_driver(self):
-        """Setup Chrome WebDriver with options"""
-        chrome_options = Options()
+    def __init__(self, headless: bool = True, browsers: int = 1, max_pages_per_browser: int = 50,
+                 search_url: str = LINKEDIN_SEARCH_URL, page_delay: Tuple[float, float] = (1.0, 3.0),
+                 driver_factory=None, extraction: str = 'script'):
+        """
+        Initialize the scraper and warm-start its browsers
+        
+        Args:
+            headless: Run Chrome without a window
+            browsers: Number of browsers loading search pages in parallel
+            max_pages_per_browser: Pages a browser loads before it is replaced, to cap its memory
+            search_url: People search page, queried with ?keywords=...&page=N
+            page_delay: (min, max) seconds each browser waits between pages to avoid detection
+            driver_factory: Returns a new WebDriver (default: Chrome with the usual options)
+            extraction: How result cards are read, one of EXTRACTION_MODES
+        """
+        from browser_pool import BrowserPool
         
-        if self.headless:
-            chrome_options.add_argument('--headless')
+        self.headless = headless
+        self.search_url = search_url
+        if extraction not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode {extraction!r}; expected one of {EXTRACTION_MODES}")
+        self.extraction = extraction
+        self._session_cookies: List[Dict] = []
+        self._sessions = weakref.WeakSet()          # Browsers holding the current login cookies
+        self._session_lock = threading.Lock()
+        self.pool = BrowserPool(size=browsers, driver_factory=driver_factory, max_pages=max_pages_per_browser,
+                                headless=headless, page_delay=page_delay).start()
+    
+    def login_to_linkedin(self, email: str, password: str) -> bool:
+        """
+        Login to LinkedIn (use with caution - may violate ToS)
         
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        One browser logs in; the others, and every browser started later,
+        reuse its session cookies instead of logging in again.
+        """
+        if not self.pool.alive:
+            return False
         
+        with self._session_lock:
+            self._session_cookies = []
+            self._sessions = weakref.WeakSet()
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            return self.pool.submit(self._login, email, password).result()
         except Exception as e:
-            logger.error(f"Error setting up Chrome driver: {e}")
-            logger.info("Please ensure ChromeDriver is installed and in PATH")
-    
-    def login_to_linkedin(self, email: str, password: str) -> bool:
-        """Login to LinkedIn (use with caution - may violate ToS)"""
-        if not self.driver:
+            logger.error(f"Login error: {e}")
             return False
+    
+    def _login(self, driver, email: str, password: str) -> bool:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
         
         try:
-            self.driver.get('https://www.linkedin.com/login')
+            driver.get('https://www.linkedin.com/login')
             
             # Wait for login form
-            email_field = WebDriverWait(self.driver, 10).until(
+            email_field = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.ID, "username"))
             )
-            password_field = self.driver.find_element(By.ID, "password")
+            password_field = driver.find_element(By.ID, "password")
             
             email_field.send_keys(email)
             password_field.send_keys(password)
             
             # Click login button
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+            login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
             login_button.click()
             
             # Wait for successful login
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "global-nav"))
             )
             
-            logger.info("Successfully logged into LinkedIn")
-            return True
-            
         except TimeoutException:
             logger.error("Login timeout - check credentials or CAPTCHA")
             return False
-        except Exception as e:
-            logger.error(f"Login error: {e}")
-            return False
+        
+        with self._session_lock:
+            self._session_cookies = driver.get_cookies()
+            self._sessions.add(driver)
+        logger.info("Successfully logged into LinkedIn")
+        return True
+    
+    def _restore_session(self, driver):
+        """Give a browser the logged-in session's cookies if it does not have them yet"""
+        with self._session_lock:
+            if not self._session_cookies or driver in self._sessions:
+                return
+            cookies = list(self._session_cookies)
+            self._sessions.add(driver)
+        
+        # Cookies can only be set on a page of their own site
+        site = urlparse(self.search_url)
+        driver.get(f"{site.scheme}://{site.netloc}/")
+        for cookie in cookies:
+            driver.add_cookie(cookie)
     
     def search_linkedin_students(self, college_name: str, limit: int = 10) -> List[Dict]:
         """Search for students on LinkedIn using Selenium"""
-        if not self.driver:
-            return []
+        return self.search_colleges([college_name], limit).get(college_name, [])
         
-        try:
-            # Construct search URL
-            search_query = f"people students {college_name}"
-            search_url = f"https://www.linkedin.com/search/results/people/?keywords={search_query}"
-            
-            self.driver.get(search_url)
-            
-            # Wait for results to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "search-results-container"))
-            )
-            
+    def search_colleges(self, college_names: List[str], limit: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Search for students of several colleges at once
+        
+        Every result page of every college is a separate job for the browser
+        pool; once a college runs out of results its remaining pages are
+        cancelled.
+        
+        Args:
+            college_names: Colleges to search for
+            limit: Maximum students per college
+        
+        Returns:
+            {college name: [student dicts]}
+        """
+        if not self.pool.alive:
+            return {name: [] for name in college_names}
+        
+        pages = max(1, -(-limit // RESULTS_PER_PAGE))
+        futures = {name: [self.pool.submit(self._search_page, name, page) for page in range(1, pages + 1)]
+                   for name in college_names}
+        
+        results = {}
+        for name, page_futures in futures.items():
             students = []
-            results = self.driver.find_elements(By.CSS_SELECTOR, ".entity-result__item")
-            
-            for i, result in enumerate(results[:limit]):
+            for page, future in enumerate(page_futures):
                 try:
-                    student_data = self._extract_student_from_result(result, college_name)
-                    if student_data:
-                        students.append(student_data)
-                    
-                    # Add random delay to avoid detection
-                    time.sleep(random.uniform(1, 3))
-                    
+                    found, cards = future.result()
                 except Exception as e:
-                    logger.warning(f"Error extracting student {i}: {e}")
+                    logger.error(f"Error searching LinkedIn for {name} (page {page + 1}): {e}")
                     continue
-            
-            return students
-            
-        except Exception as e:
-            logger.error(f"Error searching LinkedIn: {e}")
-            return []
+                students.extend(found)
+                # Judge the end of the results by the cards shown, not the ones complete enough to keep
+                if cards < RESULTS_PER_PAGE:
+                    for later in page_futures[page + 1:]:
+                        later.cancel()
+                    break
+            results[name] = students[:limit]
+        return results
+    
+    def _search_page(self, driver, college_name: str, page: int) -> Tuple[List[Dict], int]:
+        """
+        Load one people search results page and extract its students
+        
+        Returns:
+            (students, result cards on the page, incomplete ones included)
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        self._restore_session(driver)
+        
+        # Construct search URL
+        search_query = f"people students {college_name}"
+        driver.get(f"{self.search_url}?{urlencode({'keywords': search_query, 'page': page})}")
+        
+        # Wait for results to load; pages past the last result have none
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CLASS_NAME, "search-results-container"))
+            )
+        except TimeoutException:
+            logger.debug(f"No search results for {college_name} on page {page}")
+            return [], 0
+        
+        if self.extraction == 'script':
+            return self._harvest_results(driver, college_name)
+        return self._extract_results(driver, college_name)
+    
+    def _harvest_results(self, driver, college_name: str) -> Tuple[List[Dict], int]:
+        """Students on the loaded results page, read in one execute_script round-trip, and the card count"""
+        students = []
+        cards = driver.execute_script(HARVEST_RESULTS_SCRIPT) or []
+        for card in cards:
+            if not card:
+                continue
+            students.append({
+                'name': (card.get('name') or '').strip(),
+                'college': college_name,
+                'headline': (card.get('headline') or '').strip(),
+                'location': (card.get('location') or '').strip(),
+                'profile_url': card.get('profile_url'),
+                'source': 'LinkedIn Selenium'
+            })
+        return students, len(cards)
+    
+    def _extract_results(self, driver, college_name: str) -> Tuple[List[Dict], int]:
+        """Students on the loaded results page, queried element by element, and the card count"""
+        from selenium.webdriver.common.by import By
+        
+        students = []
+        results = driver.find_elements(By.CSS_SELECTOR, ".entity-result__item")
+        for i, result in enumerate(results):
+            try:
+                student_data = self._extract_student_from_result(result, college_name)
+                if student_data:
+                    students.append(student_data)
+            except Exception as e:
+                logger.warning(f"Error extracting student {i}: {e}")
+        return students, len(results)
     
     def _extract_student_from_result(self, result_element, college_name: str) -> Optional[Dict]:
         """Extract student data from search result element"""
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import NoSuchElementException
+        
         try:
             # Extract name
             name_element = result_element.find_element(By.CSS_SELECTOR, ".entity-result__title-text a")
@@ -340,10 +644,8 @@ class SeleniumLinkedInScraper:
             return None
     
     def close(self):
-        """Close the WebDriver"""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        """Close every browser"""
+        self.pool.close()
 
 class DataAggregator:
     """Aggregate data from multiple sources"""
@@ -352,8 +654,8 @@ class DataAggregator:
         self.processor = StudentDataProcessor()
         self.google_collector = AlternativeDataCollector()
     
-    def collect_comprehensive_data(self, college_name: str, methods: List[str] = None) -> List[Dict]:
-        """Collect student data using multiple methods"""
+    def collect_comprehensive_data(self, college_name: str, methods: List[str] = None) -> List[StudentProfile]:
+        """Collect student data using multiple methods, as StudentProfile records"""
         if methods is None:
             methods = ['mock', 'google_search']  # Safe methods by default
         
@@ -364,16 +666,16 @@ class DataAggregator:
             
             if method == 'mock':
                 data = self._generate_mock_data(college_name, 5)
-                all_data.extend(data)
+                all_data.extend(StudentProfile.from_dict(item) for item in data)
             
             elif method == 'google_search':
                 data = self.google_collector.search_google_for_students(college_name)
-                all_data.extend(data)
+                all_data.extend(StudentProfile.from_dict(item) for item in data)
             
             # Add delay between methods
             time.sleep(2)
         
-        # Remove duplicates based on profile URL or name
+        # Merge duplicates found through different methods
         unique_data = self._remove_duplicates(all_data)
         
         return unique_data
@@ -438,19 +740,9 @@ class DataAggregator:
         
         return mock_data
     
-    def _remove_duplicates(self, data: List[Dict]) -> List[Dict]:
-        """Remove duplicate entries based on profile URL or name"""
-        seen = set()
-        unique_data = []
-        
-        for item in data:
-            identifier = item.get('profile_url') or item.get('name', '')
-            
-            if identifier and identifier not in seen:
-                seen.add(identifier)
-                unique_data.append(item)
-        
-        return unique_data
+    def _remove_duplicates(self, data: List[StudentProfile]) -> List[StudentProfile]:
+        """Merge entries that describe the same student, field by field"""
+        return deduplicate(data)
 
 # Example usage function
 def main():
@@ -479,6 +771,7 @@ def main():
     
     # Save to database
     processor.save_to_database(student_data)
+    processor.close()
     
     logger.info("Data collection and export completed successfully!")
     
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Student Deduplication
+Canonicalize identifiers, cluster near-duplicate profiles and merge them field by field
+"""
+
+import re
+import unicodedata
+import logging
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+from urllib.parse import unquote
+
+from response_cache import normalize_profile_url
+from json_stream import NDJSONWriter, read_ndjson
+from student_record import StudentProfile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW = 8          # Sorted-neighbourhood window: each record is compared with the next 7
+
+_QUALITY_RANK = {'high': 3, 'medium': 2, 'low': 1}
+_NAME_TITLES = {'mr', 'mrs', 'ms', 'miss', 'dr', 'prof', 'er'}
+_COLLEGE_STOPWORDS = {'of', 'the', 'and', 'at'}
+_GMAIL_DOMAINS = {'gmail.com', 'googlemail.com'}
+
+def canonical_profile_url(url: str) -> Optional[str]:
+    """
+    Canonical form of a LinkedIn profile URL for identity comparisons
+    
+    Builds on normalize_profile_url (scheme, www., trailing slash, query,
+    case) and also folds country subdomains like in.linkedin.com, a missing
+    scheme and percent-encoding.
+    """
+    if not url or not url.strip():
+        return None
+    url = unquote(url.strip())
+    if '://' not in url:
+        url = f"https://{url}"
+    normalized = normalize_profile_url(url)
+    return re.sub(r'^https://[a-z]{2,3}\.linkedin\.com/', 'https://linkedin.com/', normalized)
+
+def canonical_email(email: str) -> Optional[str]:
+    """Lower-case an email and drop +tags (and, for Gmail, dots) from the local part"""
+    if not email or '@' not in email:
+        return None
+    local, _, domain = email.strip().lower().rpartition('@')
+    local = local.split('+', 1)[0]
+    if domain in _GMAIL_DOMAINS:
+        local = local.replace('.', '')
+        domain = 'gmail.com'
+    return f"{local}@{domain}" if local else None
+
+def name_tokens(record: Any) -> Tuple[str, ...]:
+    """Accent-free lower-case name tokens from name or first_name/last_name, without titles"""
+    name = record.get('name') or ' '.join(filter(None, (record.get('first_name'), record.get('last_name'))))
+    if not name:
+        return ()
+    text = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii').lower()
+    return tuple(token for token in re.findall(r'[a-z0-9]+', text) if token not in _NAME_TITLES)
+
+def college_key(college: str) -> str:
+    """College name reduced to its significant lower-case words"""
+    if not college:
+        return ''
+    return ' '.join(word for word in re.findall(r'[a-z0-9]+', college.lower()) if word not in _COLLEGE_STOPWORDS)
+
+def record_keys(record: Any) -> List[str]:
+    """
+    Exact identity keys for a profile: canonical URL and canonical email
+    
+    Two profiles that share a key are the same person. Names are not keys:
+    two students at one college can share a name, so name matches are only
+    resolved by Deduplicator, which checks URLs and emails first.
+    """
+    keys = []
+    url = canonical_profile_url(record.get('linkedin_url') or record.get('profile_url'))
+    if url:
+        keys.append(f"url:{url}")
+    email = canonical_email(record.get('email'))
+    if email:
+        keys.append(f"email:{email}")
+    return keys
+
+def _token_matches(token: str, other: str) -> bool:
+    return token == other or (len(token) == 1 and other.startswith(token)) or (len(other) == 1 and token.startswith(other))
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """Whether b is a single insertion, deletion, substitution or adjacent swap away from a"""
+    if abs(len(a) - len(b)) > 1 or min(len(a), len(b)) < 4 or not (a.isalpha() and b.isalpha()):
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    if a[i + 1:] == b[i + 1:]:
+        return True
+    return i + 1 < len(a) and a[i] == b[i + 1] and a[i + 1] == b[i] and a[i + 2:] == b[i + 2:]
+
+def names_match(a: Tuple[str, ...], b: Tuple[str, ...]) -> bool:
+    """
+    Whether two token lists plausibly name the same person
+    
+    Every token of the shorter name must match a distinct token of the longer
+    one, exactly or as an initial ('p sharma' ~ 'priya sharma'), in any order.
+    A single-token name only matches the identical single token. Names with
+    the same tokens but one typo ('priya sharmaa') also match.
+    """
+    if not a or not b:
+        return False
+    if a == b:
+        return True
+    short, long = (a, b) if len(a) <= len(b) else (b, a)
+    if len(short) >= 2:
+        remaining = list(long)
+        for token in short:
+            for i, other in enumerate(remaining):
+                if _token_matches(token, other):
+                    del remaining[i]
+                    break
+            else:
+                break
+        else:
+            return True
+    if len(a) != len(b):
+        return False
+    differing = [(x, y) for x, y in zip(sorted(a), sorted(b)) if x != y]
+    return len(differing) == 1 and _one_edit_apart(*differing[0])
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == '' or value == [] or value == {}
+
+def _item_key(item: Any) -> Any:
+    if isinstance(item, dict):
+        return tuple(sorted((k, str(v).strip().lower()) for k, v in item.items() if not _is_empty(v)))
+    return str(item).strip().lower() if isinstance(item, str) else item
+
+def _union_lists(current: List[Any], extra: List[Any]) -> List[Any]:
+    merged = list(current)
+    seen = {_item_key(item) for item in merged}
+    for item in extra:
+        key = _item_key(item)
+        if key not in seen:
+            seen.add(key)
+            merged.append(item)
+    return merged
+
+def merge_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge duplicate profile dictionaries field by field
+    
+    Records are ranked by data_quality and then by how many fields they fill.
+    Each scalar field takes the first non-empty value in that order. List
+    fields (skills, experience, education) are unioned without repeats.
+    
+    Args:
+        records: Profiles of the same person
+    
+    Returns:
+        One merged profile dictionary
+    """
+    if len(records) == 1:
+        return dict(records[0])
+    ranked = sorted(records, key=lambda record: (_QUALITY_RANK.get(record.get('data_quality'), 0),
+                                                sum(1 for value in record.values() if not _is_empty(value))),
+                    reverse=True)
+    merged: Dict[str, Any] = {}
+    for record in ranked:
+        for key, value in record.items():
+            current = merged.get(key)
+            if key not in merged or (_is_empty(current) and not _is_empty(value)):
+                merged[key] = value
+            elif isinstance(current, list) and isinstance(value, list) and value:
+                merged[key] = _union_lists(current, value)
+    return merged
+
+class IdentityIndex:
+    """
+    Profiles accepted by a streaming fetch, indexed by their exact identity keys
+    
+    A profile that shares a canonical URL or email with an accepted one is
+    merged into it in place, so a reference already yielded or written
+    elsewhere sees the combined fields. Name matches are left to a final
+    deduplicate() pass.
+    """
+    
+    def __init__(self):
+        self.profiles: List[Dict[str, Any]] = []
+        self.merged = 0
+        self._by_key: Dict[str, Dict[str, Any]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.profiles)
+    
+    def add(self, profile: Dict[str, Any], accept_new: bool = True) -> bool:
+        """
+        Accept a profile, or merge it into the accepted profile it duplicates
+        
+        Args:
+            profile: Profile dictionary
+            accept_new: Whether a profile that duplicates nothing may be added
+                (False once the fetch has all the students it wants)
+        
+        Returns:
+            True if the profile was added as a new person
+        """
+        keys = record_keys(profile)
+        existing = next((self._by_key[key] for key in keys if key in self._by_key), None)
+        if existing is None:
+            if not accept_new:
+                return False
+            self.profiles.append(profile)
+            for key in keys:
+                self._by_key[key] = profile
+            return True
+        
+        merged = merge_records([existing, profile])
+        existing.clear()
+        existing.update(merged)
+        for key in record_keys(existing):
+            self._by_key.setdefault(key, existing)
+        self.merged += 1
+        return False
+
+class Deduplicator:
+    """
+    Entity resolution over any number of profiles in near-linear time
+    
+    add() canonicalizes each profile's URL and email and joins it at once with
+    any earlier profile sharing either. clusters() then runs sorted-neighbourhood
+    passes: profiles are sorted by (college, name tokens) and by (college,
+    surname-first tokens), and each is compared only with its next few
+    neighbours. Matching names join the same cluster unless that would put
+    two different LinkedIn URLs, or two different emails, in it: a name
+    alone never outweighs a conflicting identifier. Only compact keys are
+    kept per profile, so the records themselves can stay on disk.
+    """
+    
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        """
+        Initialize the deduplicator
+        
+        Args:
+            window: Sorted-neighbourhood window size; larger catches more
+                near-duplicates at proportionally more comparisons
+        """
+        self.window = max(2, window)
+        self._parent: List[int] = []
+        self._size: List[int] = []
+        self._cluster_url: Dict[int, str] = {}
+        self._cluster_email: Dict[int, str] = {}
+        self._exact: Dict[str, int] = {}
+        self._names: List[Tuple[str, Tuple[str, ...]]] = []
+    
+    def __len__(self) -> int:
+        return len(self._parent)
+    
+    def add(self, record: Any) -> int:
+        """
+        Register one profile (dictionary or StudentProfile)
+        
+        Returns:
+            The profile's index, in insertion order
+        """
+        index = len(self._parent)
+        self._parent.append(index)
+        self._size.append(1)
+        
+        url = canonical_profile_url(record.get('linkedin_url') or record.get('profile_url'))
+        if url:
+            self._cluster_url[index] = url
+        self._names.append((college_key(record.get('college')), name_tokens(record)))
+        
+        email = canonical_email(record.get('email'))
+        if email:
+            self._cluster_email[index] = email
+        for key in (f"url:{url}" if url else None, f"email:{email}" if email else None):
+            if key is None:
+                continue
+            first = self._exact.setdefault(key, index)
+            if first != index:
+                self._union(first, index, check_identity=False)
+        return index
+    
+    def _find(self, index: int) -> int:
+        root = index
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[index] != root:
+            self._parent[index], index = root, self._parent[index]
+        return root
+    
+    def _union(self, a: int, b: int, check_identity: bool = True) -> bool:
+        """Join two clusters; a name-based join (check_identity) is refused if their URLs or emails differ"""
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a == root_b:
+            return True
+        if check_identity:
+            for identifiers in (self._cluster_url, self._cluster_email):
+                value_a, value_b = identifiers.get(root_a), identifiers.get(root_b)
+                if value_a and value_b and value_a != value_b:
+                    return False
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        for identifiers in (self._cluster_url, self._cluster_email):
+            value = identifiers.pop(root_b, None)
+            if value and root_a not in identifiers:
+                identifiers[root_a] = value
+        return True
+    
+    def _neighbourhood_pass(self, sort_keys: List[Tuple[str, str, int]]):
+        sort_keys.sort()
+        for position, (college, _, index) in enumerate(sort_keys):
+            tokens = self._names[index][1]
+            for other_college, _, other in sort_keys[position + 1:position + self.window]:
+                if college and other_college and college != other_college:
+                    break
+                if names_match(tokens, self._names[other][1]):
+                    self._union(index, other)
+    
+    def clusters(self) -> List[int]:
+        """
+        Resolve near-duplicates
+        
+        Returns:
+            The cluster root of every profile, by index
+        """
+        named = [(college, tokens, index) for index, (college, tokens) in enumerate(self._names) if tokens]
+        self._neighbourhood_pass([(college, ' '.join(sorted(tokens)), index) for college, tokens, index in named])
+        self._neighbourhood_pass([(college, ' '.join(reversed(tokens)), index) for college, tokens, index in named])
+        return [self._find(index) for index in range(len(self._parent))]
+
+def deduplicate(records: Iterable[Any], window: int = DEFAULT_WINDOW) -> List[Any]:
+    """
+    Merge duplicate profiles in memory
+    
+    Args:
+        records: Profile dictionaries or StudentProfile records
+        window: Sorted-neighbourhood window size
+    
+    Returns:
+        One merged profile per person, ordered by first appearance and of the
+        same type as the input
+    """
+    records = list(records)
+    deduplicator = Deduplicator(window)
+    for record in records:
+        deduplicator.add(record)
+    
+    groups: Dict[int, List[int]] = {}
+    for index, root in enumerate(deduplicator.clusters()):
+        groups.setdefault(root, []).append(index)
+    
+    unique = []
+    for members in sorted(groups.values(), key=lambda members: members[0]):
+        if len(members) == 1:
+            unique.append(records[members[0]])
+            continue
+        group = [records[index] for index in members]
+        if isinstance(group[0], StudentProfile):
+            unique.append(StudentProfile.from_dict(merge_records([record.to_dict() for record in group])))
+        else:
+            unique.append(merge_records(group))
+    
+    logger.info(f"Merged {len(records) - len(unique)} duplicates from {len(records)} profiles")
+    return unique
+
+def deduplicate_files(paths: List[str], output_path: str, window: int = DEFAULT_WINDOW) -> Tuple[int, int]:
+    """
+    Deduplicate stored crawls (JSON Lines files) into one merged file
+    
+    The first pass keeps only identity keys in memory. The second pass streams
+    the profiles again, writes unique ones straight through and holds a
+    duplicate only until the rest of its cluster has been read.
+    
+    Args:
+        paths: NDJSON files written by the fetchers
+        output_path: Merged NDJSON output
+        window: Sorted-neighbourhood window size
+    
+    Returns:
+        (profiles read, profiles written)
+    """
+    def stream():
+        for path in paths:
+            yield from read_ndjson(path)
+    
+    deduplicator = Deduplicator(window)
+    for record in stream():
+        deduplicator.add(record)
+    roots = deduplicator.clusters()
+    
+    sizes: Dict[int, int] = {}
+    for root in roots:
+        sizes[root] = sizes.get(root, 0) + 1
+    
+    pending: Dict[int, List[Dict[str, Any]]] = {}
+    with NDJSONWriter(output_path) as writer:
+        for index, record in enumerate(stream()):
+            root = roots[index]
+            if sizes[root] == 1:
+                writer.write(record)
+                continue
+            group = pending.setdefault(root, [])
+            group.append(record)
+            if len(group) == sizes[root]:
+                writer.write(merge_records(pending.pop(root)))
+        written = writer.count
+    
+    logger.info(f"Deduplicated {len(roots)} profiles from {len(paths)} files into {written} in {output_path}")
+    return len(roots), written
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Bulk Email Verification
+Verify thousands of addresses through Hunter.io concurrently, skipping recently verified ones
+"""
+
+import os
+import csv
+import json
+import time
+import sqlite3
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Optional, Any, Iterable, Iterator
+
+from hunter_api_client import HunterAPIClient
+from json_stream import NDJSONWriter, read_ndjson
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERIFICATION_TTL = 30 * 24 * 3600     # Mailbox status rarely changes within a month
+
+def normalize_email(email: Any) -> Optional[str]:
+    """Lowercased, trimmed address, or None if it cannot be an email address"""
+    if not isinstance(email, str):
+        return None
+    email = email.strip().lower()
+    local, _, domain = email.partition('@')
+    if not local or '.' not in domain or ' ' in email:
+        return None
+    return email
+
+def read_emails(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Stream addresses out of stored files
+    
+    JSON Lines and JSON files contribute the 'email' field of each record, CSV
+    files their 'email' column, and any other file one address per line.
+    """
+    for path in paths:
+        extension = os.path.splitext(path)[1].lower()
+        if extension in ('.jsonl', '.ndjson'):
+            for record in read_ndjson(path):
+                yield record.get('email')
+        elif extension == '.json':
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            for record in data if isinstance(data, list) else [data]:
+                yield record.get('email') if isinstance(record, dict) else record
+        elif extension == '.csv':
+            with open(path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    yield row.get('email')
+        else:
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    yield line.strip()
+
+class VerificationCache:
+    """On-disk record of every verification result, so an address is paid for once per TTL"""
+    
+    def __init__(self, path: str = "cache/verifications.db", ttl: float = DEFAULT_VERIFICATION_TTL):
+        """
+        Initialize the cache
+        
+        Args:
+            path: SQLite database file
+            ttl: Seconds a verification result stays fresh
+        """
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS verifications (
+                email TEXT PRIMARY KEY,
+                status TEXT,
+                result TEXT,
+                score INTEGER,
+                data TEXT,
+                verified_at REAL
+            )
+        ''')
+        self._conn.commit()
+    
+    def get(self, email: str) -> Optional[Dict[str, Any]]:
+        """Cached verification data for an address, or None if absent or older than the TTL"""
+        with self._lock:
+            row = self._conn.execute('SELECT data, verified_at FROM verifications WHERE email = ?',
+                                     (email,)).fetchone()
+            if row is None or time.time() - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+        data = json.loads(row[0])
+        data['verified_at'] = row[1]
+        return data
+    
+    def put(self, email: str, data: Dict[str, Any]) -> float:
+        """Store the verification data Hunter.io returned for an address; returns the verification time"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO verifications (email, status, result, score, data, verified_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (email, data.get('status'), data.get('result'), data.get('score'), json.dumps(data), now))
+            self._conn.commit()
+        return now
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and number of addresses per status"""
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM verifications GROUP BY status').fetchall()
+        return {'hits': self.hits, 'misses': self.misses, 'statuses': dict(rows)}
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+class BulkEmailVerifier:
+    """
+    Verify a stream of addresses under Hunter.io's rate limit
+    
+    Addresses are normalized and deduplicated on the way in, fresh cached
+    results are returned without a request, and the rest go through a
+    thread pool whose requests share the client's rate limiter. At most a
+    few batches of addresses are in flight at once, so memory stays flat
+    however long the input is, and every result is cached the moment it
+    arrives: an interrupted overnight run picks up where it stopped.
+    """
+    
+    def __init__(self, client: HunterAPIClient = None, cache: VerificationCache = None, max_workers: int = 4):
+        """
+        Initialize the verifier
+        
+        Args:
+            client: Hunter.io client whose key and rate limiter are used (defaults to one from HUNTER_API_KEY)
+            cache: Store of earlier results (None verifies every address)
+            max_workers: Concurrent verification requests
+        """
+        self.client = client or HunterAPIClient()
+        self.cache = cache
+        self.max_workers = max_workers
+        self.stats = {'addresses': 0, 'duplicates': 0, 'invalid': 0, 'cached': 0, 'verified': 0, 'failed': 0}
+        self._lock = threading.Lock()
+    
+    def verify(self, emails: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Verify addresses, yielding results as they complete
+        
+        Args:
+            emails: Addresses in any form; invalid and repeated ones are skipped
+        
+        Yields:
+            {'email', 'status', 'result', 'score', 'verified_at', 'from_cache', 'error'}
+            per unique address, in completion order
+        """
+        seen = set()
+        max_pending = self.max_workers * 4
+        pending = set()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for raw in emails:
+                self._count('addresses')
+                email = normalize_email(raw)
+                if email is None:
+                    self._count('invalid')
+                    continue
+                if email in seen:
+                    self._count('duplicates')
+                    continue
+                seen.add(email)
+                
+                cached = self.cache.get(email) if self.cache is not None else None
+                if cached is not None:
+                    self._count('cached')
+                    yield self._result(email, cached, cached['verified_at'], True)
+                    continue
+                
+                pending.add(executor.submit(self._verify_one, email))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            
+            for future in pending:
+                yield future.result()
+        
+        logger.info(f"Email verification finished: {self.stats}")
+    
+    def verify_to_file(self, emails: Iterable[str], output_path: str, append: bool = False) -> Dict[str, int]:
+        """
+        Verify addresses and stream each result to a JSON Lines file
+        
+        Args:
+            emails: Addresses in any form
+            output_path: NDJSON output file
+            append: Add to an existing file instead of replacing it
+        
+        Returns:
+            Counters for this run
+        """
+        with NDJSONWriter(output_path, append=append) as writer:
+            for result in self.verify(emails):
+                writer.write(result)
+                if writer.count % 1000 == 0:
+                    logger.info(f"Verified {writer.count} addresses: {self.stats}")
+        return dict(self.stats)
+    
+    def _verify_one(self, email: str) -> Dict[str, Any]:
+        """Send one verification request; failures are reported, not cached"""
+        response = self.client.verify_email(email)
+        data = response.get('data') or {}
+        if not data.get('status'):
+            # Request failed, or Hunter is still verifying (202): leave it for the next run
+            self._count('failed')
+            return self._result(email, data, None, False, error='verification unavailable')
+        
+        self._count('verified')
+        verified_at = self.cache.put(email, data) if self.cache is not None else time.time()
+        return self._result(email, data, verified_at, False)
+    
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+    
+    @staticmethod
+    def _result(email: str, data: Dict[str, Any], verified_at: Optional[float], from_cache: bool,
+                error: str = None) -> Dict[str, Any]:
+        return {
+            'email': email,
+            'status': data.get('status'),
+            'result': data.get('result'),
+            'score': data.get('score'),
+            'verified_at': verified_at,
+            'from_cache': from_cache,
+            'error': error
+        }
@@ -4,6 +4,8 @@ Example Usage of LinkedIn Student Fetcher
 Shows different ways to use the application
 """
 
+import logging
+
 from linkedin_student_fetcher import LinkedInStudentFetcher
 
 def main():
@@ -74,4 +76,5 @@ def main():
     print(f"📁 Check the current directory for exported files.")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     main()
\ No newline at end of file
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Excel Export
+Stream student records into an .xlsx workbook in constant memory with openpyxl's write-only mode
+"""
+
+import os
+import logging
+from typing import Dict, List, Any, Iterable
+
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+logger = logging.getLogger(__name__)
+
+STUDENT_COLUMNS = ['name', 'college', 'degree', 'graduation_year', 'location', 'headline',
+                   'profile_url', 'email', 'connections', 'student_status', 'method', 'source', 'data_quality']
+EXPERIENCE_COLUMNS = ['profile_url', 'title', 'company', 'duration', 'description']
+SKILL_COLUMNS = ['profile_url', 'skill']
+
+MAX_SHEET_ROWS = 1048576    # Excel's hard limit, header included
+MAX_CELL_LENGTH = 32767
+
+def _cell(value: Any) -> Any:
+    """Coerce a value into something a worksheet cell accepts"""
+    if value is None or isinstance(value, (int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        value = ', '.join(str(item) for item in value)
+    text = ILLEGAL_CHARACTERS_RE.sub('', str(value))
+    return text[:MAX_CELL_LENGTH]
+
+class _SheetStream:
+    """A write-only sheet that continues on 'Title 2', 'Title 3', ... once Excel's row limit is reached"""
+    
+    def __init__(self, workbook: Workbook, title: str, header: List[str]):
+        self.workbook = workbook
+        self.title = title
+        self.header = header
+        self.rows = 0
+        self._parts = 0
+        self._sheet = None
+        self._rows_in_sheet = MAX_SHEET_ROWS
+    
+    def append(self, row: List[Any]):
+        if self._rows_in_sheet >= MAX_SHEET_ROWS:
+            self._parts += 1
+            title = self.title if self._parts == 1 else f"{self.title} {self._parts}"
+            self._sheet = self.workbook.create_sheet(title)
+            self._sheet.append(self.header)
+            self._rows_in_sheet = 1
+        self._sheet.append(row)
+        self._rows_in_sheet += 1
+        self.rows += 1
+
+def write_excel(path: str, records: Iterable[Dict[str, Any]]) -> int:
+    """
+    Stream records into a workbook with Students, Experience and Skills sheets
+    
+    Rows are serialized to disk as they are appended, so memory use stays flat
+    however many students are written and records may come from a generator.
+    Experience entries and skills get one row each, keyed by profile_url.
+    
+    Args:
+        path: Output .xlsx file
+        records: Student dictionaries; consumed lazily
+    
+    Returns:
+        Number of students written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    workbook = Workbook(write_only=True)
+    students = _SheetStream(workbook, 'Students', STUDENT_COLUMNS)
+    experience = _SheetStream(workbook, 'Experience', EXPERIENCE_COLUMNS)
+    skills = _SheetStream(workbook, 'Skills', SKILL_COLUMNS)
+    
+    for record in records:
+        profile_url = _cell(record.get('profile_url') or record.get('linkedin_url'))
+        row = [_cell(record.get(column)) for column in STUDENT_COLUMNS]
+        row[STUDENT_COLUMNS.index('profile_url')] = profile_url
+        students.append(row)
+        
+        for entry in record.get('experience') or []:
+            if isinstance(entry, dict):
+                experience.append([profile_url] + [_cell(entry.get(column)) for column in EXPERIENCE_COLUMNS[1:]])
+        
+        for skill in record.get('skills') or []:
+            skills.append([profile_url, _cell(skill)])
+    
+    # Keep the three sheets present even when there was nothing to put in them
+    for sheet in (students, experience, skills):
+        if sheet.rows == 0:
+            workbook.create_sheet(sheet.title).append(sheet.header)
+    
+    workbook.save(path)
+    logger.info(f"Wrote {students.rows} students, {experience.rows} experience rows "
+                f"and {skills.rows} skills to {path}")
+    return students.rows
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Transport
+Pooled keep-alive sessions shared by the Hunter, scraping and LinkedIn API clients
+"""
+
+import threading
+import logging
+from typing import Dict, Any, Optional, Union, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 10   # Number of hosts to keep a connection pool for
+DEFAULT_POOL_MAXSIZE = 20       # Keep-alive connections kept open per host
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+class PooledTransport:
+    """requests.Session wrapper with a sized per-host connection pool and connection-reuse metrics"""
+    
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT, read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 headers: Dict[str, str] = None):
+        """
+        Initialize the transport
+        
+        Args:
+            pool_connections: Number of distinct hosts to cache connection pools for
+            pool_maxsize: Maximum keep-alive connections per host; size this to the
+                highest concurrency any client uses against one host
+            connect_timeout: Seconds to wait for TCP/TLS connection setup
+            read_timeout: Default seconds to wait for a response
+            headers: Headers sent with every request
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session = requests.Session()
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        if headers:
+            self.session.headers.update(headers)
+    
+    def request(self, method: str, url: str, timeout: Union[float, Tuple[float, float]] = None,
+                **kwargs) -> requests.Response:
+        """
+        Send a request over the pooled session
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Read timeout in seconds, or a (connect, read) tuple; the
+                transport's defaults are used when omitted
+            **kwargs: Passed through to requests.Session.request
+        
+        Returns:
+            The response; errors raise requests exceptions exactly like requests.get
+        """
+        if timeout is None:
+            timeout = (self.connect_timeout, self.read_timeout)
+        elif not isinstance(timeout, tuple):
+            timeout = (self.connect_timeout, timeout)
+        
+        return self.session.request(method, url, timeout=timeout, **kwargs)
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+    
+    def connection_stats(self) -> Dict[str, Any]:
+        """
+        Report how many connections were opened versus requests sent
+        
+        Returns:
+            Dictionary with per-host and total connection/request counts and the
+            share of requests that reused an existing keep-alive connection
+        """
+        hosts = {}
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.host}:{pool.port}" if pool.port else pool.host
+            entry = hosts.setdefault(host, {'connections_opened': 0, 'requests': 0})
+            entry['connections_opened'] += pool.num_connections
+            entry['requests'] += pool.num_requests
+        
+        connections = sum(entry['connections_opened'] for entry in hosts.values())
+        requests_sent = sum(entry['requests'] for entry in hosts.values())
+        reused = max(requests_sent - connections, 0)
+        
+        return {
+            'hosts': hosts,
+            'connections_opened': connections,
+            'requests': requests_sent,
+            'reused_requests': reused,
+            'reuse_ratio': round(reused / requests_sent, 3) if requests_sent else 0.0
+        }
+    
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+_shared_transport: Optional[PooledTransport] = None
+_shared_lock = threading.Lock()
+
+def get_transport() -> PooledTransport:
+    """Return the process-wide transport, creating it on first use"""
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = PooledTransport()
+        return _shared_transport
+
+def configure_transport(**kwargs) -> PooledTransport:
+    """
+    Replace the process-wide transport with one built from the given settings
+    
+    Clients created afterwards pick up the new transport; existing clients keep theirs.
+    The old transport is not closed, since those clients may still be using it: its
+    connections are released once the last client holding it is garbage collected.
+    
+    Args:
+        **kwargs: PooledTransport constructor arguments
+    
+    Returns:
+        The new shared transport
+    """
+    global _shared_transport
+    with _shared_lock:
+        _shared_transport = PooledTransport(**kwargs)
+        logger.info(f"Configured shared HTTP transport: {kwargs}")
+        return _shared_transport
@@ -6,26 +6,57 @@ Find student email addresses and LinkedIn profiles from colleges using Hunter.io
 
 import requests
 import json
-import time
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
-from urllib.parse import quote_plus
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from http_transport import PooledTransport, get_transport
+from rate_limiter import RateLimiter, get_rate_limiter
+from hunter_cache import DomainSearchCache
+from college_registry import CollegeRegistry
+from telemetry import Telemetry, get_telemetry
 
 logger = logging.getLogger(__name__)
 
+DOMAIN_SEARCH_PAGE_SIZE = 100   # Largest page the domain-search endpoint returns
+
 class HunterAPIClient:
     """Hunter.io API client for finding email addresses and LinkedIn profiles"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, transport: PooledTransport = None, rate_limiter: RateLimiter = None,
+                 cache: DomainSearchCache = None, page_size: int = DOMAIN_SEARCH_PAGE_SIZE,
+                 max_concurrency: int = 4, request_budget: int = None, base_url: str = None,
+                 telemetry: Telemetry = None):
         """
         Initialize Hunter API client
         
         Args:
             api_key: Hunter.io API key (get from https://hunter.io/api-keys)
+            transport: HTTP transport to send requests through (defaults to the shared pool)
+            rate_limiter: Pacing and retry policy for requests (defaults to the shared Hunter.io limiter)
+            cache: Persistent cache of domain search results (None disables caching)
+            page_size: Results requested per domain-search call (plans below Starter allow 10)
+            max_concurrency: Domain-search pages fetched at once
+            request_budget: Maximum number of domain-search requests this client may send (None = unlimited)
+            base_url: Override the API endpoint (e.g. a local stub server; defaults to HUNTER_API_URL)
+            telemetry: Recorder for request metrics (defaults to the process-wide one)
         """
         self.api_key = api_key or os.getenv('HUNTER_API_KEY')
-        self.base_url = "https://api.hunter.io/v2"
+        self.base_url = base_url or os.getenv('HUNTER_API_URL') or "https://api.hunter.io/v2"
+        self.transport = transport or get_transport()
+        self.rate_limiter = rate_limiter or get_rate_limiter('hunter')
+        self.cache = cache
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self.request_budget = request_budget
+        self.requests_sent = 0
+        self._budget_lock = threading.Lock()
+        self.telemetry = telemetry or get_telemetry()
+        self._send_domain_search = self.telemetry.instrument(self.transport.get, 'hunter', 'domain-search')
+        self._send_email_finder = self.telemetry.instrument(self.transport.get, 'hunter', 'email-finder')
+        self._send_email_verifier = self.telemetry.instrument(self.transport.get, 'hunter', 'email-verifier')
         
         if not self.api_key:
             logger.warning("No Hunter API key provided. Please get one from https://hunter.io/api-keys")
@@ -41,35 +72,181 @@ class HunterAPIClient:
         Returns:
             Dictionary containing email data
         """
+        data = self.search_domain(domain, limit)
+        if data.get('data', {}).get('emails'):
+            return data
+        logger.warning(f"No emails found for domain: {domain}")
+        return {}
+    
+    def search_domain(self, domain: str, limit: int = 100) -> Dict[str, Any]:
+        """
+        Enumerate up to limit email addresses at a domain, page by page
+        
+        The first page tells how many results Hunter has; the remaining pages
+        are then fetched concurrently, within the request budget. With a cache,
+        a fresh domain costs no requests (or only the pages beyond what was
+        enumerated before), and a stale one is revalidated with a single
+        first-page request: if its ETag matches, or its total and addresses
+        are unchanged, the cached enumeration is kept.
+        
+        Args:
+            domain: College domain (e.g., 'hkbk.edu.in')
+            limit: Maximum number of emails to retrieve
+        
+        Returns:
+            Hunter-shaped dictionary ({'data': {'domain', 'emails'}, 'meta': {...}});
+            meta also reports 'requests' (paid calls sent, including failed ones),
+            'failed_requests' (those that got no usable answer) and 'from_cache'.
+            'emails' is empty when nothing was found or the API failed.
+        """
         if not self.api_key:
             logger.error("Hunter API key is required")
-            return {}
+            return self._domain_result(domain, [], 0, 0, 0, False)
+        
+        cached = self.cache.get(domain) if self.cache is not None else None
+        requests_made = 0
+        failed = 0
+        
+        if cached and cached['fresh']:
+            emails = self.cache.emails(domain, limit)
+            total = cached['total']
+            offset = cached['enumerated']
+        else:
+            first_page = min(limit, self.page_size)
+            headers = {'If-None-Match': cached['etag']} if cached and cached['etag'] else None
+            page = None
+            if self._reserve_request(domain, 0):
+                page, total, etag, not_modified = self._domain_page(domain, 0, first_page, headers)
+                requests_made += 1
+                failed += page is None
+            
+            if page is None:
+                # Request failed or budget spent: serve the stale enumeration if there is one
+                emails = self.cache.emails(domain, limit) if cached else []
+                return self._domain_result(domain, emails, cached['total'] if cached else 0, requests_made, failed,
+                                           bool(cached))
+            
+            if cached and (not_modified or self._unchanged(domain, cached, page, total)):
+                logger.info(f"Hunter.io results for {domain} unchanged; keeping cached enumeration")
+                self.cache.touch(domain)
+                emails = self.cache.emails(domain, limit)
+                total = cached['total']
+                offset = cached['enumerated']
+            else:
+                if self.cache is not None:
+                    self.cache.start(domain, total, etag)
+                    self.cache.store(domain, 0, page)
+                emails = page
+                offset = len(page)
+        
+        target = min(limit, total)
+        if len(emails) < target and offset < target:
+            more, sent, page_failures = self._fetch_pages(domain, offset, target)
+            requests_made += sent
+            failed += page_failures
+            if more and self.cache is not None:
+                self.cache.store(domain, offset, more)
+            emails = emails + more
+        
+        logger.info(f"Found {len(emails)} of {total} emails for {domain} ({requests_made} requests, {failed} failed)")
+        return self._domain_result(domain, emails[:limit], total, requests_made, failed, requests_made == 0)
+    
+    def _fetch_pages(self, domain: str, offset: int, target: int) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Fetch results offset..target concurrently
+        
+        Returns:
+            The contiguous results from offset up to the first failed or short
+            page, the number of requests sent (failed ones are still billed)
+            and how many of those failed
+        """
+        offsets = list(range(offset, target, self.page_size))
+        if self.request_budget is not None:
+            remaining = max(self.request_budget - self.requests_sent, 0)
+            if len(offsets) > remaining:
+                logger.warning(f"Hunter.io request budget allows {remaining} of {len(offsets)} remaining pages for {domain}")
+                offsets = offsets[:remaining]
+        if not offsets:
+            return [], 0, 0
+        workers = min(self.max_concurrency, len(offsets))
+        
+        def fetch(page_offset: int):
+            if not self._reserve_request(domain, page_offset):
+                return None, False
+            return self._domain_page(domain, page_offset, min(self.page_size, target - page_offset))[0], True
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch, offsets))
+        pages = [page for page, _ in results]
+        sent = sum(1 for _, dispatched in results if dispatched)
+        failed = sum(1 for page, dispatched in results if dispatched and page is None)
+        
+        emails = []
+        for page_offset, page in zip(offsets, pages):
+            if page is None:
+                break
+            emails.extend(page)
+            if len(page) < min(self.page_size, target - page_offset):
+                break
+        return emails, sent, failed
+    
+    def _domain_page(self, domain: str, offset: int, limit: int,
+                     headers: Dict[str, str] = None) -> Tuple[Optional[List[Dict[str, Any]]], int, Optional[str], bool]:
+        """
+        Send one domain-search request, already reserved against the budget
         
+        Returns:
+            (emails or None on failure, total results, ETag, not modified)
+        """
         url = f"{self.base_url}/domain-search"
         params = {
             'domain': domain,
             'api_key': self.api_key,
             'limit': limit,
+            'offset': offset,
             'email_type': 'generic'
         }
         
         try:
-            logger.info(f"Searching emails for domain: {domain}")
-            response = requests.get(url, params=params, timeout=30)
+            logger.info(f"Searching emails for domain: {domain} (offset {offset})")
+            response = self.rate_limiter.send(self._send_domain_search, url, params=params, headers=headers, timeout=30)
+            if response.status_code == 304:
+                return [], 0, response.headers.get('ETag'), True
             response.raise_for_status()
             
             data = response.json()
-            
-            if data.get('data', {}).get('emails'):
-                logger.info(f"Found {len(data['data']['emails'])} emails for {domain}")
-                return data
-            else:
-                logger.warning(f"No emails found for domain: {domain}")
-                return {}
+            emails = data.get('data', {}).get('emails') or []
+            total = data.get('meta', {}).get('results', offset + len(emails))
+            return emails, total, response.headers.get('ETag'), False
                 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error searching Hunter API: {e}")
-            return {}
+            return None, 0, None, False
+    
+    def _unchanged(self, domain: str, cached: Dict[str, Any], page: List[Dict[str, Any]], total: int) -> bool:
+        """Whether a fresh first page matches the cached enumeration (same total, same leading addresses)"""
+        if total != cached['total']:
+            return False
+        known = [entry.get('value') for entry in self.cache.emails(domain, len(page))]
+        return known == [entry.get('value') for entry in page]
+    
+    def _reserve_request(self, domain: str, offset: int) -> bool:
+        """Count one outgoing domain-search request against the budget; False once it is spent"""
+        with self._budget_lock:
+            if self.request_budget is None or self.requests_sent < self.request_budget:
+                self.requests_sent += 1
+                return True
+        logger.warning(f"Hunter.io request budget spent; skipping {domain} offset {offset}")
+        return False
+    
+    @staticmethod
+    def _domain_result(domain: str, emails: List[Dict[str, Any]], total: int, requests_made: int,
+                       failed_requests: int, from_cache: bool) -> Dict[str, Any]:
+        return {
+            'data': {'domain': domain, 'emails': emails},
+            'meta': {'results': total, 'offset': 0, 'limit': len(emails),
+                     'requests': requests_made, 'failed_requests': failed_requests, 'from_cache': from_cache}
+        }
     
     def find_person_email(self, domain: str, first_name: str, last_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -95,7 +272,7 @@ class HunterAPIClient:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self.rate_limiter.send(self._send_email_finder, url, params=params, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -129,7 +306,7 @@ class HunterAPIClient:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self.rate_limiter.send(self._send_email_verifier, url, params=params, timeout=30)
             response.raise_for_status()
             
             return response.json()
@@ -203,33 +380,75 @@ COLLEGE_DOMAINS = {
     'REVA University': ['reva.edu.in'],
 }
 
-def get_college_domains(college_name: str) -> List[str]:
+# Acronyms and alternative spellings people use for the colleges above
+COLLEGE_ALIASES = {
+    'HKB College of Engineering': ['HKBK College of Engineering', 'HKBKCE'],
+    'RV College of Engineering': ['RVCE', 'Rashtreeya Vidyalaya College of Engineering'],
+    'BMS College of Engineering': ['BMSCE'],
+    'VTU': ['Visvesvaraya Technological University'],
+    'IIT Bangalore': ['Indian Institute of Science', 'IISc Bangalore'],
+    'NIT Karnataka': ['NITK', 'National Institute of Technology Karnataka', 'NITK Surathkal'],
+    'Manipal Institute of Technology': ['MIT Manipal'],
+    'PES University': ['PESU', 'PES Institute of Technology'],
+    'Dayananda Sagar College of Engineering': ['DSCE'],
+    'Sir M Visvesvaraya Institute of Technology': ['Sir MVIT'],
+    'Bangalore Institute of Technology': ['BIT Bangalore'],
+    'MS Ramaiah Institute of Technology': ['MSRIT', 'Ramaiah Institute of Technology'],
+    'New Horizon College of Engineering': ['NHCE'],
+}
+
+_shared_registry: Optional[CollegeRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_college_registry() -> CollegeRegistry:
+    """
+    Return the process-wide college registry, building it on first use
+    
+    It holds the colleges above plus, when the COLLEGE_REGISTRY environment
+    variable names a JSON or CSV file, every college listed there.
+    """
+    global _shared_registry
+    with _registry_lock:
+        if _shared_registry is None:
+            _shared_registry = _build_registry(os.getenv('COLLEGE_REGISTRY'))
+        return _shared_registry
+
+def configure_college_registry(path: str = None) -> CollegeRegistry:
+    """
+    Replace the process-wide college registry
+    
+    Args:
+        path: JSON or CSV registry file added to the built-in colleges
+    
+    Returns:
+        The new registry
+    """
+    global _shared_registry
+    with _registry_lock:
+        _shared_registry = _build_registry(path)
+        return _shared_registry
+
+def _build_registry(path: str = None) -> CollegeRegistry:
+    registry = CollegeRegistry.from_mapping(COLLEGE_DOMAINS, COLLEGE_ALIASES)
+    if path:
+        for college in CollegeRegistry.load(path).colleges:
+            registry.add(college)
+    return registry
+
+def get_college_domains(college_name: str, allow_guess: bool = False) -> List[str]:
     """
     Get email domains for a college
     
     Args:
-        college_name: Name of the college
+        college_name: Name of the college, in any common spelling or acronym
+        allow_guess: Fall back to a made-up '<name>.edu.in' domain for colleges
+            missing from the registry (each one costs a Hunter.io request)
         
     Returns:
-        List of email domains for the college
+        List of email domains for the college; empty if it is unknown and
+        guessing is not allowed
     """
-    # Direct match
-    if college_name in COLLEGE_DOMAINS:
-        return COLLEGE_DOMAINS[college_name]
-    
-    # Fuzzy match
-    college_lower = college_name.lower()
-    for name, domains in COLLEGE_DOMAINS.items():
-        if name.lower() in college_lower or college_lower in name.lower():
-            return domains
-    
-    # Generic domain construction
-    # This is a fallback - you should research actual domains
-    clean_name = college_name.lower().replace(' ', '').replace('college', '').replace('engineering', '').replace('of', '')
-    generic_domain = f"{clean_name}.edu.in"
-    
-    logger.warning(f"No specific domain found for {college_name}, using generic: {generic_domain}")
-    return [generic_domain]
+    return get_college_registry().domains(college_name, allow_guess=allow_guess)
 
 def main():
     """Test the Hunter API client"""
@@ -238,7 +457,7 @@ def main():
     
     # Test college
     college_name = "HKB College of Engineering"
-    domains = get_college_domains(college_name)
+    domains = get_college_domains(college_name, allow_guess=True)
     
     logger.info(f"Testing Hunter API for {college_name}")
     logger.info(f"Domains to search: {domains}")
@@ -254,9 +473,6 @@ def main():
             profiles = client.extract_linkedin_profiles(email_data)
             all_profiles.extend(profiles)
             
-            # Add delay to respect rate limits
-            time.sleep(1)
-    
     if all_profiles:
         logger.info(f"Found {len(all_profiles)} potential student profiles")
         
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Hunter.io Domain Cache
+Persistent record of each college domain's enumerated email addresses, with ETag and last-seen tracking
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+import logging
+from typing import Dict, List, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOMAIN_TTL = 7 * 24 * 3600      # Staff and student address lists change slowly
+
+class DomainSearchCache:
+    """
+    Every email address Hunter.io has returned for a domain, in result order
+    
+    A domain row remembers the total Hunter reported, how many results of the
+    current enumeration have been fetched, the ETag of the first page and
+    when the enumeration started and was last validated. Each email row keeps
+    when it was first and last seen, so addresses that drop out of Hunter's
+    results stay on disk but are no longer returned.
+    """
+    
+    def __init__(self, path: str = "cache/hunter.db", ttl: float = DEFAULT_DOMAIN_TTL):
+        """
+        Initialize the cache
+        
+        Args:
+            path: SQLite database file
+            ttl: Seconds after which a domain's results are revalidated
+        """
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS domains (
+                domain TEXT PRIMARY KEY,
+                total INTEGER,
+                enumerated INTEGER,
+                etag TEXT,
+                fetched_at REAL,
+                checked_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS domain_emails (
+                domain TEXT,
+                email TEXT,
+                position INTEGER,
+                data TEXT,
+                first_seen REAL,
+                last_seen REAL,
+                PRIMARY KEY (domain, email)
+            );
+        ''')
+        self._conn.commit()
+    
+    def get(self, domain: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up what is known about a domain
+        
+        Args:
+            domain: Email domain
+        
+        Returns:
+            Dictionary with 'total', 'enumerated', 'etag', 'fetched_at',
+            'checked_at' and 'fresh', or None if the domain was never searched
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT total, enumerated, etag, fetched_at, checked_at FROM domains WHERE domain = ?',
+                (domain.lower(),)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            fresh = time.time() - row[4] <= self.ttl
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        
+        total, enumerated, etag, fetched_at, checked_at = row
+        return {'total': total, 'enumerated': enumerated, 'etag': etag, 'fetched_at': fetched_at,
+                'checked_at': checked_at, 'fresh': fresh}
+    
+    def emails(self, domain: str, limit: int = None) -> List[Dict[str, Any]]:
+        """Email entries of the domain's current enumeration, in Hunter's result order"""
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT e.data FROM domain_emails e JOIN domains d ON d.domain = e.domain
+                WHERE e.domain = ? AND e.last_seen >= d.fetched_at
+                ORDER BY e.position LIMIT ?
+            ''', (domain.lower(), -1 if limit is None else limit)).fetchall()
+        return [json.loads(data) for (data,) in rows]
+    
+    def start(self, domain: str, total: int, etag: str = None):
+        """Begin a new enumeration of a domain, superseding the previous one"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO domains (domain, total, enumerated, etag, fetched_at, checked_at)
+                VALUES (?, ?, 0, ?, ?, ?)
+            ''', (domain.lower(), total, etag, now, now))
+            self._conn.commit()
+    
+    def store(self, domain: str, offset: int, emails: List[Dict[str, Any]]):
+        """
+        Record a contiguous run of results of the current enumeration
+        
+        Args:
+            domain: Email domain
+            offset: Result position of the first entry
+            emails: Email entries as returned by Hunter.io
+        """
+        domain = domain.lower()
+        now = time.time()
+        rows = [(domain, entry.get('value', ''), offset + i, json.dumps(entry), now, now)
+                for i, entry in enumerate(emails) if entry.get('value')]
+        
+        with self._lock:
+            self._conn.executemany('''
+                INSERT INTO domain_emails (domain, email, position, data, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (domain, email) DO UPDATE SET
+                    position = excluded.position,
+                    data = excluded.data,
+                    last_seen = excluded.last_seen
+            ''', rows)
+            self._conn.execute('UPDATE domains SET enumerated = MAX(enumerated, ?) WHERE domain = ?',
+                               (offset + len(emails), domain))
+            self._conn.commit()
+    
+    def touch(self, domain: str):
+        """Mark a domain as validated now without refetching it"""
+        with self._lock:
+            self._conn.execute('UPDATE domains SET checked_at = ? WHERE domain = ?', (time.time(), domain.lower()))
+            self._conn.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and number of cached domains and addresses"""
+        with self._lock:
+            domains = self._conn.execute('SELECT COUNT(*) FROM domains').fetchone()[0]
+            emails = self._conn.execute('SELECT COUNT(*) FROM domain_emails').fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'domains': domains, 'emails': emails}
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+JSON Streaming
+Write and read student records one at a time as NDJSON or JSON arrays, in constant memory
+"""
+
+import os
+import json
+import time
+import logging
+from typing import Dict, Any, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Shared encoders; json.dumps(..., default=str) would build a new one per record
+_encode_line = json.JSONEncoder(ensure_ascii=False, default=str, separators=(',', ':')).encode
+_encode_pretty = json.JSONEncoder(ensure_ascii=False, default=str, indent=2).encode
+
+class NDJSONWriter:
+    """
+    Append records to a JSON Lines file as they arrive
+    
+    Each record is written as one complete line and flushed, so `tail -f`
+    or read_ndjson(follow=True) sees it immediately and a crash never leaves
+    more than the last line half-written.
+    """
+    
+    def __init__(self, path: str, append: bool = False, fsync: bool = False):
+        """
+        Open the output file
+        
+        Args:
+            path: Output file (conventionally .jsonl)
+            append: Add to an existing file instead of replacing it
+            fsync: Force each record to disk, not just to the OS
+        """
+        self.path = path
+        self.fsync = fsync
+        self.count = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+    
+    def write(self, record: Dict[str, Any]):
+        """Write one record and flush it"""
+        self._file.write(_encode_line(record) + '\n')
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.count += 1
+    
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Write every record from an iterable (e.g. a generator); returns how many were written"""
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+    
+    def close(self):
+        """Close the output file"""
+        if not self._file.closed:
+            self._file.close()
+    
+    def __enter__(self) -> 'NDJSONWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def write_ndjson(path: str, records: Iterable[Dict[str, Any]]) -> int:
+    """
+    Stream records to a new JSON Lines file
+    
+    Args:
+        path: Output file
+        records: Records to write; consumed lazily
+    
+    Returns:
+        Number of records written
+    """
+    with NDJSONWriter(path) as writer:
+        return writer.write_all(records)
+
+def read_ndjson(path: str, follow: bool = False, poll_interval: float = 0.5) -> Iterator[Dict[str, Any]]:
+    """
+    Yield records from a JSON Lines file one at a time
+    
+    Args:
+        path: Input file
+        follow: Keep waiting for new lines like `tail -f` (stop by closing the generator)
+        poll_interval: Seconds between checks for new data when following
+    
+    Yields:
+        One dictionary per line; blank and malformed lines are skipped
+    """
+    with open(path, encoding='utf-8') as f:
+        pending = ''
+        line_number = 0
+        while True:
+            line = f.readline()
+            if not line:
+                if not follow:
+                    break
+                time.sleep(poll_interval)
+                continue
+            
+            # While following, a line without its newline is still being written
+            if follow and not line.endswith('\n'):
+                pending += line
+                continue
+            
+            line, pending = pending + line, ''
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping malformed line {line_number} in {path}")
+
+def write_json_array(path: str, records: Iterable[Dict[str, Any]]) -> int:
+    """
+    Stream records into a pretty-printed JSON array
+    
+    The output is byte-for-byte what json.dump(list(records), f, indent=2,
+    ensure_ascii=False) produces, without ever holding the list in memory.
+    
+    Args:
+        path: Output file
+        records: Records to write; consumed lazily
+    
+    Returns:
+        Number of records written
+    """
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write('[\n  ' if written == 0 else ',\n  ')
+            f.write(_encode_pretty(record).replace('\n', '\n  '))
+            written += 1
+        f.write('\n]' if written else '[]')
+    return written
@@ -6,7 +6,6 @@ Real LinkedIn API integration for fetching student data
 
 import requests
 import json
-import time
 import os
 from typing import Dict, List, Optional, Any
 import logging
@@ -15,12 +14,17 @@ import base64
 import hashlib
 import secrets
 
+from http_transport import PooledTransport, get_transport
+from rate_limiter import RateLimiter, get_rate_limiter
+from telemetry import Telemetry, get_telemetry
+
 logger = logging.getLogger(__name__)
 
 class LinkedInAPIClient:
     """LinkedIn API client with OAuth 2.0 authentication"""
     
-    def __init__(self, client_id: str = None, client_secret: str = None, access_token: str = None):
+    def __init__(self, client_id: str = None, client_secret: str = None, access_token: str = None,
+                 transport: PooledTransport = None, rate_limiter: RateLimiter = None, telemetry: Telemetry = None):
         """
         Initialize LinkedIn API client
         
@@ -28,6 +32,9 @@ class LinkedInAPIClient:
             client_id: LinkedIn application client ID
             client_secret: LinkedIn application client secret
             access_token: Existing access token (optional)
+            transport: HTTP transport to send requests through (defaults to the shared pool)
+            rate_limiter: Pacing and retry policy for API calls (defaults to the shared LinkedIn limiter)
+            telemetry: Recorder for request metrics (defaults to the process-wide one)
         """
         self.client_id = client_id or os.getenv('LINKEDIN_CLIENT_ID')
         self.client_secret = client_secret or os.getenv('LINKEDIN_CLIENT_SECRET')
@@ -36,6 +43,11 @@ class LinkedInAPIClient:
         self.base_url = "https://api.linkedin.com/v2"
         self.auth_url = "https://www.linkedin.com/oauth/v2/authorization"
         self.token_url = "https://www.linkedin.com/oauth/v2/accessToken"
+        self.transport = transport or get_transport()
+        self.rate_limiter = rate_limiter or get_rate_limiter('linkedin')
+        self.telemetry = telemetry or get_telemetry()
+        self._send_profile = self.telemetry.instrument(self.transport.get, 'linkedin', 'people')
+        self._send_search = self.telemetry.instrument(self.transport.get, 'linkedin', 'people-search')
         
         self.headers = {
             'Content-Type': 'application/json',
@@ -92,7 +104,7 @@ class LinkedInAPIClient:
         
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         
-        response = requests.post(self.token_url, data=data, headers=headers)
+        response = self.transport.post(self.token_url, data=data, headers=headers)
         response.raise_for_status()
         
         token_data = response.json()
@@ -116,7 +128,7 @@ class LinkedInAPIClient:
             'projection': '(id,firstName,lastName,headline,location,industryName,summary,positions,educations,skills,honors)'
         }
         
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.rate_limiter.send(self._send_profile, url, headers=self.headers, params=params)
         response.raise_for_status()
         
         return response.json()
@@ -161,7 +173,7 @@ class LinkedInAPIClient:
         if keywords:
             params['keywords'] = keywords
         
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.rate_limiter.send(self._send_search, url, headers=self.headers, params=params)
         response.raise_for_status()
         
         return response.json()
@@ -268,25 +280,6 @@ class LinkedInAPIClient:
             logger.error(f"Error fetching company employees: {e}")
             return []
     
-    def rate_limit_handler(self, func, *args, **kwargs):
-        """Handle rate limiting with exponential backoff"""
-        max_retries = 3
-        base_delay = 1
-        
-        for attempt in range(max_retries):
-            try:
-                return func(*args, **kwargs)
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 429:  # Rate limited
-                    delay = base_delay * (2 ** attempt)
-                    logger.warning(f"Rate limited. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}")
-                    time.sleep(delay)
-                    continue
-                else:
-                    raise
-        
-        raise Exception(f"Max retries ({max_retries}) exceeded for rate limited request")
-
 # Example school IDs (you would need to find the actual LinkedIn IDs)
 SCHOOL_IDS = {
     'HKB College of Engineering': 'hkb-college-engineering',
@@ -4,32 +4,16 @@ LinkedIn Student Data Fetcher
 A tool to fetch college student details from LinkedIn using official APIs
 """
 
-import requests
 import json
 import time
 import os
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Iterable, Iterator
 import logging
-from urllib.parse import quote_plus
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+from json_stream import write_json_array, write_ndjson
+from student_record import StudentProfile, student_dicts
 
-@dataclass
-class StudentProfile:
-    """Data class for student profile information"""
-    name: str
-    college: str
-    degree: Optional[str] = None
-    graduation_year: Optional[str] = None
-    location: Optional[str] = None
-    headline: Optional[str] = None
-    profile_url: Optional[str] = None
-    connections: Optional[int] = None
-    skills: List[str] = None
-    experience: List[Dict] = None
+logger = logging.getLogger(__name__)
 
 class LinkedInStudentFetcher:
     """Main class for fetching LinkedIn student data"""
@@ -69,19 +53,7 @@ class LinkedInStudentFetcher:
         mock_students = self._generate_mock_data(college_name, limit)
         
         for student_data in mock_students:
-            student = StudentProfile(
-                name=student_data.get('name', ''),
-                college=college_name,
-                degree=student_data.get('degree'),
-                graduation_year=student_data.get('graduationYear'),
-                location=student_data.get('location'),
-                headline=student_data.get('headline'),
-                profile_url=student_data.get('profileUrl'),
-                connections=student_data.get('connections'),
-                skills=student_data.get('skills', []),
-                experience=student_data.get('experience', [])
-            )
-            students.append(student)
+            students.append(StudentProfile.from_dict(student_data, college=college_name))
         
         logger.info(f"Found {len(students)} students from {college_name}")
         return students
@@ -152,38 +124,38 @@ class LinkedInStudentFetcher:
             ]
         )
     
-    def export_to_json(self, students: List[StudentProfile], filename: str = "students_data.json"):
+    def export_to_json(self, students: Iterable[StudentProfile], filename: str = "students_data.json") -> str:
         """
         Export student data to JSON file
         
+        Records are streamed to disk one at a time, so students may be a
+        generator; a .jsonl or .ndjson filename writes JSON Lines instead.
+        
         Args:
-            students: List of StudentProfile objects
+            students: StudentProfile objects
             filename: Output filename
+        
+        Returns:
+            The output filename
         """
-        logger.info(f"Exporting {len(students)} student records to {filename}")
-        
-        # Convert StudentProfile objects to dictionaries
-        students_data = []
-        for student in students:
-            student_dict = {
-                'name': student.name,
-                'college': student.college,
-                'degree': student.degree,
-                'graduation_year': student.graduation_year,
-                'location': student.location,
-                'headline': student.headline,
-                'profile_url': student.profile_url,
-                'connections': student.connections,
-                'skills': student.skills,
-                'experience': student.experience
-            }
-            students_data.append(student_dict)
+        logger.info(f"Exporting student records to {filename}")
         
-        # Save to JSON file
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(students_data, f, indent=2, ensure_ascii=False)
+        if filename.endswith(('.jsonl', '.ndjson')):
+            count = write_ndjson(filename, self._student_dicts(students))
+        else:
+            count = write_json_array(filename, self._student_dicts(students))
         
-        logger.info(f"Data exported successfully to {filename}")
+        logger.info(f"Exported {count} records successfully to {filename}")
+        return filename
+    
+    def export_to_ndjson(self, students: Iterable[StudentProfile], filename: str = "students_data.jsonl") -> str:
+        """Export student data as JSON Lines, flushing each record as it is written"""
+        return self.export_to_json(students, filename)
+    
+    @staticmethod
+    def _student_dicts(students: Iterable[StudentProfile]) -> Iterator[Dict[str, Any]]:
+        """Convert StudentProfile objects to dictionaries lazily"""
+        return student_dicts(students)
     
     def search_multiple_colleges(self, college_names: List[str], limit_per_college: int = 20) -> Dict[str, List[StudentProfile]]:
         """
@@ -241,4 +213,5 @@ def main():
     logger.info("Process completed successfully!")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     main()
\ No newline at end of file
@@ -5,22 +5,51 @@ Combines Hunter.io and Scraping APIs to fetch real LinkedIn student data
 """
 
 import json
-import time
 import os
+import argparse
+import asyncio
+import threading
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator, Iterable
 from datetime import datetime
 import re
 
-from hunter_api_client import HunterAPIClient, get_college_domains
+from hunter_api_client import HunterAPIClient, get_college_domains, configure_college_registry
 from scrape_api_client import ScrapeAPIClient
+from response_cache import ResponseCache, normalize_profile_url
+from rate_limiter import RateLimiter, get_rate_limiter
+from crawl_journal import CrawlJournal
+from profile_store import ProfileStore
+from query_planner import QueryPlanner, SearchResultCache, SEARCH_PAGE_SIZE
+from hunter_cache import DomainSearchCache
+from json_stream import NDJSONWriter, read_ndjson
+from columnar_export import columnar_available, export_columnar
+from dedup import deduplicate, IdentityIndex
+from telemetry import Telemetry
+
+SEARCH_QUERY_TEMPLATES = [
+    "{college} students",
+    "{college} alumni",
+    "students {college} engineering",
+    "{college} graduates"
+]
+
+_PHASE_DONE = object()
 
 logger = logging.getLogger(__name__)
 
 class LiveLinkedInFetcher:
     """Main class for fetching real LinkedIn student data using multiple APIs"""
     
-    def __init__(self, hunter_api_key: str = None, scrape_api_key: str = None, scrape_service: str = 'scrapingbee'):
+    def __init__(self, hunter_api_key: str = None, scrape_api_key: str = None, scrape_service: str = 'scrapingbee',
+                 cache: ResponseCache = None, use_cache: bool = True,
+                 rate_limits: Dict[str, Tuple[float, int]] = None, checkpoint_path: str = None,
+                 resume: bool = False, incremental: bool = False, max_age_days: float = None,
+                 profile_store: ProfileStore = None, search_cache: SearchResultCache = None,
+                 hunter_cache: DomainSearchCache = None, guess_domains: bool = False,
+                 telemetry: Telemetry = None, hunter_base_url: str = None, scrape_base_url: str = None,
+                 results_dir: str = "live_results", fresh: bool = False):
         """
         Initialize the live fetcher with API credentials
         
@@ -28,21 +57,107 @@ class LiveLinkedInFetcher:
             hunter_api_key: Hunter.io API key
             scrape_api_key: Scraping service API key
             scrape_service: Scraping service to use ('scrapingbee', 'scrapeowl', 'scrapfly')
+            cache: Response cache for scraped profiles (defaults to cache/responses.db)
+            use_cache: Set to False to always pay for fresh scrapes
+            rate_limits: Per-provider (requests per second, burst) for limiters private to this
+                fetcher; providers not listed share the process-wide limiters
+            checkpoint_path: Journal completed work here so an interrupted run can be resumed;
+                call close() once the crawl has finished (no journal when omitted)
+            resume: Reuse the journal from an interrupted run instead of starting a new one
+                (defaults checkpoint_path to checkpoint.jsonl in results_dir)
+            incremental: Skip scraping profiles already in the profile store and fetched
+                within max_age_days, and record every scrape there
+            max_age_days: Freshness window for incremental crawls (default: 7 days)
+            profile_store: Store of previously scraped profiles (defaults to
+                profiles.db in results_dir when incremental)
+            search_cache: Cache of search results pages (defaults to cache/search.db
+                when use_cache is set)
+            hunter_cache: Cache of Hunter.io domain enumerations (defaults to
+                cache/hunter.db when use_cache is set)
+            guess_domains: Query Hunter.io with a made-up '<name>.edu.in' domain for
+                colleges missing from the college registry
+            telemetry: Recorder for request and stage metrics (defaults to one private
+                to this fetcher, dumped next to each usage report)
+            hunter_base_url: Hunter.io endpoint override (e.g. a stub_providers server)
+            scrape_base_url: Scraping service endpoint override
+            results_dir: Directory results, reports and the default checkpoint go to
+            fresh: Discard the journal of an interrupted run instead of refusing to
+                start (without resume, an unfinished journal raises FileExistsError)
         """
-        self.hunter_client = HunterAPIClient(hunter_api_key)
-        self.scrape_client = ScrapeAPIClient(scrape_api_key, scrape_service)
+        if cache is None and use_cache:
+            cache = ResponseCache()
+        if search_cache is None and use_cache:
+            search_cache = SearchResultCache()
+        if hunter_cache is None and use_cache:
+            hunter_cache = DomainSearchCache()
+        
+        scrape_service = scrape_service.lower()
+        rate_limits = rate_limits or {}
+        self.rate_limiters = {
+            provider: RateLimiter(provider, *rate_limits[provider]) if provider in rate_limits
+            else get_rate_limiter(provider)
+            for provider in ('hunter', scrape_service)
+        }
+        
+        # Every request either client sends is recorded here, retries included
+        self.telemetry = telemetry or Telemetry()
+        self.hunter_client = HunterAPIClient(hunter_api_key, rate_limiter=self.rate_limiters['hunter'],
+                                             cache=hunter_cache, telemetry=self.telemetry,
+                                             base_url=hunter_base_url)
+        self.scrape_client = ScrapeAPIClient(scrape_api_key, scrape_service, base_url=scrape_base_url, cache=cache,
+                                             rate_limiter=self.rate_limiters[scrape_service],
+                                             telemetry=self.telemetry)
         
         # Create results directory
-        self.results_dir = "live_results"
+        self.results_dir = results_dir
         os.makedirs(self.results_dir, exist_ok=True)
         
-        # API usage tracking
-        self.api_usage = {
-            'hunter_requests': 0,
-            'scrape_requests': 0,
+        # With a checkpoint, every finished lookup, search and scrape is journaled so a crashed run can resume
+        if checkpoint_path is None and resume:
+            checkpoint_path = os.path.join(self.results_dir, 'checkpoint.jsonl')
+        self.journal = CrawlJournal(checkpoint_path, resume=resume, overwrite=fresh) if checkpoint_path else None
+        
+        # Decides which search result pages are worth paying for
+        self.query_planner = QueryPlanner(self._search_page, search_cache)
+        
+        # Profiles scraped by earlier runs; consulted before paying for a scrape
+        if profile_store is None and incremental:
+            profile_store = ProfileStore(os.path.join(self.results_dir, 'profiles.db'))
+        if profile_store is not None and max_age_days is not None:
+            profile_store.max_age = max_age_days * 24 * 3600
+        self.profile_store = profile_store
+        self.guess_domains = guess_domains
+        
+        # Outcome counters; request counts come from telemetry (see api_usage)
+        self._usage = {
             'successful_profiles': 0,
-            'failed_profiles': 0
+            'failed_profiles': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'checkpoint_hits': 0,
+            'store_hits': 0,
+            'profiles_changed': 0
         }
+        self._usage_lock = threading.Lock()
+    
+    @property
+    def api_usage(self) -> Dict[str, int]:
+        """
+        Usage counters for this fetcher
+        
+        Request counts are the requests that actually reached each provider,
+        retries included; budget-skipped and cached lookups are not counted.
+        """
+        with self._usage_lock:
+            usage = dict(self._usage)
+        return {'hunter_requests': self.telemetry.request_count('hunter'),
+                'scrape_requests': self.telemetry.request_count(self.scrape_client.service),
+                **usage}
+    
+    def _count(self, key: str, amount: int = 1):
+        """Increment a usage counter; phases may run on several threads"""
+        with self._usage_lock:
+            self._usage[key] += amount
     
     def fetch_college_students(self, college_name: str, limit: int = 50, methods: List[str] = None) -> List[Dict[str, Any]]:
         """
@@ -67,18 +182,18 @@ class LiveLinkedInFetcher:
         # Method 1: Use Hunter.io to find emails and LinkedIn profiles
         if 'hunter' in methods or 'both' in methods:
             logger.info("Phase 1: Using Hunter.io to find student emails...")
-            hunter_profiles = self._fetch_via_hunter(college_name, limit // 2)
+            hunter_profiles = self._fetch_via_hunter(college_name, self._phase_limit(limit, methods))
             all_students.extend(hunter_profiles)
             logger.info(f"Hunter.io found: {len(hunter_profiles)} potential students")
         
         # Method 2: Use Google search via Scrape API to find LinkedIn profiles
         if 'search' in methods or 'both' in methods:
             logger.info("Phase 2: Using Google search to find LinkedIn profiles...")
-            search_profiles = self._fetch_via_search(college_name, limit // 2)
+            search_profiles = self._fetch_via_search(college_name, self._phase_limit(limit, methods))
             all_students.extend(search_profiles)
             logger.info(f"Google search found: {len(search_profiles)} LinkedIn profiles")
         
-        # Remove duplicates based on LinkedIn URL or email
+        # Merge duplicates found by both methods
         unique_students = self._remove_duplicates(all_students)
         logger.info(f"After deduplication: {len(unique_students)} unique students")
         
@@ -86,15 +201,139 @@ class LiveLinkedInFetcher:
         final_students = unique_students[:limit]
         
         # Save results
-        self._save_results(college_name, final_students)
+        with self.telemetry.stage('save'):
+            self._save_results(college_name, final_students)
+        self._log_usage()
+        
+        return final_students
+    
+    async def fetch_college_students_async(self, college_name: str, limit: int = 50,
+                                           methods: List[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch real student data with the Hunter.io and search phases running at once
         
-        # Log API usage
+        Profiles are yielded as soon as they are scraped and deduplicated, so the
+        first results arrive while later ones are still in flight; each is also
+        appended to the results .jsonl file straight away, so the output can be
+        tailed during the crawl. Requests are
+        paced only by each provider's token bucket, so the total time is bounded
+        by the slowest provider's rate limit rather than a sum of fixed sleeps.
+        Results are saved once the target is reached or both phases finish.
+        
+        Args:
+            college_name: Name of the college (e.g., "HKB College of Engineering")
+            limit: Maximum number of students to fetch
+            methods: List of methods to use ['hunter', 'search', 'both']
+        
+        Yields:
+            Student profile dictionaries, in completion order
+        """
+        if methods is None:
+            methods = ['both']
+        
+        logger.info(f"Starting async live data fetch for: {college_name}")
+        logger.info(f"Target: {limit} students, Methods: {methods}")
+        
+        loop = asyncio.get_running_loop()
+        scrape_slots = asyncio.Semaphore(self.scrape_client.max_concurrency)
+        found = asyncio.Queue()
+        # Blocking client calls (and their token-bucket waits) run on these threads
+        executor = ThreadPoolExecutor(max_workers=self.scrape_client.max_concurrency + 2)
+        
+        def call(func, *args):
+            return loop.run_in_executor(executor, func, *args)
+        
+        async def scrape(func, *args):
+            async with scrape_slots:
+                profile = await call(func, *args)
+            if profile:
+                await found.put(profile)
+        
+        phase_limit = self._phase_limit(limit, methods)
+        
+        async def hunter_phase():
+            collected = 0
+            for domain in self.college_domains(college_name):
+                domain_profiles = await call(self._hunter_domain_profiles, domain, phase_limit)
+                collected += len(domain_profiles)
+                await asyncio.gather(*(scrape(self._enrich_hunter_profile, profile, college_name, domain)
+                                       for profile in domain_profiles))
+                if collected >= phase_limit:
+                    break
+        
+        async def search_phase():
+            scrapes = []
+            # Start scraping each URL while the planner is still paging through results
+            discovered = self.query_planner.discover(self._search_queries(college_name), phase_limit)
+            while True:
+                url = await call(next, discovered, None)
+                if url is None:
+                    break
+                scrapes.append(asyncio.ensure_future(scrape(self._scrape_search_profile, url, college_name)))
+            await asyncio.gather(*scrapes)
+        
+        async def run_phase(name: str, phase):
+            try:
+                await phase()
+            except Exception as e:
+                logger.error(f"Error in {name} phase: {e}")
+            finally:
+                await found.put(_PHASE_DONE)
+        
+        phases = []
+        if 'hunter' in methods or 'both' in methods:
+            phases.append(asyncio.ensure_future(run_phase('Hunter.io', hunter_phase)))
+        if 'search' in methods or 'both' in methods:
+            phases.append(asyncio.ensure_future(run_phase('Google search', search_phase)))
+        
+        stream = self.open_results_stream(college_name)
+        found_count = 0
+        identities = IdentityIndex()
+        phases_running = len(phases)
+        
+        try:
+            while phases_running and found_count < limit:
+                profile = await found.get()
+                if profile is _PHASE_DONE:
+                    phases_running -= 1
+                    continue
+                
+                # A repeat of a yielded profile is merged into it in place
+                if not identities.add(profile):
+                    continue
+                
+                stream.write(profile)
+                found_count += 1
+                yield profile
+            
+            logger.info(f"Async fetch finished: {found_count} unique students")
+            self._finish_stream(stream, identities)
+            with self.telemetry.stage('save'):
+                self._save_results(college_name, json_filename=stream.path)
+            self._log_usage()
+        finally:
+            stream.close()
+            for phase in phases:
+                phase.cancel()
+            await asyncio.gather(*phases, return_exceptions=True)
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def close(self):
+        """Mark the run's journal finished, if it keeps one; call once the whole crawl has completed"""
+        if self.journal is not None:
+            self.journal.finish()
+    
+    def _log_usage(self):
+        """Log the API usage counters"""
         logger.info(f"API Usage - Hunter: {self.api_usage['hunter_requests']}, "
                    f"Scraper: {self.api_usage['scrape_requests']}, "
                    f"Success: {self.api_usage['successful_profiles']}, "
-                   f"Failed: {self.api_usage['failed_profiles']}")
-        
-        return final_students
+                   f"Failed: {self.api_usage['failed_profiles']}, "
+                   f"Cache hits: {self.api_usage['cache_hits']}, "
+                   f"Cache misses: {self.api_usage['cache_misses']}, "
+                   f"Checkpoint hits: {self.api_usage['checkpoint_hits']}, "
+                   f"Fresh in store: {self.api_usage['store_hits']}, "
+                   f"Changed: {self.api_usage['profiles_changed']}")
     
     def _fetch_via_hunter(self, college_name: str, limit: int) -> List[Dict[str, Any]]:
         """Fetch student data using Hunter.io API"""
@@ -102,50 +341,12 @@ class LiveLinkedInFetcher:
         
         try:
             # Get college domains
-            domains = get_college_domains(college_name)
+            domains = self.college_domains(college_name)
             logger.info(f"Searching Hunter.io for domains: {domains}")
             
             for domain in domains:
-                logger.info(f"Searching Hunter.io for domain: {domain}")
-                
-                # Find emails for this domain
-                email_data = self.hunter_client.find_emails_by_domain(domain, limit=limit)
-                self.api_usage['hunter_requests'] += 1
-                
-                if email_data:
-                    # Extract profiles with potential LinkedIn data
-                    domain_profiles = self.hunter_client.extract_linkedin_profiles(email_data)
-                    
-                    # Enhance profiles with college information
-                    for profile in domain_profiles:
-                        profile['college'] = college_name
-                        profile['domain'] = domain
-                        profile['method'] = 'Hunter.io'
-                        
-                        # If we have a LinkedIn URL, scrape detailed information
-                        if profile.get('linkedin_url'):
-                            logger.info(f"Scraping detailed profile for: {profile['first_name']} {profile['last_name']}")
-                            detailed_data = self.scrape_client.scrape_linkedin_profile(profile['linkedin_url'])
-                            self.api_usage['scrape_requests'] += 1
-                            
-                            if detailed_data:
-                                profile.update(detailed_data)
-                                profile['data_quality'] = 'high'
-                                self.api_usage['successful_profiles'] += 1
-                            else:
-                                profile['data_quality'] = 'medium'
-                                self.api_usage['failed_profiles'] += 1
-                            
-                            # Rate limiting
-                            time.sleep(2)
-                        else:
-                            profile['data_quality'] = 'low'
-                    
-                    profiles.extend(domain_profiles)
-                
-                # Rate limiting between domains
-                if len(domains) > 1:
-                    time.sleep(1)
+                for profile in self._hunter_domain_profiles(domain, limit):
+                    profiles.append(self._enrich_hunter_profile(profile, college_name, domain))
                 
                 if len(profiles) >= limit:
                     break
@@ -157,61 +358,69 @@ class LiveLinkedInFetcher:
             logger.error(f"Error in Hunter.io fetch: {e}")
             return []
     
+    def college_domains(self, college_name: str) -> List[str]:
+        """Email domains to search for a college; guessed ones only when guess_domains is set"""
+        return get_college_domains(college_name, allow_guess=self.guess_domains)
+    
+    def _hunter_domain_profiles(self, domain: str, limit: int) -> List[Dict[str, Any]]:
+        """Find people with an address at one college domain"""
+        checkpoint_key = f"{domain}|{limit}"
+        profiles = self.journal.get('hunter', checkpoint_key) if self.journal is not None else None
+        if profiles is not None:
+            self._count('checkpoint_hits')
+            return profiles
+        
+        logger.info(f"Searching Hunter.io for domain: {domain}")
+        
+        with self.telemetry.stage('discover'):
+            email_data = self.hunter_client.search_domain(domain, limit=limit)
+        
+        if not email_data['data']['emails']:
+            return []
+        
+        profiles = self.hunter_client.extract_linkedin_profiles(email_data)
+        if self.journal is not None:
+            self.journal.record('hunter', checkpoint_key, profiles)
+        return profiles
+    
+    def _enrich_hunter_profile(self, profile: Dict[str, Any], college_name: str, domain: str) -> Dict[str, Any]:
+        """Tag a Hunter.io result with its college and scrape its LinkedIn page if known"""
+        profile['college'] = college_name
+        profile['domain'] = domain
+        profile['method'] = 'Hunter.io'
+        
+        # If we have a LinkedIn URL, scrape detailed information
+        if profile.get('linkedin_url'):
+            logger.info(f"Scraping detailed profile for: {profile['first_name']} {profile['last_name']}")
+            detailed_data = self._scrape_profile(profile['linkedin_url'], college_name)
+            
+            if detailed_data:
+                profile.update(detailed_data)
+                profile['data_quality'] = 'high'
+                self._count('successful_profiles')
+            else:
+                profile['data_quality'] = 'medium'
+                self._count('failed_profiles')
+        else:
+            profile['data_quality'] = 'low'
+        
+        return profile
+    
     def _fetch_via_search(self, college_name: str, limit: int) -> List[Dict[str, Any]]:
         """Fetch student data using Google search via Scrape API"""
         profiles = []
         
         try:
-            # Search for LinkedIn profiles
-            search_queries = [
-                f"{college_name} students",
-                f"{college_name} alumni",
-                f"students {college_name} engineering",
-                f"{college_name} graduates"
-            ]
-            
-            linkedin_urls = []
-            
-            for query in search_queries:
-                logger.info(f"Searching Google for: {query}")
-                urls = self.scrape_client.search_linkedin_profiles(query, limit=limit//len(search_queries))
-                self.api_usage['scrape_requests'] += 1
-                
-                linkedin_urls.extend(urls)
-                
-                # Rate limiting
-                time.sleep(2)
-                
-                if len(linkedin_urls) >= limit:
-                    break
-            
-            # Remove duplicates from URLs
-            unique_urls = list(set(linkedin_urls))[:limit]
+            unique_urls = list(self.query_planner.discover(self._search_queries(college_name), limit))
             logger.info(f"Found {len(unique_urls)} unique LinkedIn URLs to scrape")
             
             # Scrape each profile
             for i, url in enumerate(unique_urls):
                 logger.info(f"Scraping profile {i+1}/{len(unique_urls)}: {url}")
                 
-                profile_data = self.scrape_client.scrape_linkedin_profile(url)
-                self.api_usage['scrape_requests'] += 1
-                
+                profile_data = self._scrape_search_profile(url, college_name)
                 if profile_data:
-                    # Enhance with college information
-                    profile_data['college'] = college_name
-                    profile_data['method'] = 'Google Search + Scraping'
-                    profile_data['data_quality'] = 'high'
-                    
-                    # Try to extract graduation year and degree info
-                    profile_data = self._enhance_student_data(profile_data, college_name)
-                    
                     profiles.append(profile_data)
-                    self.api_usage['successful_profiles'] += 1
-                else:
-                    self.api_usage['failed_profiles'] += 1
-                
-                # Rate limiting (important for scraping)
-                time.sleep(3)
             
             logger.info(f"Google search method completed: {len(profiles)} profiles")
             return profiles
@@ -220,6 +429,97 @@ class LiveLinkedInFetcher:
             logger.error(f"Error in Google search fetch: {e}")
             return []
     
+    @staticmethod
+    def _phase_limit(limit: int, methods: List[str]) -> int:
+        """Profiles each phase should find: the whole limit for one method, half (rounded up) for both"""
+        if 'both' in methods or ('hunter' in methods and 'search' in methods):
+            return (limit + 1) // 2
+        return limit
+    
+    @staticmethod
+    def _search_queries(college_name: str) -> List[str]:
+        """Search engine queries likely to surface the college's students"""
+        return [template.format(college=college_name) for template in SEARCH_QUERY_TEMPLATES]
+    
+    def _search_page(self, query: str, page: int) -> List[str]:
+        """Run one paid search for a results page and return the LinkedIn profile URLs on it"""
+        checkpoint_key = f"{query}|page{page}"
+        urls = self.journal.get('search', checkpoint_key) if self.journal is not None else None
+        if urls is not None:
+            self._count('checkpoint_hits')
+            return urls
+        
+        logger.info(f"Searching Google for: {query} (page {page + 1})")
+        with self.telemetry.stage('discover'):
+            urls = self.scrape_client.search_linkedin_profiles(query, limit=SEARCH_PAGE_SIZE, page=page)
+        
+        if urls and self.journal is not None:
+            self.journal.record('search', checkpoint_key, urls)
+        return urls
+    
+    def _scrape_search_profile(self, linkedin_url: str, college_name: str) -> Optional[Dict[str, Any]]:
+        """Scrape a profile found by search and tag it with student details; None on failure"""
+        profile_data = self._scrape_profile(linkedin_url, college_name)
+        
+        if not profile_data:
+            self._count('failed_profiles')
+            return None
+        
+        # Enhance with college information
+        profile_data['college'] = college_name
+        profile_data['method'] = 'Google Search + Scraping'
+        profile_data['data_quality'] = 'high'
+        
+        # Try to extract graduation year and degree info
+        with self.telemetry.stage('enrich'):
+            profile_data = self._enhance_student_data(profile_data, college_name)
+        self._count('successful_profiles')
+        return profile_data
+    
+    def _scrape_profile(self, linkedin_url: str, college_name: str = None) -> Dict[str, Any]:
+        """
+        Scrape one profile, counting paid requests and cache hits separately
+        
+        Profiles already in the checkpoint journal are returned without a
+        request or a parse; failures are not journaled, so they are retried.
+        In incremental mode a profile fetched within the freshness window is
+        taken from the profile store, and every new scrape is stored there.
+        
+        Args:
+            linkedin_url: Profile URL
+            college_name: College the profile was found for, recorded in the store
+        
+        Returns:
+            Profile data, or an empty dict on failure
+        """
+        checkpoint_key = normalize_profile_url(linkedin_url)
+        profile_data = self.journal.get('profile', checkpoint_key) if self.journal is not None else None
+        if profile_data is not None:
+            self._count('checkpoint_hits')
+            return profile_data
+        
+        if self.profile_store is not None:
+            profile_data = self.profile_store.get(linkedin_url)
+            if profile_data is not None:
+                self._count('store_hits')
+                return profile_data
+        
+        result = self.scrape_client.scrape_profile_result(linkedin_url)
+        if result['error']:
+            logger.error(result['error'])
+        
+        if result['from_cache']:
+            self._count('cache_hits')
+        elif self.scrape_client.cache:
+            self._count('cache_misses')
+        
+        if result['profile']:
+            if self.journal is not None:
+                self.journal.record('profile', checkpoint_key, result['profile'])
+            if self.profile_store is not None and self.profile_store.put(linkedin_url, result['profile'], college_name):
+                self._count('profiles_changed')
+        return result['profile']
+    
     def _enhance_student_data(self, profile_data: Dict[str, Any], college_name: str) -> Dict[str, Any]:
         """Enhance profile data with student-specific information"""
         try:
@@ -283,63 +583,93 @@ class LiveLinkedInFetcher:
             return profile_data
     
     def _remove_duplicates(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate profiles based on LinkedIn URL, email, or name"""
-        seen = set()
-        unique_profiles = []
-        
-        for profile in profiles:
-            # Create identifier from available data
-            identifiers = []
-            
-            if profile.get('linkedin_url'):
-                identifiers.append(profile['linkedin_url'].lower())
-            
-            if profile.get('email'):
-                identifiers.append(profile['email'].lower())
-            
-            if profile.get('name'):
-                identifiers.append(profile['name'].lower().replace(' ', ''))
-            elif profile.get('first_name') and profile.get('last_name'):
-                name = f"{profile['first_name']} {profile['last_name']}".lower().replace(' ', '')
-                identifiers.append(name)
-            
-            # Check if we've seen any of these identifiers
-            is_duplicate = any(identifier in seen for identifier in identifiers)
-            
-            if not is_duplicate and identifiers:
-                # Add all identifiers to seen set
-                for identifier in identifiers:
-                    seen.add(identifier)
-                unique_profiles.append(profile)
-        
+        """Merge profiles of the same person (canonical URL/email or matching name at the college)"""
+        with self.telemetry.stage('dedup'):
+            unique_profiles = deduplicate(profiles)
         logger.info(f"Removed {len(profiles) - len(unique_profiles)} duplicates")
         return unique_profiles
     
-    def _save_results(self, college_name: str, students: List[Dict[str, Any]]):
-        """Save results to files"""
+    def _finish_stream(self, stream: NDJSONWriter, identities: IdentityIndex) -> List[Dict[str, Any]]:
+        """
+        Close a college's results stream and merge what streaming could not
+        
+        Profiles sharing a URL or email were merged in place as they arrived;
+        this final pass also merges matching names at the college. The file is
+        rewritten if either changed a profile already written to it.
+        
+        Returns:
+            The unique profiles
+        """
+        stream.close()
+        students = self._remove_duplicates(identities.profiles)
+        if identities.merged or len(students) < len(identities):
+            with NDJSONWriter(stream.path) as writer:
+                writer.write_all(students)
+        return students
+    
+    def _result_filename(self, college_name: str, kind: str, extension: str) -> str:
+        """Timestamped output path for one college's results"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base_filename = college_name.lower().replace(' ', '_').replace('&', 'and')
+        return f"{self.results_dir}/{base_filename}_{kind}_{timestamp}.{extension}"
+        
+    def open_results_stream(self, college_name: str) -> NDJSONWriter:
+        """Open the JSON Lines file that a college's profiles are appended to as they are found"""
+        return NDJSONWriter(self._result_filename(college_name, 'live', 'jsonl'))
+    
+    def _save_results(self, college_name: str, students: Iterable[Dict[str, Any]] = None, json_filename: str = None):
+        """
+        Save results to files
         
-        # Save detailed JSON
-        json_filename = f"{self.results_dir}/{base_filename}_live_{timestamp}.json"
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(students, f, indent=2, ensure_ascii=False, default=str)
+        Args:
+            college_name: College the students belong to
+            students: Student profiles to write (any iterable, consumed once)
+            json_filename: JSON Lines file the profiles were already streamed to;
+                when given, students is not needed
+        """
+        # Save detailed JSON Lines
+        if json_filename is None:
+            json_filename = self._result_filename(college_name, 'live', 'jsonl')
+            with NDJSONWriter(json_filename) as writer:
+                writer.write_all(students)
         
         logger.info(f"Detailed results saved to: {json_filename}")
         
+        # Read the profiles back one at a time rather than holding them all
+        def stream_students():
+            return read_ndjson(json_filename)
+        
         # Save summary CSV
-        csv_filename = f"{self.results_dir}/{base_filename}_summary_{timestamp}.csv"
-        self._save_csv_summary(students, csv_filename)
+        csv_filename = self._result_filename(college_name, 'summary', 'csv')
+        self._save_csv_summary(stream_students(), csv_filename)
         
         logger.info(f"Summary CSV saved to: {csv_filename}")
         
+        # Save a columnar copy for analysis when pyarrow is installed
+        if columnar_available():
+            parquet_filename = self._result_filename(college_name, 'live', 'parquet')
+            try:
+                export_columnar(stream_students(), parquet_filename)
+                logger.info(f"Columnar results saved to: {parquet_filename}")
+            except Exception as e:
+                logger.error(f"Error saving Parquet: {e}")
+        
         # Save API usage report
-        report_filename = f"{self.results_dir}/{base_filename}_report_{timestamp}.txt"
-        self._save_usage_report(college_name, students, report_filename)
+        report_filename = self._result_filename(college_name, 'report', 'txt')
+        self._save_usage_report(college_name, stream_students(), report_filename)
         
         logger.info(f"Usage report saved to: {report_filename}")
     
-    def _save_csv_summary(self, students: List[Dict[str, Any]], filename: str):
+        # Machine-readable request and stage metrics for dashboards and run comparisons
+        for extension in ('json', 'prom'):
+            telemetry_filename = self._result_filename(college_name, 'telemetry', extension)
+            try:
+                self.telemetry.write(telemetry_filename)
+                logger.info(f"Telemetry saved to: {telemetry_filename}")
+            except OSError as e:
+                logger.error(f"Error saving telemetry: {e}")
+    
+    def _save_csv_summary(self, students: Iterable[Dict[str, Any]], filename: str):
         """Save a CSV summary of the student data"""
         try:
             import csv
@@ -367,35 +697,59 @@ class LiveLinkedInFetcher:
         except Exception as e:
             logger.error(f"Error saving CSV: {e}")
     
-    def _save_usage_report(self, college_name: str, students: List[Dict[str, Any]], filename: str):
-        """Save an API usage and results report"""
+    def _save_usage_report(self, college_name: str, students: Iterable[Dict[str, Any]], filename: str):
+        """Save an API usage and results report from a single pass over the students"""
         try:
+            # Data quality breakdown
+            total_students = 0
+            quality_counts = {}
+            method_counts = {}
+            status_counts = {}
+            samples = []
+            
+            for student in students:
+                total_students += 1
+                quality = student.get('data_quality', 'unknown')
+                method = student.get('method', 'unknown')
+                status = student.get('student_status', 'unknown')
+                
+                quality_counts[quality] = quality_counts.get(quality, 0) + 1
+                method_counts[method] = method_counts.get(method, 0) + 1
+                status_counts[status] = status_counts.get(status, 0) + 1
+                
+                if len(samples) < 5:
+                    samples.append(student)
+            
+            api_usage = self.api_usage
+            
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write(f"Live LinkedIn Student Data Fetch Report\n")
                 f.write(f"======================================\n\n")
                 f.write(f"College: {college_name}\n")
                 f.write(f"Timestamp: {datetime.now()}\n")
-                f.write(f"Total Students Found: {len(students)}\n\n")
+                f.write(f"Total Students Found: {total_students}\n\n")
                 
                 f.write(f"API Usage:\n")
-                f.write(f"- Hunter.io Requests: {self.api_usage['hunter_requests']}\n")
-                f.write(f"- Scraping Requests: {self.api_usage['scrape_requests']}\n")
-                f.write(f"- Successful Profiles: {self.api_usage['successful_profiles']}\n")
-                f.write(f"- Failed Profiles: {self.api_usage['failed_profiles']}\n\n")
+                f.write(f"- Hunter.io Requests: {api_usage['hunter_requests']}\n")
+                f.write(f"- Scraping Requests: {api_usage['scrape_requests']}\n")
+                f.write(f"- Successful Profiles: {api_usage['successful_profiles']}\n")
+                f.write(f"- Failed Profiles: {api_usage['failed_profiles']}\n")
+                f.write(f"- Cache Hits: {api_usage['cache_hits']}\n")
+                f.write(f"- Cache Misses: {api_usage['cache_misses']}\n")
+                f.write(f"- Resumed From Checkpoint: {api_usage['checkpoint_hits']}\n")
+                f.write(f"- Still Fresh In Profile Store: {api_usage['store_hits']}\n")
+                f.write(f"- New Or Changed Profiles: {api_usage['profiles_changed']}\n\n")
                 
-                # Data quality breakdown
-                quality_counts = {}
-                method_counts = {}
-                status_counts = {}
+                connection_stats = self.scrape_client.transport.connection_stats()
+                f.write(f"HTTP Connection Reuse:\n")
+                f.write(f"- Connections Opened: {connection_stats['connections_opened']}\n")
+                f.write(f"- Requests Sent: {connection_stats['requests']}\n")
+                f.write(f"- Reuse Ratio: {connection_stats['reuse_ratio']:.1%}\n\n")
                 
-                for student in students:
-                    quality = student.get('data_quality', 'unknown')
-                    method = student.get('method', 'unknown')
-                    status = student.get('student_status', 'unknown')
-                    
-                    quality_counts[quality] = quality_counts.get(quality, 0) + 1
-                    method_counts[method] = method_counts.get(method, 0) + 1
-                    status_counts[status] = status_counts.get(status, 0) + 1
+                f.write(f"Requests And Stage Timings:\n")
+                for line in self.telemetry.report_lines():
+                    f.write(f"{line}\n")
+                f.write(f"\n")
                 
                 f.write(f"Data Quality Breakdown:\n")
                 for quality, count in quality_counts.items():
@@ -410,7 +764,7 @@ class LiveLinkedInFetcher:
                     f.write(f"- {status}: {count} students\n")
                 
                 f.write(f"\nSample Student Data:\n")
-                for i, student in enumerate(students[:5], 1):
+                for i, student in enumerate(samples, 1):
                     f.write(f"\n{i}. {student.get('name', 'N/A')}\n")
                     f.write(f"   College: {student.get('college', 'N/A')}\n")
                     f.write(f"   Degree: {student.get('degree', 'N/A')}\n")
@@ -424,13 +778,37 @@ class LiveLinkedInFetcher:
 
 def main():
     """Test the live LinkedIn fetcher"""
+    parser = argparse.ArgumentParser(description="Fetch live LinkedIn student data for one college")
+    parser.add_argument('college', nargs='?', default="HKB College of Engineering", help='College name')
+    parser.add_argument('--limit', '-l', type=int, default=10, help='Maximum number of students (default: 10)')
+    parser.add_argument('--resume', action='store_true', help='Continue an interrupted fetch from its checkpoint')
+    parser.add_argument('--fresh', action='store_true', help="Discard an interrupted fetch's checkpoint and start over")
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only scrape profiles that are new or older than --max-age-days')
+    parser.add_argument('--max-age-days', type=float, default=None,
+                        help='Freshness window for --incremental (default: 7)')
+    parser.add_argument('--guess-domains', action='store_true',
+                        help="Search Hunter.io at a guessed '<name>.edu.in' domain for unregistered colleges")
+    parser.add_argument('--college-registry', help='JSON or CSV file of colleges and their email domains')
+    args = parser.parse_args()
+    
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     
+    if args.college_registry:
+        configure_college_registry(args.college_registry)
+    
     # Initialize fetcher (you'll need API keys)
-    fetcher = LiveLinkedInFetcher()
+    try:
+        fetcher = LiveLinkedInFetcher(checkpoint_path=os.path.join('live_results', 'checkpoint.jsonl'),
+                                      resume=args.resume, incremental=args.incremental,
+                                      max_age_days=args.max_age_days, guess_domains=args.guess_domains,
+                                      fresh=args.fresh)
+    except FileExistsError as e:
+        print(f"❌ {e} (--resume or --fresh)")
+        return
     
     # Test college
-    college_name = "HKB College of Engineering"
+    college_name = args.college
     
     print(f"🚀 Starting live LinkedIn data fetch for: {college_name}")
     print("⚠️  Note: This requires API keys for Hunter.io and a scraping service")
@@ -438,7 +816,8 @@ def main():
     print()
     
     # Fetch student data
-    students = fetcher.fetch_college_students(college_name, limit=10, methods=['both'])
+    students = fetcher.fetch_college_students(college_name, limit=args.limit, methods=['both'])
+    fetcher.close()
     
     if students:
         print(f"✅ Successfully fetched {len(students)} student profiles!")
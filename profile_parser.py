@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Profile HTML Parser
+Parse-once extraction of profile fields using precompiled selector plans
+"""
+
+import re
+import logging
+from typing import Dict, List, Optional, Any, Tuple
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+logger = logging.getLogger(__name__)
+
+# Tree builders in order of preference; lxml is a C parser and several times faster
+PARSER_BACKENDS = ['lxml', 'html.parser']
+
+# Fallback selectors per single-value field, in priority order
+NAME_SELECTORS = [
+    'h1[class*="text-heading-xlarge"]',
+    '.pv-text-details__left-panel h1',
+    'h1.text-heading-xlarge',
+    '.top-card-layout__title',
+    '.pv-top-card--list li:first-child h1'
+]
+
+HEADLINE_SELECTORS = [
+    'div[class*="text-body-medium break-words"]',
+    '.pv-text-details__left-panel .text-body-medium',
+    '.top-card-layout__headline',
+    '.pv-top-card--list-bullet .text-body-medium'
+]
+
+LOCATION_SELECTORS = [
+    'span[class*="text-body-small inline t-black--light break-words"]',
+    '.pv-text-details__left-panel .text-body-small',
+    '.top-card-layout__first-subline',
+    '.pv-top-card__location'
+]
+
+ABOUT_SELECTORS = [
+    '#about + * .pv-shared-text-with-see-more',
+    '.pv-about__summary-text',
+    'section[data-section="summary"] .pv-shared-text-with-see-more'
+]
+
+EXPERIENCE_ITEM_SELECTOR = '.pv-entity__summary-info, .pv-profile-section__list-item'
+EDUCATION_ITEM_SELECTOR = '.pv-profile-section.education .pv-entity__summary-info'
+SKILL_ITEM_SELECTOR = '.pv-skill-category-entity__name-text, .pv-skill-entity__skill-name'
+CONNECTIONS_SELECTOR = '.t-bold .t-black, .pv-top-card--list-bullet .t-bold'
+
+def available_backend(preferred: str = None) -> str:
+    """
+    Pick a BeautifulSoup tree builder that is installed
+    
+    Args:
+        preferred: Backend to use if available ('lxml' or 'html.parser')
+    
+    Returns:
+        Name of the backend to pass to BeautifulSoup
+    """
+    candidates = [preferred] if preferred else []
+    candidates += PARSER_BACKENDS
+    
+    for backend in candidates:
+        if backend == 'html.parser':
+            return backend
+        try:
+            __import__(backend)
+            return backend
+        except ImportError:
+            continue
+    
+    return 'html.parser'
+
+def _index_keys(selector: str) -> List[Tuple[str, str]]:
+    """
+    Index keys for the rightmost compound of each comma-separated part of a selector
+    
+    An element can only match a part if it carries that part's key, so the single
+    tree walk only evaluates selectors whose key the element has. Classes are
+    preferred over ids over tag names because they are the most selective.
+    """
+    keys = []
+    stripped = re.sub(r'\[[^\]]*\]', '', selector)
+    stripped = re.sub(r':[\w-]+(\([^)]*\))?', '', stripped)
+    
+    for part in stripped.split(','):
+        compound = re.split(r'[\s>+~]+', part.strip())[-1]
+        classes = re.findall(r'\.([\w-]+)', compound)
+        ids = re.findall(r'#([\w-]+)', compound)
+        tag = re.match(r'[\w-]*', compound).group(0)
+        
+        if classes:
+            keys.append(('class', classes[0]))
+        elif ids:
+            keys.append(('id', ids[0]))
+        elif tag and tag != '*':
+            keys.append(('tag', tag.lower()))
+        else:
+            keys.append(('any', ''))
+    
+    return keys
+
+class SelectorPlan:
+    """Every page-level selector compiled once, resolved together in a single walk of the tree"""
+    
+    def __init__(self):
+        single_fields = {
+            'name': NAME_SELECTORS,
+            'headline': HEADLINE_SELECTORS,
+            'location': LOCATION_SELECTORS,
+            'about': ABOUT_SELECTORS,
+            'connections': [CONNECTIONS_SELECTOR]
+        }
+        list_fields = {
+            'experience': EXPERIENCE_ITEM_SELECTOR,
+            'education': EDUCATION_ITEM_SELECTOR,
+            'skills': SKILL_ITEM_SELECTOR
+        }
+        
+        # (field, position) entries; position is the fallback rank for single
+        # fields and None for list fields
+        self.entries = []
+        for field, selectors in single_fields.items():
+            for i, selector in enumerate(selectors):
+                self.entries.append((field, i, selector))
+        for field, selector in list_fields.items():
+            self.entries.append((field, None, selector))
+        
+        self.single_sizes = {field: len(selectors) for field, selectors in single_fields.items()}
+        self.list_names = list(list_fields)
+        
+        # Compile once and index each selector by the key its rightmost compound requires
+        self.index = {'class': {}, 'id': {}, 'tag': {}, 'any': {}}
+        for entry_id, (field, position, selector) in enumerate(self.entries):
+            compiled = soupsieve.compile(selector)
+            for kind, value in _index_keys(selector):
+                bucket = self.index[kind].setdefault(value, [])
+                if all(existing[0] != entry_id for existing in bucket):
+                    bucket.append((entry_id, compiled))
+        
+        # Selectors evaluated inside an experience/education item
+        self.experience_title = soupsieve.compile('h3, .pv-entity__summary-info-v2 h3')
+        self.experience_company = soupsieve.compile('.pv-entity__secondary-title, .pv-entity__summary-info-v2 .text-body-small')
+        self.experience_duration = soupsieve.compile('.pv-entity__bullet-item, .pv-entity__date-range')
+        self.education_school = soupsieve.compile('h3')
+        self.education_degree = soupsieve.compile('.pv-entity__degree-name .pv-entity__comma-item')
+        self.education_field = soupsieve.compile('.pv-entity__fos .pv-entity__comma-item')
+        self.education_dates = soupsieve.compile('.pv-entity__dates .pv-entity__comma-item')
+    
+    def _candidates(self, element: Tag) -> List[Tuple[int, Any]]:
+        """Selectors worth evaluating against an element, by its tag, id and classes"""
+        candidates = list(self.index['any'].get('', ()))
+        candidates += self.index['tag'].get(element.name, ())
+        
+        element_id = element.get('id')
+        if element_id:
+            candidates += self.index['id'].get(element_id, ())
+        
+        for class_name in element.get('class') or ():
+            candidates += self.index['class'].get(class_name, ())
+        
+        return candidates
+    
+    def resolve(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Walk the document once, recording the first match of every single-value
+        selector and every match of the list selectors, in document order
+        
+        Returns:
+            {'name': [first match per selector, ...], ..., 'experience': [elements], ...}
+        """
+        firsts = {field: [None] * size for field, size in self.single_sizes.items()}
+        lists = {field: [] for field in self.list_names}
+        entries = self.entries
+        
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            
+            seen = set()
+            for entry_id, compiled in self._candidates(element):
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                
+                field, position, _ = entries[entry_id]
+                if position is None:
+                    if compiled.match(element):
+                        lists[field].append(element)
+                elif firsts[field][position] is None and compiled.match(element):
+                    firsts[field][position] = element
+        
+        firsts.update(lists)
+        return firsts
+
+class ProfileParser:
+    """Extracts profile fields from rendered LinkedIn HTML with a pluggable tree builder"""
+    
+    def __init__(self, backend: str = None):
+        """
+        Initialize the parser
+        
+        Args:
+            backend: BeautifulSoup tree builder ('lxml' or 'html.parser');
+                defaults to the fastest one installed
+        """
+        self.backend = available_backend(backend)
+        self.plan = SelectorPlan()
+    
+    def parse(self, html_content: str, linkedin_url: str) -> Dict[str, Any]:
+        """
+        Parse LinkedIn HTML content to extract profile information
+        
+        Args:
+            html_content: HTML content of the LinkedIn profile
+            linkedin_url: Original LinkedIn URL
+        
+        Returns:
+            Dictionary containing parsed profile data
+        """
+        try:
+            soup = BeautifulSoup(html_content, self.backend)
+            matches = self.plan.resolve(soup)
+            
+            profile_data = {
+                'linkedin_url': linkedin_url,
+                'name': _first_text(matches['name']),
+                'headline': _first_text(matches['headline']),
+                'location': '',
+                'about': _first_text(matches['about']),
+                'experience': [],
+                'education': [],
+                'skills': [],
+                'connections': '',
+                'source': 'Scrape API',
+                'raw_data_available': True
+            }
+            
+            for location_elem in matches['location']:
+                if location_elem is not None:
+                    location_text = location_elem.get_text(strip=True)
+                    # Clean up location text
+                    if 'connections' not in location_text.lower():
+                        profile_data['location'] = location_text
+                        break
+            
+            plan = self.plan
+            for item in matches['experience'][:5]:  # Limit to first 5 experiences
+                title_elem = plan.experience_title.select_one(item)
+                if title_elem:
+                    company_elem = plan.experience_company.select_one(item)
+                    duration_elem = plan.experience_duration.select_one(item)
+                    profile_data['experience'].append({
+                        'title': title_elem.get_text(strip=True),
+                        'company': company_elem.get_text(strip=True) if company_elem else '',
+                        'duration': duration_elem.get_text(strip=True) if duration_elem else ''
+                    })
+            
+            for item in matches['education']:
+                school_elem = plan.education_school.select_one(item)
+                if school_elem:
+                    degree_elem = plan.education_degree.select_one(item)
+                    field_elem = plan.education_field.select_one(item)
+                    dates_elem = plan.education_dates.select_one(item)
+                    profile_data['education'].append({
+                        'school': school_elem.get_text(strip=True),
+                        'degree': degree_elem.get_text(strip=True) if degree_elem else '',
+                        'field_of_study': field_elem.get_text(strip=True) if field_elem else '',
+                        'dates': dates_elem.get_text(strip=True) if dates_elem else ''
+                    })
+            
+            for item in matches['skills'][:10]:  # Limit to first 10 skills
+                skill_text = item.get_text(strip=True)
+                if skill_text and skill_text not in profile_data['skills']:
+                    profile_data['skills'].append(skill_text)
+            
+            connections_text = _first_text(matches['connections'])
+            if 'connection' in connections_text.lower():
+                profile_data['connections'] = connections_text
+            
+            # Clean up empty fields
+            profile_data = {k: v for k, v in profile_data.items() if v}
+            
+            logger.info(f"Successfully parsed LinkedIn profile for: {profile_data.get('name', 'Unknown')}")
+            return profile_data
+        
+        except Exception as e:
+            logger.error(f"Error parsing LinkedIn HTML: {e}")
+            return {}
+
+def _first_text(candidates: List[Optional[Any]]) -> str:
+    """Text of the first element found, honouring selector priority order"""
+    for element in candidates:
+        if element is not None:
+            return element.get_text(strip=True)
+    return ''
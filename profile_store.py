@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Profile Store
+Persistent dataset of scraped profiles with fetch times and content hashes for incremental crawls
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import logging
+from typing import Dict, Any, Optional, Iterator
+
+from dedup import canonical_profile_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = 7 * 24 * 3600     # Profiles fetched within a week are not scraped again
+
+_encode_canonical = json.JSONEncoder(ensure_ascii=False, default=str, sort_keys=True, separators=(',', ':')).encode
+
+def content_hash(profile: Dict[str, Any]) -> str:
+    """Stable hash of a profile's content, independent of key order"""
+    return hashlib.sha256(_encode_canonical(profile).encode('utf-8')).hexdigest()
+
+class ProfileStore:
+    """
+    Every profile ever scraped, keyed on its canonical LinkedIn URL
+    
+    Each row keeps the last scraped profile, when it was fetched, when its
+    content last changed (by hash) and which college it was found for. An
+    incremental crawl asks is_fresh() before paying for a scrape and put()s
+    what it fetched, so the store is the merged dataset across all runs.
+    """
+    
+    def __init__(self, path: str = "live_results/profiles.db", max_age: float = DEFAULT_MAX_AGE):
+        """
+        Open the store
+        
+        Args:
+            path: SQLite database file
+            max_age: Seconds after which a stored profile is considered stale
+        """
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS profiles (
+                url TEXT PRIMARY KEY,
+                college TEXT,
+                profile TEXT,
+                content_hash TEXT,
+                first_seen REAL,
+                fetched_at REAL,
+                changed_at REAL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_profiles_college ON profiles (college)')
+        self._conn.commit()
+    
+    def get(self, url: str, max_age: float = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a fresh stored profile
+        
+        Args:
+            url: LinkedIn profile URL in any spelling
+            max_age: Override the store's freshness window in seconds
+        
+        Returns:
+            The stored profile, or None if unknown or older than the window
+        """
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            row = self._conn.execute('SELECT profile, fetched_at FROM profiles WHERE url = ?',
+                                     (canonical_profile_url(url),)).fetchone()
+        if row is None or time.time() - row[1] > max_age:
+            return None
+        return json.loads(row[0])
+    
+    def is_fresh(self, url: str, max_age: float = None) -> bool:
+        """Whether the profile was fetched within the freshness window"""
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            row = self._conn.execute('SELECT fetched_at FROM profiles WHERE url = ?',
+                                     (canonical_profile_url(url),)).fetchone()
+        return row is not None and time.time() - row[0] <= max_age
+    
+    def put(self, url: str, profile: Dict[str, Any], college: str = None) -> bool:
+        """
+        Record a freshly scraped profile
+        
+        Args:
+            url: LinkedIn profile URL in any spelling
+            profile: Scraped profile data
+            college: College the profile was found for; an existing value is kept when None
+        
+        Returns:
+            True if the profile is new or its content changed since the last fetch
+        """
+        key = canonical_profile_url(url)
+        digest = content_hash(profile)
+        now = time.time()
+        
+        with self._lock:
+            row = self._conn.execute('SELECT content_hash FROM profiles WHERE url = ?', (key,)).fetchone()
+            changed = row is None or row[0] != digest
+            if changed:
+                self._conn.execute('''
+                    INSERT INTO profiles (url, college, profile, content_hash, first_seen, fetched_at, changed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (url) DO UPDATE SET
+                        college = COALESCE(excluded.college, profiles.college),
+                        profile = excluded.profile,
+                        content_hash = excluded.content_hash,
+                        fetched_at = excluded.fetched_at,
+                        changed_at = excluded.changed_at
+                ''', (key, college, _encode_canonical(profile), digest, now, now, now))
+            else:
+                # Same content: only the fetch time moves, the stored JSON is not rewritten
+                self._conn.execute('UPDATE profiles SET fetched_at = ?, college = COALESCE(?, college) WHERE url = ?',
+                                   (now, college, key))
+            self._conn.commit()
+        return changed
+    
+    def college_profiles(self, college: str) -> Iterator[Dict[str, Any]]:
+        """Yield every stored profile found for a college, fresh or not"""
+        with self._lock:
+            rows = self._conn.execute('SELECT profile FROM profiles WHERE college = ? ORDER BY first_seen',
+                                      (college,)).fetchall()
+        for (profile,) in rows:
+            yield json.loads(profile)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Stored, fresh and stale profile counts"""
+        cutoff = time.time() - self.max_age
+        with self._lock:
+            total, fresh = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(fetched_at >= ?), 0) FROM profiles', (cutoff,)
+            ).fetchone()
+        return {'profiles': total, 'fresh': fresh, 'stale': total - fresh}
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
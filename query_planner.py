@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Search Query Planner
+Cached, paginated LinkedIn URL discovery that stops as soon as enough new profiles are found
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+import logging
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator, Set
+
+from dedup import canonical_profile_url
+
+logger = logging.getLogger(__name__)
+
+SEARCH_PAGE_SIZE = 10               # Organic results on one Google results page
+DEFAULT_SEARCH_TTL = 24 * 3600      # Search rankings change slowly; re-run a query at most daily
+DEFAULT_MAX_PAGES = 5
+
+class SearchResultCache:
+    """On-disk cache of the profile URLs found on each page of a search query"""
+    
+    def __init__(self, path: str = "cache/search.db", ttl: float = DEFAULT_SEARCH_TTL):
+        """
+        Initialize the cache
+        
+        Args:
+            path: SQLite database file
+            ttl: Seconds a cached results page stays fresh
+        """
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS search_pages (
+                query TEXT,
+                page INTEGER,
+                urls TEXT,
+                fetched_at REAL,
+                PRIMARY KEY (query, page)
+            )
+        ''')
+        self._conn.commit()
+    
+    def get(self, query: str, page: int) -> Optional[List[str]]:
+        """Cached URLs for a results page, or None if absent or older than the TTL"""
+        with self._lock:
+            row = self._conn.execute('SELECT urls, fetched_at FROM search_pages WHERE query = ? AND page = ?',
+                                     (query.lower(), page)).fetchone()
+            if row is None or time.time() - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+    
+    def put(self, query: str, page: int, urls: List[str]):
+        """Store the URLs found on a results page"""
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO search_pages (query, page, urls, fetched_at) VALUES (?, ?, ?, ?)',
+                               (query.lower(), page, json.dumps(urls), time.time()))
+            self._conn.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and number of cached pages"""
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM search_pages').fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+class QueryPlanner:
+    """
+    Decide which search result pages to pay for
+    
+    Queries are walked breadth-first: page 0 of every query, then page 1 of
+    the queries whose last page still produced unseen profiles, and so on.
+    Discovery stops the moment the target number of new URLs is reached, a
+    query is dropped as soon as one of its pages adds nothing new, and
+    pages already fetched within the cache TTL cost nothing. The number of
+    paid searches therefore tracks the number of new URLs wanted rather
+    than the number of query templates.
+    """
+    
+    def __init__(self, fetch_page: Callable[[str, int], List[str]], cache: SearchResultCache = None,
+                 max_pages: int = DEFAULT_MAX_PAGES):
+        """
+        Initialize the planner
+        
+        Args:
+            fetch_page: Sends one paid search: (query, page number) -> profile URLs
+            cache: Cache of earlier results pages (None disables caching)
+            max_pages: Deepest page requested for any query
+        """
+        self.fetch_page = fetch_page
+        self.cache = cache
+        self.max_pages = max_pages
+        self.pages_fetched = 0
+        self.pages_cached = 0
+        self._lock = threading.Lock()
+    
+    def page(self, query: str, page: int) -> List[str]:
+        """
+        Profile URLs on one results page, from the cache when fresh
+        
+        Empty pages are not cached, since a failed request also comes back empty.
+        """
+        if self.cache is not None:
+            urls = self.cache.get(query, page)
+            if urls is not None:
+                with self._lock:
+                    self.pages_cached += 1
+                return urls
+        
+        urls = self.fetch_page(query, page)
+        with self._lock:
+            self.pages_fetched += 1
+        if urls and self.cache is not None:
+            self.cache.put(query, page, urls)
+        return urls
+    
+    def worth_next_page(self, page: int, urls: List[str], new_urls: int) -> bool:
+        """Whether a query's next page is likely to add profiles, given what this page added"""
+        return new_urls > 0 and bool(urls) and page + 1 < self.max_pages
+    
+    def discover(self, queries: Iterable[str], target: int, seen: Set[str] = None) -> Iterator[str]:
+        """
+        Yield up to target profile URLs not seen before
+        
+        Pages are requested lazily, so a caller that stops iterating early
+        pays for no further searches.
+        
+        Args:
+            queries: Search queries, most productive first
+            target: Number of new URLs wanted
+            seen: Canonical URLs already known; updated in place
+        
+        Yields:
+            Profile URLs, each one new
+        """
+        seen = set() if seen is None else seen
+        found = 0
+        active = list(queries)
+        page = 0
+        while active and found < target:
+            still_active = []
+            for query in active:
+                urls = self.page(query, page)
+                new_urls = 0
+                for url in urls:
+                    key = canonical_profile_url(url)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    new_urls += 1
+                    found += 1
+                    yield url
+                    if found >= target:
+                        return
+                if self.worth_next_page(page, urls, new_urls):
+                    still_active.append(query)
+            active = still_active
+            page += 1
+        logger.info(f"Search discovery found {found}/{target} new profiles "
+                    f"({self.pages_fetched} pages fetched, {self.pages_cached} from cache so far)")
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter
+Per-provider token-bucket pacing with Retry-After handling and adaptive backoff, shared by every API client
+"""
+
+import time
+import random
+import threading
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Tuple, Optional, Callable
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Sustained requests per second and burst size for each provider
+PROVIDER_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    'hunter': (10.0, 10),
+    'scrapingbee': (5.0, 5),
+    'scrapeowl': (5.0, 5),
+    'scrapfly': (5.0, 5),
+    'linkedin': (2.0, 5),
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY = 1.0    # First backoff ceiling in seconds, doubled per attempt
+DEFAULT_MAX_DELAY = 60.0
+
+class TokenBucket:
+    """
+    Token bucket that hands out request slots at an adjustable rate with bursts
+    
+    Kept as a schedule of slots rather than a token count: each caller
+    reserves the next free slot, one 1/rate interval after the previous one,
+    and up to `burst` slots may fall due at once. Callers reserve a slot
+    under a lock and then sleep outside it until the slot comes due, so
+    waiting threads are served in arrival order without holding the lock
+    while they sleep. A rate change only spaces out slots reserved after it;
+    slots already handed out keep their times.
+    """
+    
+    def __init__(self, rate: float, burst: int = None, name: str = '', min_rate: float = None):
+        """
+        Initialize the bucket
+        
+        Args:
+            rate: Sustained requests per second; also the ceiling the rate recovers to
+            burst: Requests allowed back-to-back when the bucket is full (defaults to one second's worth)
+            name: Provider name for logging
+            min_rate: Floor for adaptive slow-downs (defaults to rate / 16)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 16
+        self.burst = burst or max(1, int(rate))
+        self.name = name
+        self._tolerance = (self.burst - 1) / rate     # How far ahead of schedule a burst may run
+        self._next_slot = time.monotonic()
+        self._paused_until = 0.0
+        self._slowed_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take the next free slot; returns seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            # After a pause the schedule restarts at the deadline without a burst
+            slot = max(self._next_slot, now, self._paused_until + self._tolerance)
+            self._next_slot = slot + 1.0 / self.rate
+            return max(0.0, slot - self._tolerance - now)
+    
+    def acquire(self):
+        """Block the calling thread until a request may be sent"""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+    
+    def pause(self, seconds: float) -> bool:
+        """
+        Hand out no slots for the next `seconds`, e.g. to honour a Retry-After header
+        
+        Overlapping pauses do not add up: the bucket resumes at the latest
+        deadline asked for.
+        
+        Returns:
+            True if this starts a new pause, False if one was already in effect
+        """
+        with self._lock:
+            now = time.monotonic()
+            started = now >= self._paused_until
+            self._paused_until = max(self._paused_until, now + seconds)
+            return started
+    
+    def slow_down(self, factor: float = 0.5, window: float = 0.0):
+        """
+        Multiplicatively lower the rate after a throttling or server error
+        
+        Args:
+            factor: Multiplier applied to the rate
+            window: Seconds during which further slow-downs are ignored, so errors
+                from one burst of concurrent requests lower the rate only once
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._slowed_until:
+                return
+            self._slowed_until = now + window
+            new_rate = max(self.min_rate, self.rate * factor)
+            if new_rate < self.rate:
+                logger.warning(f"Lowering {self.name or 'provider'} rate to {new_rate:.2f} req/s")
+            self._set_rate(new_rate)
+    
+    def speed_up(self, step: float = None):
+        """Additively raise the rate back toward its configured ceiling after a success"""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._set_rate(min(self.max_rate, self.rate + (step or self.max_rate / 20)))
+    
+    def _set_rate(self, rate: float):
+        # Keep the allowed burst at `burst` requests whatever the current spacing;
+        # the schedule moves with the tolerance so the next slot still falls due when it would have
+        tolerance = (self.burst - 1) / rate
+        self._next_slot += tolerance - self._tolerance
+        self._tolerance = tolerance
+        self.rate = rate
+
+class RateLimiter:
+    """
+    Provider-wide request policy: token-bucket pacing plus retries with backoff
+    
+    Every request is paced through the bucket. A 429 or 5xx response (or a
+    connection error) is retried after the Retry-After delay when the server
+    sends one, otherwise after a full-jitter exponential backoff. Throttling
+    also pauses the bucket for every other caller and halves its rate (once
+    per pause, however many requests were throttled together), and server
+    errors cut it by a quarter (once per backoff window); the
+    rate climbs back additively as requests succeed, so throughput settles at
+    the highest rate the provider currently accepts.
+    """
+    
+    def __init__(self, provider: str, rate: float = None, burst: int = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES, base_delay: float = DEFAULT_BASE_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY):
+        """
+        Initialize the limiter
+        
+        Args:
+            provider: Provider name; rate and burst default to PROVIDER_RATE_LIMITS
+            rate: Sustained requests per second
+            burst: Requests allowed back-to-back
+            max_retries: Retries after the first attempt before giving up
+            base_delay: Backoff ceiling for the first retry in seconds
+            max_delay: Upper bound on any single wait
+        """
+        default_rate, default_burst = PROVIDER_RATE_LIMITS.get(provider, (1.0, 1))
+        self.provider = provider
+        self.bucket = TokenBucket(rate or default_rate, burst or default_burst, name=provider)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+        self.throttled = 0
+    
+    def send(self, request: Callable[..., requests.Response], *args, **kwargs) -> requests.Response:
+        """
+        Send a request under this provider's rate limit, retrying transient failures
+        
+        Args:
+            request: Function that sends the request, e.g. transport.get
+            *args, **kwargs: Passed to request
+        
+        Returns:
+            The first non-retryable response, or the last response once retries
+            run out; callers still call raise_for_status() as usual. Connection
+            errors are re-raised after the final attempt.
+        """
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                response = request(*args, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{self.provider} request failed ({e}); "
+                               f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    self.bucket.speed_up()
+                    return response
+                if attempt >= self.max_retries:
+                    logger.error(f"{self.provider} still returned {response.status_code} after {self.max_retries} retries")
+                    return response
+                
+                retry_after = self._retry_after(response)
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                if response.status_code == 429:
+                    self.throttled += 1
+                    # Concurrent 429s from one burst share a single pause and a single slow-down
+                    if self.bucket.pause(delay):
+                        self.bucket.slow_down(0.5)
+                else:
+                    # Likewise one slow-down per backoff window for a burst of server errors
+                    self.bucket.slow_down(0.75, max(delay, self.base_delay))
+                logger.warning(f"{self.provider} returned {response.status_code}; "
+                               f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+            
+            self.retries += 1
+            attempt += 1
+            time.sleep(delay)
+    
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+    
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Seconds requested by a Retry-After header (delta-seconds or HTTP date), if any"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return min(self.max_delay, max(0.0, seconds))
+    
+    def stats(self) -> Dict[str, float]:
+        """Current rate and retry counters"""
+        return {
+            'rate': round(self.bucket.rate, 3),
+            'max_rate': self.bucket.max_rate,
+            'retries': self.retries,
+            'throttled': self.throttled
+        }
+
+_shared_limiters: Dict[str, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """Return the process-wide limiter for a provider, creating it on first use"""
+    with _shared_lock:
+        if provider not in _shared_limiters:
+            _shared_limiters[provider] = RateLimiter(provider)
+        return _shared_limiters[provider]
+
+def configure_rate_limiter(provider: str, **kwargs) -> RateLimiter:
+    """
+    Replace the process-wide limiter for a provider
+    
+    Clients created afterwards share the new limiter; existing clients keep theirs.
+    
+    Args:
+        provider: Provider name
+        **kwargs: RateLimiter constructor arguments (rate, burst, max_retries, ...)
+    
+    Returns:
+        The new shared limiter
+    """
+    with _shared_lock:
+        _shared_limiters[provider] = RateLimiter(provider, **kwargs)
+        logger.info(f"Configured {provider} rate limiter: {kwargs}")
+        return _shared_limiters[provider]
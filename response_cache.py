@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Response Cache
+Persistent SQLite cache for scraped pages with TTL expiry and LRU size eviction
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+import logging
+from typing import Optional, Dict, Any
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 7 * 24 * 3600          # One week
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB of compressed content
+
+def normalize_profile_url(url: str) -> str:
+    """
+    Normalize a LinkedIn URL so equivalent spellings share one cache entry
+    
+    'http://linkedin.com/in/X/?trk=abc' and 'https://www.linkedin.com/in/x'
+    both become 'https://linkedin.com/in/x'.
+    """
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    path = parsed.path.rstrip('/').lower()
+    return f"https://{host}{path}"
+
+class ResponseCache:
+    """Content-addressed on-disk cache keyed on normalized URL plus scraping service"""
+    
+    def __init__(self, path: str = "cache/responses.db", ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache
+        
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry stays fresh
+            max_bytes: Compressed size cap; least recently used entries are evicted beyond it
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                service TEXT,
+                content BLOB,
+                size INTEGER,
+                created_at REAL,
+                last_access REAL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)')
+        self._conn.commit()
+        
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+    
+    @staticmethod
+    def make_key(url: str, service: str) -> str:
+        """Cache key for a URL fetched through a given service"""
+        return hashlib.sha256(f"{service.lower()}|{normalize_profile_url(url)}".encode('utf-8')).hexdigest()
+    
+    def get(self, url: str, service: str) -> Optional[str]:
+        """
+        Look up a cached response
+        
+        Args:
+            url: Page URL
+            service: Scraping service that fetched it
+        
+        Returns:
+            The cached content, or None if absent or older than the TTL
+        """
+        key = self.make_key(url, service)
+        now = time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT content, created_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            
+            self._conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+            self.hits += 1
+        
+        return zlib.decompress(row[0]).decode('utf-8')
+    
+    def put(self, url: str, service: str, content: str):
+        """
+        Store a response, evicting least recently used entries if over the size cap
+        
+        Args:
+            url: Page URL
+            service: Scraping service that fetched it
+            content: Response body
+        """
+        key = self.make_key(url, service)
+        blob = zlib.compress(content.encode('utf-8'))
+        now = time.time()
+        
+        with self._lock:
+            old = self._conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self._conn.execute('''
+                INSERT OR REPLACE INTO responses (key, url, service, content, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (key, normalize_profile_url(url), service.lower(), blob, len(blob), now, now))
+            self._total_bytes += len(blob) - (old[0] if old else 0)
+            
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            
+            self._conn.commit()
+    
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until under the size cap"""
+        cursor = self._conn.execute('DELETE FROM responses WHERE created_at < ?', (time.time() - self.ttl,))
+        evicted = cursor.rowcount
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        
+        if self._total_bytes > self.max_bytes:
+            rows = self._conn.execute('SELECT key, size FROM responses ORDER BY last_access').fetchall()
+            doomed = []
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                self._total_bytes -= size
+            self._conn.executemany('DELETE FROM responses WHERE key = ?', doomed)
+            evicted += len(doomed)
+        
+        logger.info(f"Evicted {evicted} cached responses ({self._total_bytes} bytes remain)")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': entries,
+                'bytes': self._total_bytes
+            }
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
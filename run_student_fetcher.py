@@ -5,6 +5,7 @@ Easy to use command-line interface for fetching student data
 """
 
 import argparse
+import glob
 import sys
 import os
 import logging
@@ -13,9 +14,8 @@ from typing import List
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from linkedin_student_fetcher import LinkedInStudentFetcher
-from data_processor import DataAggregator, StudentDataProcessor
-from linkedin_api_client import LinkedInAPIClient
+# Commands import what they use, so short invocations (e.g. from cron) do not pay for
+# pandas, Selenium or the live API clients; see 'python benchmarks.py startup'
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration"""
@@ -31,6 +31,9 @@ def search_single_college(college_name: str, limit: int = 10, format: str = 'jso
     setup_logging(verbose)
     logger = logging.getLogger(__name__)
     
+    from linkedin_student_fetcher import LinkedInStudentFetcher
+    from data_processor import StudentDataProcessor
+    
     logger.info(f"Searching for students from: {college_name}")
     
     try:
@@ -57,6 +60,9 @@ def search_single_college(college_name: str, limit: int = 10, format: str = 'jso
         elif format.lower() == 'excel':
             processor = StudentDataProcessor()
             output_file = processor.export_to_excel(students, f"{filename}_students.xlsx")
+        elif format.lower() == 'parquet':
+            processor = StudentDataProcessor()
+            output_file = processor.export_to_parquet(students, f"{filename}_students.parquet")
         else:
             logger.error(f"Unsupported format: {format}")
             return
@@ -80,6 +86,9 @@ def search_multiple_colleges(college_names: List[str], limit: int = 10, format:
     setup_logging(verbose)
     logger = logging.getLogger(__name__)
     
+    from linkedin_student_fetcher import LinkedInStudentFetcher
+    from data_processor import StudentDataProcessor
+    
     logger.info(f"Searching for students from {len(college_names)} colleges")
     
     try:
@@ -110,12 +119,15 @@ def search_multiple_colleges(college_names: List[str], limit: int = 10, format:
             output_file = processor.export_to_csv(all_students, "multiple_colleges_students.csv")
         elif format.lower() == 'excel':
             output_file = processor.export_to_excel(all_students, "multiple_colleges_students.xlsx")
+        elif format.lower() == 'parquet':
+            output_file = processor.export_to_parquet(all_students, "multiple_colleges_students.parquet")
         else:
             logger.error(f"Unsupported format: {format}")
             return
         
         # Also save to database
         processor.save_to_database(all_students)
+        processor.close()
         
         logger.info(f"Data exported to: {output_file}")
         logger.info("Data also saved to database: data/students.db")
@@ -139,6 +151,8 @@ def comprehensive_search(college_name: str, methods: List[str] = None, limit: in
     setup_logging(verbose)
     logger = logging.getLogger(__name__)
     
+    from data_processor import DataAggregator
+    
     if methods is None:
         methods = ['mock', 'google_search']  # Safe methods by default
     
@@ -169,6 +183,7 @@ def comprehensive_search(college_name: str, methods: List[str] = None, limit: in
         
         # Save to database
         processor.save_to_database(student_data)
+        processor.close()
         
         logger.info("Data exported to:")
         logger.info(f"  JSON: {json_file}")
@@ -190,6 +205,102 @@ def comprehensive_search(college_name: str, methods: List[str] = None, limit: in
         logger.error(f"Error in comprehensive search: {e}")
         sys.exit(1)
 
+def batch_search(college_names: List[str], college_file: str = None, limit: int = 50,
+                 methods: List[str] = None, resume: bool = False, verbose: bool = False,
+                 incremental: bool = False, max_age_days: float = None, guess_domains: bool = False,
+                 college_registry: str = None, fresh: bool = False):
+    """Crawl many colleges with the live APIs through one global scheduler"""
+    setup_logging(verbose)
+    logger = logging.getLogger(__name__)
+    
+    from batch_orchestrator import BatchOrchestrator
+    from live_linkedin_fetcher import LiveLinkedInFetcher
+    from hunter_api_client import configure_college_registry
+    
+    colleges = list(college_names)
+    if college_file:
+        with open(college_file, encoding='utf-8') as f:
+            colleges.extend(line.strip() for line in f if line.strip())
+    
+    if not colleges:
+        logger.error("No colleges given; pass names or --file")
+        sys.exit(1)
+    
+    try:
+        # With --resume, work journaled by an interrupted run is replayed instead of re-requested;
+        # without it, an interrupted run's journal is only discarded when --fresh is given
+        # With --incremental, profiles scraped by earlier runs within the freshness window are reused
+        # Colleges missing from the registry get no Hunter.io lookup unless --guess-domains is given
+        if college_registry:
+            configure_college_registry(college_registry)
+        fetcher = LiveLinkedInFetcher(checkpoint_path=os.path.join('live_results', 'checkpoint.jsonl'),
+                                      resume=resume, incremental=incremental, max_age_days=max_age_days,
+                                      guess_domains=guess_domains, fresh=fresh)
+        results = BatchOrchestrator(fetcher).run(colleges, limit=limit, methods=methods)
+        fetcher.close()
+        
+        logger.info("Summary by college:")
+        for college, students in results.items():
+            logger.info(f"  {college}: {len(students)} students")
+        logger.info("Per-college results saved in live_results/ directory")
+    
+    except Exception as e:
+        logger.error(f"Error in batch crawl: {e}")
+        sys.exit(1)
+
+def dedupe_results(paths: List[str], output: str = None, window: int = None, verbose: bool = False):
+    """Merge duplicate students across stored crawl results into one JSON Lines file"""
+    setup_logging(verbose)
+    logger = logging.getLogger(__name__)
+    
+    from dedup import DEFAULT_WINDOW, deduplicate_files
+    
+    if not paths:
+        paths = sorted(glob.glob(os.path.join('live_results', '*_live_*.jsonl')))
+    if not paths:
+        logger.error("No result files given and none found in live_results/")
+        sys.exit(1)
+    
+    output = output or os.path.join('live_results', 'all_students_deduplicated.jsonl')
+    paths = [path for path in paths if os.path.abspath(path) != os.path.abspath(output)]
+    
+    try:
+        read, written = deduplicate_files(paths, output, window or DEFAULT_WINDOW)
+        logger.info(f"{read} profiles from {len(paths)} files -> {written} unique students")
+        logger.info(f"Merged results saved to: {output}")
+    
+    except Exception as e:
+        logger.error(f"Error deduplicating results: {e}")
+        sys.exit(1)
+
+def verify_emails(paths: List[str], output: str = None, max_age_days: float = None, workers: int = 4,
+                  verbose: bool = False):
+    """Verify every address in stored results through Hunter.io, skipping recently verified ones"""
+    setup_logging(verbose)
+    logger = logging.getLogger(__name__)
+    
+    from email_verifier import BulkEmailVerifier, VerificationCache, read_emails, DEFAULT_VERIFICATION_TTL
+    
+    if not paths:
+        paths = sorted(glob.glob(os.path.join('live_results', '*_live_*.jsonl')))
+    if not paths:
+        logger.error("No input files given and none found in live_results/")
+        sys.exit(1)
+    
+    output = output or os.path.join('live_results', 'email_verifications.jsonl')
+    ttl = max_age_days * 24 * 3600 if max_age_days is not None else DEFAULT_VERIFICATION_TTL
+    
+    try:
+        verifier = BulkEmailVerifier(cache=VerificationCache(ttl=ttl), max_workers=workers)
+        stats = verifier.verify_to_file(read_emails(paths), output)
+        logger.info(f"{stats['addresses']} addresses: {stats['verified']} verified, {stats['cached']} from cache, "
+                    f"{stats['duplicates']} duplicates, {stats['invalid']} invalid, {stats['failed']} failed")
+        logger.info(f"Verification results saved to: {output}")
+    
+    except Exception as e:
+        logger.error(f"Error verifying emails: {e}")
+        sys.exit(1)
+
 def main():
     """Main CLI interface"""
     parser = argparse.ArgumentParser(
@@ -206,6 +317,24 @@ Examples:
   # Comprehensive search with multiple methods
   python run_student_fetcher.py comprehensive "HKB College of Engineering" --methods mock google_search
 
+  # Crawl many colleges with the live APIs (one global scheduler)
+  python run_student_fetcher.py batch --file colleges.txt --limit 50
+
+  # Pick up an interrupted batch crawl without paying for finished requests again
+  python run_student_fetcher.py batch --file colleges.txt --limit 50 --resume
+  
+  # Nightly refresh: only scrape profiles that are new or more than a day old
+  python run_student_fetcher.py batch --file colleges.txt --incremental --max-age-days 1
+  
+  # Resolve college names through a national registry file (name, domains, aliases)
+  python run_student_fetcher.py batch --file colleges.txt --college-registry colleges.csv
+  
+  # Merge duplicate students across every stored crawl
+  python run_student_fetcher.py dedupe --output all_students.jsonl
+  
+  # Verify every collected email address overnight (results cached for 30 days)
+  python run_student_fetcher.py verify live_results/*.jsonl emails.txt --workers 8
+
   # Verbose output
   python run_student_fetcher.py single "HKB College of Engineering" --verbose
         """
@@ -219,13 +348,13 @@ Examples:
     single_parser = subparsers.add_parser('single', help='Search students from a single college')
     single_parser.add_argument('college', help='College name (e.g., "HKB College of Engineering")')
     single_parser.add_argument('--limit', '-l', type=int, default=10, help='Maximum number of students (default: 10)')
-    single_parser.add_argument('--format', '-f', choices=['json', 'csv', 'excel'], default='json', help='Output format (default: json)')
+    single_parser.add_argument('--format', '-f', choices=['json', 'csv', 'excel', 'parquet'], default='json', help='Output format (default: json)')
     
     # Multiple colleges search
     multiple_parser = subparsers.add_parser('multiple', help='Search students from multiple colleges')
     multiple_parser.add_argument('colleges', nargs='+', help='List of college names')
     multiple_parser.add_argument('--limit', '-l', type=int, default=10, help='Maximum number of students per college (default: 10)')
-    multiple_parser.add_argument('--format', '-f', choices=['json', 'csv', 'excel'], default='json', help='Output format (default: json)')
+    multiple_parser.add_argument('--format', '-f', choices=['json', 'csv', 'excel', 'parquet'], default='json', help='Output format (default: json)')
     
     # Comprehensive search
     comprehensive_parser = subparsers.add_parser('comprehensive', help='Comprehensive search using multiple methods')
@@ -236,6 +365,40 @@ Examples:
                                     help='Data collection methods (default: mock google_search)')
     comprehensive_parser.add_argument('--limit', '-l', type=int, default=15, help='Maximum number of students (default: 15)')
     
+    # Live batch crawl
+    batch_parser = subparsers.add_parser('batch', help='Crawl many colleges with the live APIs and a global scheduler')
+    batch_parser.add_argument('colleges', nargs='*', help='List of college names')
+    batch_parser.add_argument('--file', help='Text file with one college name per line')
+    batch_parser.add_argument('--limit', '-l', type=int, default=50, help='Maximum number of students per college (default: 50)')
+    batch_parser.add_argument('--methods', '-m', nargs='+', choices=['hunter', 'search', 'both'],
+                              default=['both'], help='Live data sources (default: both)')
+    batch_parser.add_argument('--resume', action='store_true',
+                              help='Continue an interrupted crawl from live_results/checkpoint.jsonl')
+    batch_parser.add_argument('--fresh', action='store_true',
+                              help="Discard an interrupted crawl's checkpoint and start over")
+    batch_parser.add_argument('--incremental', action='store_true',
+                              help='Only scrape profiles that are new or older than --max-age-days')
+    batch_parser.add_argument('--max-age-days', type=float, default=None,
+                              help='Freshness window for --incremental (default: 7)')
+    batch_parser.add_argument('--college-registry', help='JSON or CSV file of colleges and their email domains')
+    batch_parser.add_argument('--guess-domains', action='store_true',
+                              help="Search Hunter.io at a guessed '<name>.edu.in' domain for unregistered colleges")
+    
+    # Deduplicate stored results
+    dedupe_parser = subparsers.add_parser('dedupe', help='Merge duplicate students across stored crawl results')
+    dedupe_parser.add_argument('files', nargs='*', help='NDJSON result files (default: live_results/*_live_*.jsonl)')
+    dedupe_parser.add_argument('--output', '-o', help='Merged output file (default: live_results/all_students_deduplicated.jsonl)')
+    dedupe_parser.add_argument('--window', type=int, default=None, help='Comparison window for fuzzy name matching (default: 8)')
+    
+    # Bulk email verification
+    verify_parser = subparsers.add_parser('verify', help='Verify collected email addresses through Hunter.io')
+    verify_parser.add_argument('files', nargs='*',
+                               help='JSON/NDJSON/CSV results or text files of addresses (default: live_results/*_live_*.jsonl)')
+    verify_parser.add_argument('--output', '-o', help='NDJSON results file (default: live_results/email_verifications.jsonl)')
+    verify_parser.add_argument('--max-age-days', type=float, default=None,
+                               help='Re-verify addresses checked longer ago than this (default: 30)')
+    verify_parser.add_argument('--workers', type=int, default=4, help='Concurrent verification requests (default: 4)')
+    
     # Parse arguments
     args = parser.parse_args()
     
@@ -253,6 +416,16 @@ Examples:
     elif args.command == 'comprehensive':
         comprehensive_search(args.college, args.methods, args.limit, args.verbose)
     
+    elif args.command == 'batch':
+        batch_search(args.colleges, args.file, args.limit, args.methods, args.resume, args.verbose,
+                     args.incremental, args.max_age_days, args.guess_domains, args.college_registry, args.fresh)
+    
+    elif args.command == 'dedupe':
+        dedupe_results(args.files, args.output, args.window, args.verbose)
+    
+    elif args.command == 'verify':
+        verify_emails(args.files, args.output, args.max_age_days, args.workers, args.verbose)
+    
     else:
         parser.print_help()
         sys.exit(1)
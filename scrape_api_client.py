@@ -9,23 +9,50 @@ import json
 import time
 import os
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
-from urllib.parse import quote_plus, urlparse
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
 from bs4 import BeautifulSoup
 
+from http_transport import PooledTransport, get_transport
+from response_cache import ResponseCache
+from profile_parser import ProfileParser
+from rate_limiter import RateLimiter, get_rate_limiter
+from telemetry import Telemetry, get_telemetry
+
 logger = logging.getLogger(__name__)
 
+# Concurrent requests each provider allows on its entry-level paid plans
+SERVICE_CONCURRENCY = {
+    'scrapingbee': 5,
+    'scrapeowl': 5,
+    'scrapfly': 5,
+}
+
 class ScrapeAPIClient:
     """Client for scraping LinkedIn profiles using various scraping APIs"""
     
-    def __init__(self, api_key: str = None, service: str = 'scrapingbee'):
+    def __init__(self, api_key: str = None, service: str = 'scrapingbee', base_url: str = None,
+                 max_concurrency: int = None, request_budget: int = None, transport: PooledTransport = None,
+                 cache: ResponseCache = None, parser_backend: str = None, rate_limiter: RateLimiter = None,
+                 telemetry: Telemetry = None):
         """
         Initialize Scrape API client
         
         Args:
             api_key: API key for the scraping service
             service: Scraping service to use ('scrapingbee', 'scrapeowl', 'scrapfly')
+            base_url: Override the service endpoint (e.g. a local stub server; defaults to SCRAPE_API_URL)
+            max_concurrency: Maximum in-flight requests (defaults to the service's allowance)
+            request_budget: Maximum number of paid requests this client may send (None = unlimited)
+            transport: HTTP transport to send requests through (defaults to the shared pool)
+            cache: Persistent cache for fetched profile HTML (None disables caching)
+            parser_backend: HTML tree builder for profile pages ('lxml' or 'html.parser'; defaults to the fastest installed)
+            rate_limiter: Pacing and retry policy for paid requests (defaults to the service's shared limiter)
+            telemetry: Recorder for request and stage metrics (defaults to the process-wide one)
         """
         self.api_key = api_key or os.getenv('SCRAPE_API_KEY')
         self.service = service.lower()
@@ -45,6 +72,22 @@ class ScrapeAPIClient:
             self.base_url = "https://app.scrapingbee.com/api/v1"
             self.api_param = 'api_key'
         
+        base_url = base_url or os.getenv('SCRAPE_API_URL')
+        if base_url:
+            self.base_url = base_url
+        
+        self.max_concurrency = max_concurrency or SERVICE_CONCURRENCY.get(self.service, 1)
+        self.request_budget = request_budget
+        self.requests_sent = 0
+        self._budget_lock = threading.Lock()
+        self.transport = transport or get_transport()
+        self.cache = cache
+        self.parser = ProfileParser(parser_backend)
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.service)
+        self.telemetry = telemetry or get_telemetry()
+        self._send_profile = self.telemetry.instrument(self.transport.get, self.service, 'profile')
+        self._send_search = self.telemetry.instrument(self.transport.get, self.service, 'search')
+        
         if not self.api_key:
             logger.warning(f"No {self.service} API key provided. Please get one from the service provider.")
     
@@ -58,13 +101,64 @@ class ScrapeAPIClient:
         Returns:
             Dictionary containing scraped profile data
         """
+        result = self.scrape_profile_result(linkedin_url)
+        if result['error']:
+            logger.error(result['error'])
+        return result['profile']
+    
+    def scrape_profile_result(self, linkedin_url: str) -> Dict[str, Any]:
+        """
+        Scrape a LinkedIn profile page, reporting why it failed instead of logging it
+        
+        Args:
+            linkedin_url: LinkedIn profile URL
+        
+        Returns:
+            Dictionary with 'url', 'profile' (empty on failure), 'error' (None on
+            success) and 'from_cache' (True if no paid request was made)
+        """
+        with self.telemetry.stage('fetch'):
+            html_content, error, from_cache = self._fetch_html(linkedin_url)
+        if error:
+            return {'url': linkedin_url, 'profile': {}, 'error': error, 'from_cache': from_cache}
+        
+        with self.telemetry.stage('parse'):
+            profile_data = self._parse_linkedin_html(html_content, linkedin_url)
+        return {'url': linkedin_url, 'profile': profile_data, 'error': None, 'from_cache': from_cache}
+    
+    def fetch_profile_html(self, linkedin_url: str) -> Tuple[str, Optional[str]]:
+        """
+        Download a rendered LinkedIn profile page without parsing it
+        
+        Served from the response cache when possible, so callers can move the
+        CPU-bound parse elsewhere (see scrape_pipeline.ScrapePipeline).
+        
+        Args:
+            linkedin_url: LinkedIn profile URL
+        
+        Returns:
+            Tuple of (HTML content, error message); the HTML is empty on failure
+        """
+        with self.telemetry.stage('fetch'):
+            html_content, error, _ = self._fetch_html(linkedin_url)
+        return html_content, error
+    
+    def _fetch_html(self, linkedin_url: str) -> Tuple[str, Optional[str], bool]:
+        """Fetch a profile page; returns (HTML content, error message, served from cache)"""
         if not self.api_key:
-            logger.error("API key is required for scraping")
-            return {}
+            return '', "API key is required for scraping", False
         
         if not linkedin_url or 'linkedin.com' not in linkedin_url.lower():
-            logger.error(f"Invalid LinkedIn URL: {linkedin_url}")
-            return {}
+            return '', f"Invalid LinkedIn URL: {linkedin_url}", False
+        
+        if self.cache:
+            cached_html = self.cache.get(linkedin_url, self.service)
+            if cached_html is not None:
+                logger.info(f"Using cached LinkedIn profile: {linkedin_url}")
+                return cached_html, None, True
+        
+        if not self._reserve_request():
+            return '', f"Request budget of {self.request_budget} exhausted, skipping: {linkedin_url}", False
         
         try:
             logger.info(f"Scraping LinkedIn profile: {linkedin_url}")
@@ -93,10 +187,10 @@ class ScrapeAPIClient:
                     'country': 'US'
                 }
             
-            response = requests.get(self.base_url, params=params, timeout=60)
+            response = self.rate_limiter.send(self._send_profile, self.base_url, params=params, timeout=60)
             response.raise_for_status()
             
-            # Parse the HTML content
+            # Extract the HTML content
             if self.service == 'scrapfly':
                 # ScrapFly returns JSON
                 data = response.json()
@@ -106,18 +200,24 @@ class ScrapeAPIClient:
                 html_content = response.text
             
             if html_content:
-                profile_data = self._parse_linkedin_html(html_content, linkedin_url)
-                return profile_data
+                if self.cache:
+                    self.cache.put(linkedin_url, self.service, html_content)
+                return html_content, None, False
             else:
-                logger.error("No HTML content received")
-                return {}
+                return '', "No HTML content received", False
                 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error scraping LinkedIn profile: {e}")
-            return {}
+            return '', f"Error scraping LinkedIn profile: {e}", False
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {}
+            return '', f"Unexpected error: {e}", False
+    
+    def _reserve_request(self) -> bool:
+        """Count one outgoing request against the budget; False once it is spent"""
+        with self._budget_lock:
+            if self.request_budget is not None and self.requests_sent >= self.request_budget:
+                return False
+            self.requests_sent += 1
+            return True
     
     def _parse_linkedin_html(self, html_content: str, linkedin_url: str) -> Dict[str, Any]:
         """
@@ -130,163 +230,47 @@ class ScrapeAPIClient:
         Returns:
             Dictionary containing parsed profile data
         """
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            profile_data = {
-                'linkedin_url': linkedin_url,
-                'name': '',
-                'headline': '',
-                'location': '',
-                'about': '',
-                'experience': [],
-                'education': [],
-                'skills': [],
-                'connections': '',
-                'source': 'Scrape API',
-                'raw_data_available': True
-            }
-            
-            # Extract name
-            name_selectors = [
-                'h1[class*="text-heading-xlarge"]',
-                '.pv-text-details__left-panel h1',
-                'h1.text-heading-xlarge',
-                '.top-card-layout__title',
-                '.pv-top-card--list li:first-child h1'
-            ]
-            
-            for selector in name_selectors:
-                name_elem = soup.select_one(selector)
-                if name_elem:
-                    profile_data['name'] = name_elem.get_text(strip=True)
-                    break
-            
-            # Extract headline
-            headline_selectors = [
-                'div[class*="text-body-medium break-words"]',
-                '.pv-text-details__left-panel .text-body-medium',
-                '.top-card-layout__headline',
-                '.pv-top-card--list-bullet .text-body-medium'
-            ]
-            
-            for selector in headline_selectors:
-                headline_elem = soup.select_one(selector)
-                if headline_elem:
-                    profile_data['headline'] = headline_elem.get_text(strip=True)
-                    break
-            
-            # Extract location
-            location_selectors = [
-                'span[class*="text-body-small inline t-black--light break-words"]',
-                '.pv-text-details__left-panel .text-body-small',
-                '.top-card-layout__first-subline',
-                '.pv-top-card__location'
-            ]
-            
-            for selector in location_selectors:
-                location_elem = soup.select_one(selector)
-                if location_elem:
-                    location_text = location_elem.get_text(strip=True)
-                    # Clean up location text
-                    if 'connections' not in location_text.lower():
-                        profile_data['location'] = location_text
-                        break
-            
-            # Extract about section
-            about_selectors = [
-                '#about + * .pv-shared-text-with-see-more',
-                '.pv-about__summary-text',
-                'section[data-section="summary"] .pv-shared-text-with-see-more'
-            ]
-            
-            for selector in about_selectors:
-                about_elem = soup.select_one(selector)
-                if about_elem:
-                    profile_data['about'] = about_elem.get_text(strip=True)
-                    break
-            
-            # Extract experience
-            experience_items = soup.select('.pv-entity__summary-info, .pv-profile-section__list-item')
-            for item in experience_items[:5]:  # Limit to first 5 experiences
-                title_elem = item.select_one('h3, .pv-entity__summary-info-v2 h3')
-                company_elem = item.select_one('.pv-entity__secondary-title, .pv-entity__summary-info-v2 .text-body-small')
-                
-                if title_elem:
-                    experience = {
-                        'title': title_elem.get_text(strip=True),
-                        'company': company_elem.get_text(strip=True) if company_elem else '',
-                        'duration': ''
-                    }
-                    
-                    # Try to extract duration
-                    duration_elem = item.select_one('.pv-entity__bullet-item, .pv-entity__date-range')
-                    if duration_elem:
-                        experience['duration'] = duration_elem.get_text(strip=True)
-                    
-                    profile_data['experience'].append(experience)
-            
-            # Extract education
-            education_items = soup.select('.pv-profile-section.education .pv-entity__summary-info')
-            for item in education_items:
-                school_elem = item.select_one('h3')
-                degree_elem = item.select_one('.pv-entity__degree-name .pv-entity__comma-item')
-                
-                if school_elem:
-                    education = {
-                        'school': school_elem.get_text(strip=True),
-                        'degree': degree_elem.get_text(strip=True) if degree_elem else '',
-                        'field_of_study': '',
-                        'dates': ''
-                    }
-                    
-                    # Try to extract field of study
-                    field_elem = item.select_one('.pv-entity__fos .pv-entity__comma-item')
-                    if field_elem:
-                        education['field_of_study'] = field_elem.get_text(strip=True)
-                    
-                    # Try to extract dates
-                    dates_elem = item.select_one('.pv-entity__dates .pv-entity__comma-item')
-                    if dates_elem:
-                        education['dates'] = dates_elem.get_text(strip=True)
-                    
-                    profile_data['education'].append(education)
-            
-            # Extract skills
-            skill_items = soup.select('.pv-skill-category-entity__name-text, .pv-skill-entity__skill-name')
-            for item in skill_items[:10]:  # Limit to first 10 skills
-                skill_text = item.get_text(strip=True)
-                if skill_text and skill_text not in profile_data['skills']:
-                    profile_data['skills'].append(skill_text)
-            
-            # Extract connections count
-            connections_elem = soup.select_one('.t-bold .t-black, .pv-top-card--list-bullet .t-bold')
-            if connections_elem:
-                connections_text = connections_elem.get_text(strip=True)
-                if 'connection' in connections_text.lower():
-                    profile_data['connections'] = connections_text
-            
-            # Clean up empty fields
-            profile_data = {k: v for k, v in profile_data.items() if v}
-            
-            logger.info(f"Successfully parsed LinkedIn profile for: {profile_data.get('name', 'Unknown')}")
-            return profile_data
-            
-        except Exception as e:
-            logger.error(f"Error parsing LinkedIn HTML: {e}")
-            return {}
+        return self.parser.parse(html_content, linkedin_url)
     
-    def scrape_multiple_profiles(self, linkedin_urls: List[str], delay: float = 2.0) -> List[Dict[str, Any]]:
+    def scrape_multiple_profiles(self, linkedin_urls: List[str], delay: float = None, *, max_workers: int = 1,
+                                 parse_workers: int = 0) -> List[Dict[str, Any]]:
         """
-        Scrape multiple LinkedIn profiles with rate limiting
+        Scrape multiple LinkedIn profiles, paced by the service's rate limiter
         
         Args:
             linkedin_urls: List of LinkedIn profile URLs
-            delay: Delay between requests in seconds
+            delay: Deprecated; extra seconds to sleep between sequential requests,
+                on top of the rate limiter's pacing
+            max_workers: Number of concurrent requests; values above 1 switch to
+                concurrent mode, capped at the client's max_concurrency
+            parse_workers: Parser processes; when set, pages are downloaded by
+                max_workers threads and parsed on other cores as they arrive
+                (scrape_pipeline.ScrapePipeline), which pays off for large batches
+                of big rendered pages
             
         Returns:
-            List of profile data dictionaries
+            List of profile data dictionaries, in input order
         """
+        if delay is not None:
+            warnings.warn("scrape_multiple_profiles(delay=...) is deprecated; requests are paced by the "
+                          "client's rate limiter", DeprecationWarning, stacklevel=2)
+        
+        if parse_workers > 0:
+            from scrape_pipeline import ScrapePipeline
+            
+            pipeline = ScrapePipeline(self, fetch_workers=min(max(max_workers, 1), self.max_concurrency),
+                                      parse_workers=parse_workers)
+            results = pipeline.scrape_all(linkedin_urls)
+            profiles = [result['profile'] for result in results if result['profile']]
+            logger.info(f"Successfully scraped {len(profiles)} out of {len(linkedin_urls)} profiles")
+            return profiles
+        
+        if max_workers > 1:
+            results = self.scrape_profiles_concurrently(linkedin_urls, max_workers)
+            profiles = [result['profile'] for result in results if result['profile']]
+            logger.info(f"Successfully scraped {len(profiles)} out of {len(linkedin_urls)} profiles")
+            return profiles
+        
         profiles = []
         
         for i, url in enumerate(linkedin_urls):
@@ -296,20 +280,55 @@ class ScrapeAPIClient:
             if profile_data:
                 profiles.append(profile_data)
             
-            # Rate limiting
-            if i < len(linkedin_urls) - 1:  # Don't sleep after the last request
+            if delay and i < len(linkedin_urls) - 1:
                 time.sleep(delay)
         
         logger.info(f"Successfully scraped {len(profiles)} out of {len(linkedin_urls)} profiles")
         return profiles
     
-    def search_linkedin_profiles(self, search_query: str, limit: int = 10) -> List[str]:
+    def scrape_profiles_concurrently(self, linkedin_urls: List[str], max_workers: int = None) -> List[Dict[str, Any]]:
+        """
+        Scrape LinkedIn profiles over a thread pool
+        
+        Wall time tracks the provider's concurrency allowance rather than the sum of
+        request latencies. Requests beyond the client's request_budget are not sent
+        and are reported as failures.
+        
+        Args:
+            linkedin_urls: List of LinkedIn profile URLs
+            max_workers: Number of concurrent requests (defaults to, and is capped at, max_concurrency)
+        
+        Returns:
+            One result per input URL, in input order, as returned by
+            scrape_profile_result
+        """
+        if not linkedin_urls:
+            return []
+        
+        workers = min(max_workers or self.max_concurrency, self.max_concurrency, len(linkedin_urls))
+        logger.info(f"Scraping {len(linkedin_urls)} profiles with {workers} concurrent workers")
+        
+        def scrape(url: str) -> Dict[str, Any]:
+            result = self.scrape_profile_result(url)
+            if result['error']:
+                logger.error(result['error'])
+            return result
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(scrape, linkedin_urls))
+        
+        failures = sum(1 for result in results if result['error'])
+        logger.info(f"Concurrent scrape finished: {len(results) - failures} succeeded, {failures} failed")
+        return results
+    
+    def search_linkedin_profiles(self, search_query: str, limit: int = 10, page: int = 0) -> List[str]:
         """
         Search for LinkedIn profiles using Google search
         
         Args:
             search_query: Search query (e.g., "HKB College of Engineering students")
             limit: Maximum number of URLs to return
+            page: Results page to fetch (0 is the first page of 10 results)
             
         Returns:
             List of LinkedIn profile URLs
@@ -318,12 +337,18 @@ class ScrapeAPIClient:
             logger.error("API key is required for searching")
             return []
         
+        if not self._reserve_request():
+            logger.error(f"Request budget of {self.request_budget} exhausted, skipping search: {search_query}")
+            return []
+        
         # Construct Google search query for LinkedIn profiles
         google_query = f'site:linkedin.com/in "{search_query}" students'
         google_search_url = f"https://www.google.com/search?q={quote_plus(google_query)}"
+        if page:
+            google_search_url += f"&start={page * 10}"
         
         try:
-            logger.info(f"Searching for LinkedIn profiles: {search_query}")
+            logger.info(f"Searching for LinkedIn profiles: {search_query} (page {page + 1})")
             
             # Use scraping API to search Google
             params = {
@@ -332,7 +357,7 @@ class ScrapeAPIClient:
                 'render_js': 'false'  # Google search doesn't need JS rendering
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.rate_limiter.send(self._send_search, self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
             html_content = response.text
@@ -409,7 +434,7 @@ def main():
         
         # Scrape the first few profiles
         logger.info("Scraping profile details...")
-        profiles = client.scrape_multiple_profiles(linkedin_urls[:2], delay=3.0)
+        profiles = client.scrape_multiple_profiles(linkedin_urls[:2])
         
         if profiles:
             # Save results
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Scrape Pipeline
+Overlap network fetches with multi-core HTML parsing for large profile batches
+"""
+
+import os
+import time
+import queue
+import multiprocessing
+import threading
+import logging
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
+
+from scrape_api_client import ScrapeAPIClient
+from profile_parser import ProfileParser
+
+logger = logging.getLogger(__name__)
+
+_FETCH_DONE = object()
+
+# Parser instance owned by each worker process, built once by _init_parse_worker
+_worker_parser: Optional[ProfileParser] = None
+
+def _init_parse_worker(backend: str):
+    global _worker_parser
+    _worker_parser = ProfileParser(backend)
+
+def _parse_in_worker(html_content: str, linkedin_url: str) -> Tuple[Dict[str, Any], float]:
+    # The parse is timed here so the parent's telemetry sees CPU time, not queueing delay
+    start = time.perf_counter()
+    profile_data = _worker_parser.parse(html_content, linkedin_url)
+    return profile_data, time.perf_counter() - start
+
+class ScrapePipeline:
+    """
+    Fetcher threads put raw HTML on a bounded queue; a process pool of parsers drains it
+    
+    The queue bound and the cap on in-flight parse jobs give backpressure: when
+    parsing falls behind, fetchers block instead of buffering pages, so memory
+    stays flat however many URLs are fed in.
+    """
+    
+    def __init__(self, scrape_client: ScrapeAPIClient, fetch_workers: int = None,
+                 parse_workers: int = None, queue_size: int = 32):
+        """
+        Initialize the pipeline
+        
+        Args:
+            scrape_client: Client used to download pages
+            fetch_workers: Concurrent downloads (defaults to the client's max_concurrency)
+            parse_workers: Parser processes (defaults to the number of CPUs)
+            queue_size: Maximum downloaded pages waiting to be parsed
+        """
+        self.scrape_client = scrape_client
+        self.fetch_workers = fetch_workers or scrape_client.max_concurrency
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+    
+    def run(self, linkedin_urls: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Scrape profiles, yielding each result as soon as it has been parsed
+        
+        Args:
+            linkedin_urls: Profile URLs; may be a lazy iterator, it is consumed
+                only as fast as fetchers pick up work
+        
+        Yields:
+            Dicts with 'index' (position in the input), 'url', 'profile'
+            (empty on failure) and 'error' (None on success), in completion order
+        """
+        url_feed = enumerate(linkedin_urls)
+        feed_lock = threading.Lock()
+        pages = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        
+        def next_url():
+            with feed_lock:
+                return next(url_feed, None)
+        
+        def put(item) -> bool:
+            # Block while the queue is full, but give up promptly if the consumer went away
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def fetch_loop():
+            try:
+                while not stop.is_set():
+                    work = next_url()
+                    if work is None:
+                        break
+                    index, url = work
+                    html_content, error = self.scrape_client.fetch_profile_html(url)
+                    if not put((index, url, html_content, error)):
+                        break
+            finally:
+                put(_FETCH_DONE)
+        
+        fetchers = [threading.Thread(target=fetch_loop, daemon=True) for _ in range(self.fetch_workers)]
+        for fetcher in fetchers:
+            fetcher.start()
+        
+        max_in_flight = self.parse_workers * 2
+        backend = self.scrape_client.parser.backend
+        in_flight = {}
+        fetchers_running = len(fetchers)
+        
+        try:
+            # Spawn rather than fork: the fetcher threads are already running
+            with ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_parse_worker, initargs=(backend,)) as pool:
+                while fetchers_running or in_flight:
+                    for future in [f for f in in_flight if f.done()]:
+                        index, url = in_flight.pop(future)
+                        yield self._parse_result(future, index, url)
+                    
+                    # Only pull another page once a parser slot is free
+                    if fetchers_running and len(in_flight) < max_in_flight:
+                        try:
+                            item = pages.get(timeout=0.05)
+                        except queue.Empty:
+                            continue
+                        
+                        if item is _FETCH_DONE:
+                            fetchers_running -= 1
+                            continue
+                        
+                        index, url, html_content, error = item
+                        if error:
+                            logger.error(error)
+                            yield {'index': index, 'url': url, 'profile': {}, 'error': error}
+                            continue
+                        
+                        future = pool.submit(_parse_in_worker, html_content, url)
+                        in_flight[future] = (index, url)
+                    elif in_flight:
+                        wait(in_flight, return_when=FIRST_COMPLETED)
+        finally:
+            stop.set()
+            for fetcher in fetchers:
+                fetcher.join()
+    
+    def _parse_result(self, future, index: int, url: str) -> Dict[str, Any]:
+        """Turn a finished parse job into a pipeline result"""
+        try:
+            profile_data, seconds = future.result()
+            self.scrape_client.telemetry.record_stage('parse', seconds)
+            error = None if profile_data else "Failed to parse profile HTML"
+        except Exception as e:
+            profile_data, error = {}, f"Parser process failed: {e}"
+        return {'index': index, 'url': url, 'profile': profile_data, 'error': error}
+    
+    def scrape_all(self, linkedin_urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape a batch and return one result per URL in input order
+        
+        Args:
+            linkedin_urls: Profile URLs
+        
+        Returns:
+            Results as yielded by run(), sorted by input position
+        """
+        results = sorted(self.run(linkedin_urls), key=lambda result: result['index'])
+        failures = sum(1 for result in results if result['error'])
+        logger.info(f"Pipeline finished: {len(results) - failures} succeeded, {failures} failed")
+        return results
@@ -6,6 +6,7 @@ Easy script to search for students from any college
 
 from linkedin_student_fetcher import LinkedInStudentFetcher
 import json
+import logging
 
 def search_students():
     # Initialize the fetcher
@@ -75,4 +76,5 @@ def search_students():
     print("\nDone! 🎉")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     search_students()
\ No newline at end of file
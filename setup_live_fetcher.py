@@ -88,7 +88,7 @@ def set_environment_variables():
         return False
 
 def test_apis():
-    """Test API connections"""
+    """Test API connections (HUNTER_API_URL/SCRAPE_API_URL point these at stub_providers.py offline)"""
     print("\n🧪 Testing API Connections...")
     print("-" * 30)
     
@@ -99,7 +99,7 @@ def test_apis():
     if hunter_key:
         try:
             print("Testing Hunter.io API...")
-            url = "https://api.hunter.io/v2/domain-search"
+            url = f"{os.getenv('HUNTER_API_URL', 'https://api.hunter.io/v2')}/domain-search"
             params = {
                 'domain': 'google.com',
                 'api_key': hunter_key,
@@ -125,7 +125,7 @@ def test_apis():
             print(f"Testing {service} API...")
             
             if service == 'scrapingbee':
-                url = "https://app.scrapingbee.com/api/v1"
+                url = os.getenv('SCRAPE_API_URL', "https://app.scrapingbee.com/api/v1")
                 params = {
                     'api_key': scrape_key,
                     'url': 'https://httpbin.org/status/200'
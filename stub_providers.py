@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Stub Provider Server
+Local HTTP server that stands in for the paid scraping APIs and LinkedIn search during benchmarks
+"""
+
+import os
+import re
+import glob
+import json
+import time
+import zlib
+import random
+import argparse
+import threading
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs, quote
+
+logger = logging.getLogger(__name__)
+
+PROFILE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><title>{name} | LinkedIn</title></head>
+<body>
+<div class="pv-text-details__left-panel">
+  <h1 class="text-heading-xlarge inline t-24 v-align-middle break-words">{name}</h1>
+  <div class="text-body-medium break-words">Student at HKB College of Engineering</div>
+  <span class="text-body-small inline t-black--light break-words">Bangalore, Karnataka, India</span>
+</div>
+<section class="pv-profile-section education">
+  <div class="pv-entity__summary-info">
+    <h3>HKB College of Engineering</h3>
+    <p class="pv-entity__degree-name"><span class="pv-entity__comma-item">Bachelor of Engineering</span></p>
+    <p class="pv-entity__fos"><span class="pv-entity__comma-item">Computer Science</span></p>
+    <p class="pv-entity__dates"><span class="pv-entity__comma-item">2021 - 2025</span></p>
+  </div>
+</section>
+<span class="pv-skill-category-entity__name-text">Python</span>
+<span class="pv-skill-category-entity__name-text">Java</span>
+</body>
+</html>
+"""
+
+SERP_RESULT_TEMPLATE = """<div class="g"><a href="/url?q={url}&amp;sa=U"><h3>{name} - Student - LinkedIn</h3></a></div>
+"""
+
+PEOPLE_RESULT_TEMPLATE = """<li class="reusable-search__result-container">
+  <div class="entity-result"><div class="entity-result__item">
+    <div class="entity-result__image"><a href="{url}"><img alt="{name}" src="data:,"></a></div>
+    <div class="entity-result__content">
+      <span class="entity-result__title-text t-16">
+        <a class="app-aware-link" href="{url}" aria-label="{name}"><span aria-hidden="true">{name}</span></a>
+      </span>
+      <div class="entity-result__primary-subtitle t-14 t-black t-normal">Student at HKB College of Engineering</div>
+      <div class="entity-result__secondary-subtitle t-14 t-normal">Bangalore, Karnataka, India</div>
+    </div>
+  </div></div>
+</li>
+"""
+
+_NON_SLUG = re.compile(r'[^0-9a-z]+')
+
+def recording_key(text: str) -> str:
+    """File name stem a recording for a domain, profile slug or search query is stored under"""
+    return _NON_SLUG.sub('-', text.lower()).strip('-')
+
+class Recordings:
+    """
+    Provider responses saved to disk, replayed by the stub server
+    
+    Layout of the directory (every part optional):
+        hunter/<domain>.json    Hunter.io domain-search response; its emails are
+                                served page by page
+        serp/<query>-p<N>.html  Google results page N (from 0) for a query; other
+                                queries get the saved pages in turn
+        profiles/<slug>.html    Rendered profile for linkedin.com/in/<slug>; other
+                                profiles get a saved page picked by slug
+        people/<query>-p<N>.html
+                                LinkedIn people search page N (from 1) for a query
+    File stems are recording_key() of the domain, query or slug. The repo's
+    fixtures directory works as-is for profiles.
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.domains: Dict[str, List[Dict]] = {}
+        for path in glob.glob(os.path.join(directory, 'hunter', '*.json')):
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.domains[os.path.basename(path)[:-5]] = (data.get('data') or {}).get('emails') or []
+        self.serp_pages = self._pages('serp')
+        self.profiles = self._pages('profiles')
+        self.people_pages = self._pages('people')
+    
+    def _pages(self, kind: str) -> Dict[str, str]:
+        pages = {}
+        for path in sorted(glob.glob(os.path.join(self.directory, kind, '*.html'))):
+            with open(path, encoding='utf-8') as f:
+                pages[os.path.basename(path)[:-5]] = f.read()
+        return pages
+    
+    def domain_emails(self, domain: str) -> Optional[List[Dict]]:
+        return self.domains.get(recording_key(domain))
+    
+    def serp(self, query: str, page: int) -> Optional[str]:
+        html = self.serp_pages.get(f"{recording_key(query)}-p{page}")
+        if html is None and self.serp_pages:
+            pages = list(self.serp_pages.values())
+            html = pages[page % len(pages)]
+        return html
+    
+    def people(self, query: str, page: int) -> Optional[str]:
+        return self.people_pages.get(f"{recording_key(query)}-p{page}")
+    
+    def profile(self, slug: str) -> Optional[str]:
+        html = self.profiles.get(recording_key(slug))
+        if html is None and self.profiles:
+            pages = list(self.profiles.values())
+            html = pages[zlib.crc32(slug.encode('utf-8')) % len(pages)]
+        return html
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Serves scraped profiles and Google results pages, and Hunter.io domain searches, lookups and verifications"""
+    
+    protocol_version = 'HTTP/1.1'  # Allow keep-alive so connection reuse can be measured
+    disable_nagle_algorithm = True  # Headers and body go out in separate writes
+    
+    def do_GET(self):
+        server = self.server
+        if server.latency or server.latency_jitter:
+            with server.stats_lock:
+                jitter = server.rng.uniform(0, server.latency_jitter) if server.latency_jitter else 0.0
+            time.sleep(server.latency + jitter)
+        
+        if self._inject_failure():
+            return
+        
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+        if parsed.path.endswith('/domain-search'):
+            self._domain_search(params)
+            return
+        if parsed.path.endswith('/email-finder'):
+            self._email_finder(params)
+            return
+        if parsed.path.endswith('/email-verifier'):
+            self._email_verifier(params)
+            return
+        if parsed.path.rstrip('/').endswith('/search/results/people'):
+            self._people_search(params)
+            return
+        
+        target = urlparse(params.get('url', [''])[0])
+        if target.netloc.endswith('google.com'):
+            self._search_page(parse_qs(target.query))
+            return
+        
+        slug = target.path.rstrip('/').split('/')[-1] or 'profile'
+        name = slug.replace('-', ' ').title()
+        
+        template = None
+        if server.recordings is not None:
+            template = server.recordings.profiles.get(recording_key(slug))
+        if template is None:
+            template = server.profile_html
+        if template is None and server.recordings is not None:
+            template = server.recordings.profile(slug)
+        self._send_html((template or PROFILE_TEMPLATE).replace('{name}', name))
+        
+    def _inject_failure(self) -> bool:
+        """Answer with a 429 burst or a random 503 instead of the real response when configured to"""
+        server = self.server
+        with server.stats_lock:
+            index = server.requests_received
+            server.requests_received += 1
+            throttle = server.throttle_every and index % server.throttle_every >= server.throttle_every - server.throttle_burst
+            fail = not throttle and server.error_rate and server.rng.random() < server.error_rate
+            if throttle:
+                server.throttled += 1
+            elif fail:
+                server.errors += 1
+        
+        if throttle:
+            self._send_status(429, {'Retry-After': f"{server.retry_after:g}"})
+        elif fail:
+            self._send_status(503)
+        return bool(throttle or fail)
+    
+    def _search_page(self, params):
+        """A Google results page: recorded if available, else server.search_results profiles per query"""
+        server = self.server
+        query = params.get('q', [''])[0]
+        page = int(params.get('start', ['0'])[0]) // 10
+        
+        html = server.recordings.serp(query, page) if server.recordings is not None else None
+        if html is None:
+            # Profiles are numbered per query so repeated searches find the same people
+            prefix = f"student-{zlib.crc32(query.encode('utf-8')) % 100000}"
+            ranks = range(page * 10, min(page * 10 + 10, server.search_results))
+            results = ''.join(SERP_RESULT_TEMPLATE.format(url=quote(f"https://www.linkedin.com/in/{prefix}-{i}", safe=':/'),
+                                                          name=f"Student {i}") for i in ranks)
+            html = f"<html><body><div id=\"search\">{results}</div></body></html>"
+        self._send_html(html)
+    
+    def _people_search(self, params):
+        """A LinkedIn people search page: recorded if available, else server.search_results cards per query"""
+        server = self.server
+        query = params.get('keywords', [''])[0]
+        page = max(1, int(params.get('page', ['1'])[0]))
+        
+        html = server.recordings.people(query, page) if server.recordings is not None else None
+        if html is None:
+            prefix = f"student-{zlib.crc32(query.encode('utf-8')) % 100000}"
+            ranks = range((page - 1) * 10, min(page * 10, server.search_results))
+            results = ''.join(PEOPLE_RESULT_TEMPLATE.format(url=f"https://www.linkedin.com/in/{prefix}-{i}",
+                                                            name=f"Student {i}") for i in ranks)
+            # Like LinkedIn, pages past the last result keep the container but have no cards
+            html = (f"<html><head><title>Search | LinkedIn</title></head><body><main>"
+                    f"<div class=\"search-results-container\"><ul class=\"reusable-search__entity-result-list\">"
+                    f"{results}</ul></div></main></body></html>")
+        self._send_html(html)
+    
+    def _domain_search(self, params):
+        """One page of a Hunter.io domain search over server.domain_emails synthetic people"""
+        server = self.server
+        domain = params.get('domain', ['example.edu'])[0]
+        offset = int(params.get('offset', ['0'])[0])
+        limit = int(params.get('limit', ['10'])[0])
+        
+        recorded = server.recordings.domain_emails(domain) if server.recordings is not None else None
+        total = len(recorded) if recorded is not None else server.domain_emails
+        etag = f'"{domain}-{total}"'
+        
+        if offset == 0 and self.headers.get('If-None-Match') == etag:
+            self._send_status(304, {'ETag': etag})
+            return
+        
+        if recorded is not None:
+            emails = recorded[offset:offset + limit]
+        else:
+            emails = [{'value': f"student{i}@{domain}", 'first_name': f"Student{i}", 'last_name': 'Test',
+                       'position': 'Student', 'confidence': 90,
+                       'sources': [{'uri': f"https://www.linkedin.com/in/{recording_key(domain)}-student-{i}"}]}
+                      for i in range(offset, min(offset + limit, total))]
+        self._send_json({'data': {'domain': domain, 'emails': emails},
+                         'meta': {'results': total, 'limit': limit, 'offset': offset}},
+                        {'ETag': etag})
+    
+    def _email_finder(self, params):
+        """A Hunter.io email-finder result: first.last at the domain"""
+        domain = params.get('domain', ['example.edu'])[0]
+        first_name = params.get('first_name', [''])[0]
+        last_name = params.get('last_name', [''])[0]
+        email = f"{first_name}.{last_name}@{domain}".lower()
+        self._send_json({'data': {'email': email, 'first_name': first_name, 'last_name': last_name,
+                                  'domain': domain, 'score': 90}})
+    
+    def _email_verifier(self, params):
+        """A Hunter.io verification result; addresses starting with 'bounce' are undeliverable"""
+        email = params.get('email', [''])[0]
+        deliverable = not email.startswith('bounce')
+        self._send_json({'data': {'email': email, 'status': 'valid' if deliverable else 'invalid',
+                                  'result': 'deliverable' if deliverable else 'undeliverable',
+                                  'score': 95 if deliverable else 10}})
+    
+    def _send_json(self, payload, headers=None):
+        self._send_body(json.dumps(payload).encode('utf-8'), 'application/json', headers)
+    
+    def _send_html(self, html: str):
+        self._send_body(html.encode('utf-8'), 'text/html; charset=utf-8')
+    
+    def _send_status(self, status: int, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        
+        with self.server.stats_lock:
+            self.server.requests_served += 1
+    
+    def _send_body(self, body: bytes, content_type: str, headers=None):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        
+        with self.server.stats_lock:
+            self.server.requests_served += 1
+    
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+class StubProviderServer:
+    """
+    Threaded local stand-in for ScrapingBee/ScrapeOwl/Scrapfly, Google search, LinkedIn
+    people search and Hunter.io
+    
+    Responses are replayed from a recordings directory where one matches
+    (see Recordings) and synthesized otherwise. Latency, random server errors
+    and bursts of 429s can be injected; the error stream is seeded, so a
+    benchmark sees the same failures on every run.
+    """
+    
+    def __init__(self, latency: float = 0.0, host: str = '127.0.0.1', port: int = 0, profile_html: str = None,
+                 domain_emails: int = 250, recordings: str = None, search_results: int = 100,
+                 latency_jitter: float = 0.0, error_rate: float = 0.0, throttle_every: int = 0,
+                 throttle_burst: int = 0, retry_after: float = 1.0, seed: int = 0):
+        """
+        Initialize the stub server
+        
+        Args:
+            latency: Seconds each response is delayed, to mimic JS rendering time
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            profile_html: Page served for every profile without a recording of its own
+                (e.g. a saved fixture); any '{name}' placeholder is filled from the requested URL
+            domain_emails: Addresses every unrecorded Hunter.io domain search reports
+            recordings: Directory of saved provider responses to replay
+            search_results: Profiles every unrecorded search query finds, 10 per page
+            latency_jitter: Extra random delay of up to this many seconds per response
+            error_rate: Share of requests answered with a 503
+            throttle_every: Answer the last throttle_burst of every throttle_every
+                requests with a 429 (0 disables throttling)
+            throttle_burst: Length of each run of 429s
+            retry_after: Retry-After seconds sent with every 429
+            seed: Seed for latency jitter and injected errors
+        """
+        self.httpd = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.latency_jitter = latency_jitter
+        self.httpd.profile_html = profile_html
+        self.httpd.domain_emails = domain_emails
+        self.httpd.recordings = Recordings(recordings) if recordings else None
+        self.httpd.search_results = search_results
+        self.httpd.error_rate = error_rate
+        self.httpd.throttle_every = throttle_every
+        self.httpd.throttle_burst = min(throttle_burst, throttle_every)
+        self.httpd.retry_after = retry_after
+        self.httpd.rng = random.Random(seed)
+        self.httpd.requests_received = 0
+        self.httpd.requests_served = 0
+        self.httpd.throttled = 0
+        self.httpd.errors = 0
+        self.httpd.stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """Base URL to pass to ScrapeAPIClient(base_url=...) or HunterAPIClient(base_url=...)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+    
+    @property
+    def people_search_url(self) -> str:
+        """LinkedIn people search page to pass to SeleniumLinkedInScraper(search_url=...)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/search/results/people/"
+    
+    @property
+    def requests_served(self) -> int:
+        return self.httpd.requests_served
+    
+    def stats(self) -> Dict[str, int]:
+        """Requests answered, and how many of them were injected 429s and 503s"""
+        with self.httpd.stats_lock:
+            return {'requests': self.httpd.requests_served, 'throttled': self.httpd.throttled,
+                    'errors': self.httpd.errors}
+    
+    def start(self) -> 'StubProviderServer':
+        """Start serving on a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Stub provider listening on {self.url}")
+        return self
+    
+    def stop(self):
+        """Shut the server down"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+    
+    def __enter__(self) -> 'StubProviderServer':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+def main():
+    """Serve stub providers until interrupted, for pointing the fetcher at via HUNTER_API_URL/SCRAPE_API_URL"""
+    parser = argparse.ArgumentParser(description='Local stand-in for Hunter.io, the scraping APIs and Google search')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind (default: 8765)')
+    parser.add_argument('--recordings', help='Directory of saved responses to replay (e.g. fixtures)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds each response is delayed')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random delay of up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of requests answered with a 503')
+    parser.add_argument('--throttle-every', type=int, default=0, help='Throttle once per this many requests')
+    parser.add_argument('--throttle-burst', type=int, default=0, help='Consecutive 429s per throttling episode')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds sent with each 429')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for jitter and injected errors')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
+    server = StubProviderServer(args.latency, args.host, args.port, recordings=args.recordings,
+                                latency_jitter=args.jitter, error_rate=args.error_rate,
+                                throttle_every=args.throttle_every, throttle_burst=args.throttle_burst,
+                                retry_after=args.retry_after, seed=args.seed)
+    print(f"Stub providers listening on {server.url}")
+    print(f"  export HUNTER_API_URL={server.url} SCRAPE_API_URL={server.url} HUNTER_API_KEY=stub SCRAPE_API_KEY=stub")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"Served: {server.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Student Record
+Canonical slotted student profile shared by the fetchers, aggregators and exporters
+"""
+
+import sys
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Union
+
+# Alternative spellings used by the different sources, mapped to the canonical field
+FIELD_ALIASES = {
+    'linkedin_url': 'profile_url',
+    'profileUrl': 'profile_url',
+    'graduationYear': 'graduation_year',
+}
+
+# Written by to_dict() even when empty, matching the original StudentProfile export
+CORE_FIELDS = ('name', 'college', 'degree', 'graduation_year', 'location', 'headline',
+               'profile_url', 'connections', 'skills', 'experience')
+# Written by to_dict() only when set
+OPTIONAL_FIELDS = ('email', 'student_status', 'method', 'source', 'data_quality')
+
+_FIELDS = CORE_FIELDS + OPTIONAL_FIELDS
+_FIELD_SET = frozenset(_FIELDS)
+
+def _intern(value: Any) -> Any:
+    # Low-cardinality text shared by thousands of records; interning keeps one copy of each value
+    return sys.intern(value) if type(value) is str else value
+
+class StudentProfile:
+    """
+    Student profile information
+    
+    Uses __slots__ instead of a per-instance __dict__, and interns the
+    categorical fields, so large in-memory datasets cost a fraction of the
+    equivalent dictionaries. Keys that have no field of their own (Hunter
+    confidence, domain, ...) are kept in `extra` so nothing is lost on a
+    from_dict()/to_dict() round trip.
+    """
+    
+    __slots__ = _FIELDS + ('extra',)
+    
+    def __init__(self, name: str, college: str, degree: Optional[str] = None,
+                 graduation_year: Optional[str] = None, location: Optional[str] = None,
+                 headline: Optional[str] = None, profile_url: Optional[str] = None,
+                 connections: Optional[int] = None, skills: List[str] = None,
+                 experience: List[Dict] = None, email: Optional[str] = None,
+                 student_status: Optional[str] = None, method: Optional[str] = None,
+                 source: Optional[str] = None, data_quality: Optional[str] = None,
+                 extra: Dict[str, Any] = None):
+        self.name = name
+        self.college = _intern(college)
+        self.degree = _intern(degree)
+        self.graduation_year = None if graduation_year is None else str(graduation_year)
+        self.location = _intern(location)
+        self.headline = headline
+        self.profile_url = profile_url
+        self.connections = connections
+        self.skills = [_intern(skill) for skill in skills] if skills else []
+        self.experience = experience if experience is not None else []
+        self.email = email
+        self.student_status = _intern(student_status)
+        self.method = _intern(method)
+        self.source = _intern(source)
+        self.data_quality = _intern(data_quality)
+        # None rather than {} so records without extra keys carry no dictionary at all
+        self.extra = extra or None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **overrides) -> 'StudentProfile':
+        """
+        Build a record from any of the pipeline's dictionary shapes
+        
+        Args:
+            data: Student dictionary (profile_url/linkedin_url/profileUrl,
+                graduation_year/graduationYear, ...)
+            **overrides: Field values that take precedence over data
+        
+        Returns:
+            StudentProfile
+        """
+        fields = {}
+        extra = {}
+        for key, value in data.items():
+            key = FIELD_ALIASES.get(key, key)
+            if key in _FIELD_SET:
+                # An empty value never replaces one already seen under another spelling
+                if value is not None or key not in fields:
+                    fields[key] = value
+            elif key != 'extra':
+                extra[key] = value
+        if data.get('extra'):
+            extra.update(data['extra'])
+        fields.update(overrides)
+        fields.setdefault('name', '')
+        fields.setdefault('college', None)
+        return cls(extra=extra, **fields)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary with canonical keys, ready for JSON or pandas"""
+        data = {field: getattr(self, field) for field in CORE_FIELDS}
+        for field in OPTIONAL_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        if self.extra:
+            for key, value in self.extra.items():
+                data.setdefault(key, value)
+        return data
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Dictionary-style read access, accepting the same aliases as from_dict()
+        
+        Lets exporters written against dictionaries take records directly.
+        """
+        key = FIELD_ALIASES.get(key, key)
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+        else:
+            value = self.extra.get(key) if self.extra else None
+        return default if value is None else value
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, StudentProfile):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+    
+    def __repr__(self) -> str:
+        return (f"StudentProfile(name={self.name!r}, college={self.college!r}, "
+                f"degree={self.degree!r}, profile_url={self.profile_url!r})")
+
+def student_dicts(records: Iterable[Union[StudentProfile, Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily turn a mix of records and dictionaries into dictionaries
+    
+    Dictionaries pass through untouched; records are converted with to_dict().
+    """
+    for record in records:
+        yield record.to_dict() if isinstance(record, StudentProfile) else record
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Telemetry
+Per-provider request counts, status codes, bytes and latency histograms, plus pipeline stage timings
+"""
+
+import json
+import time
+import bisect
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Bucket upper bounds in seconds: 1ms to about two minutes, each one 25% wider than the last
+LATENCY_BUCKETS = tuple(round(0.001 * 1.25 ** i, 6) for i in range(53))
+QUANTILES = (0.5, 0.95, 0.99)
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram
+    
+    Memory and cost per observation are constant however many requests are
+    recorded; quantiles are interpolated within a bucket, so with 25% wide
+    buckets they are accurate to within about 12%.
+    """
+    
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)      # The last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def observe(self, seconds: float):
+        """Record one duration"""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+    
+    def quantile(self, q: float) -> float:
+        """Estimated q-quantile (0 < q < 1) in seconds"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - cumulative) / count, self.max)
+            cumulative += count
+        return self.max
+    
+    def summary(self) -> Dict[str, float]:
+        """Count, total, mean, p50/p95/p99 and max, in seconds"""
+        summary = {'count': self.count, 'sum': round(self.total, 6),
+                   'mean': round(self.total / self.count, 6) if self.count else 0.0}
+        for q in QUANTILES:
+            summary[f"p{int(q * 100)}"] = round(self.quantile(q), 6)
+        summary['max'] = round(self.max, 6)
+        return summary
+
+class _EndpointStats:
+    """Everything recorded about one provider endpoint"""
+    
+    __slots__ = ('statuses', 'bytes_received', 'latency')
+    
+    def __init__(self):
+        self.statuses: Dict[str, int] = {}
+        self.bytes_received = 0
+        self.latency = LatencyHistogram()
+
+class Telemetry:
+    """
+    Where a crawl's time and money go
+    
+    Clients wrap each HTTP call with instrument(), which records every
+    attempt (retries included) under its provider and endpoint: status code
+    or exception name, response bytes and latency. Pipeline code wraps its
+    stages (discover, fetch, parse, enrich, dedup, save) in stage(). Stages
+    can nest and run on many threads at once, so stage totals measure work
+    done, not wall time. snapshot() and to_prometheus() dump everything.
+    """
+    
+    def __init__(self):
+        self.started_at = time.time()
+        self._endpoints: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._stages: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+    
+    def record_request(self, provider: str, endpoint: str, status: Any, seconds: float, bytes_received: int = 0):
+        """
+        Record one request attempt
+        
+        Args:
+            provider: Service name ('hunter', 'scrapingbee', ...)
+            endpoint: Operation within the service ('domain-search', 'profile', ...)
+            status: HTTP status code, or the exception name if no response came back
+            seconds: Time until the response (or error) arrived
+            bytes_received: Response body size
+        """
+        key = (provider, endpoint)
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats()
+            status = str(status)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.bytes_received += bytes_received
+            stats.latency.observe(seconds)
+    
+    def instrument(self, request: Callable[..., requests.Response], provider: str,
+                   endpoint: str) -> Callable[..., requests.Response]:
+        """
+        Wrap a request function (e.g. transport.get) so every call is recorded
+        
+        Pass the wrapper to RateLimiter.send() so each retry is recorded too.
+        """
+        def send(*args, **kwargs) -> requests.Response:
+            start = time.perf_counter()
+            try:
+                response = request(*args, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self.record_request(provider, endpoint, type(e).__name__, time.perf_counter() - start)
+                raise
+            self.record_request(provider, endpoint, response.status_code, time.perf_counter() - start,
+                                len(response.content or b''))
+            return response
+        return send
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one run of a pipeline stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - start)
+    
+    def record_stage(self, name: str, seconds: float):
+        """Record a stage duration measured elsewhere (e.g. in a worker process)"""
+        with self._lock:
+            histogram = self._stages.get(name)
+            if histogram is None:
+                histogram = self._stages[name] = LatencyHistogram()
+            histogram.observe(seconds)
+    
+    def request_count(self, provider: str = None, endpoint: str = None) -> int:
+        """Requests that reached a provider (any HTTP status; connection failures excluded)"""
+        with self._lock:
+            return sum(count
+                       for (stats_provider, stats_endpoint), stats in self._endpoints.items()
+                       if provider in (None, stats_provider) and endpoint in (None, stats_endpoint)
+                       for status, count in stats.statuses.items() if status.isdigit())
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Everything recorded so far as a JSON-ready dictionary"""
+        with self._lock:
+            endpoints = []
+            for (provider, endpoint), stats in sorted(self._endpoints.items()):
+                errors = sum(count for status, count in stats.statuses.items()
+                             if not status.isdigit() or int(status) >= 400)
+                endpoints.append({
+                    'provider': provider,
+                    'endpoint': endpoint,
+                    'requests': stats.latency.count,
+                    'errors': errors,
+                    'statuses': dict(sorted(stats.statuses.items())),
+                    'bytes_received': stats.bytes_received,
+                    'latency': stats.latency.summary(),
+                })
+            stages = {name: histogram.summary() for name, histogram in sorted(self._stages.items())}
+        return {'started_at': self.started_at, 'elapsed': round(time.time() - self.started_at, 3),
+                'requests': endpoints, 'stages': stages}
+    
+    def to_prometheus(self, prefix: str = 'linkedin_fetcher') -> str:
+        """Everything recorded so far in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            lines.append(f"# HELP {prefix}_requests_total Provider requests by endpoint and status")
+            lines.append(f"# TYPE {prefix}_requests_total counter")
+            for (provider, endpoint), stats in sorted(self._endpoints.items()):
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f'{prefix}_requests_total{{provider="{provider}",endpoint="{endpoint}",'
+                                 f'status="{status}"}} {count}')
+            
+            lines.append(f"# HELP {prefix}_response_bytes_total Response body bytes by endpoint")
+            lines.append(f"# TYPE {prefix}_response_bytes_total counter")
+            for (provider, endpoint), stats in sorted(self._endpoints.items()):
+                lines.append(f'{prefix}_response_bytes_total{{provider="{provider}",endpoint="{endpoint}"}} '
+                             f'{stats.bytes_received}')
+            
+            lines.append(f"# HELP {prefix}_request_duration_seconds Provider request latency")
+            lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+            for (provider, endpoint), stats in sorted(self._endpoints.items()):
+                lines.extend(_histogram_lines(f"{prefix}_request_duration_seconds",
+                                              f'provider="{provider}",endpoint="{endpoint}"', stats.latency))
+            
+            lines.append(f"# HELP {prefix}_stage_duration_seconds Time spent per pipeline stage run")
+            lines.append(f"# TYPE {prefix}_stage_duration_seconds histogram")
+            for name, histogram in sorted(self._stages.items()):
+                lines.extend(_histogram_lines(f"{prefix}_stage_duration_seconds", f'stage="{name}"', histogram))
+        return '\n'.join(lines) + '\n'
+    
+    def report_lines(self) -> List[str]:
+        """Human-readable request and stage tables for text reports"""
+        snapshot = self.snapshot()
+        lines = [f"{'Provider/endpoint':32s} {'Requests':>8s} {'Errors':>6s} {'KB':>9s} "
+                 f"{'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s}  Statuses"]
+        for entry in snapshot['requests']:
+            latency = entry['latency']
+            statuses = ', '.join(f"{status}: {count}" for status, count in entry['statuses'].items())
+            lines.append(f"{entry['provider'] + '/' + entry['endpoint']:32s} {entry['requests']:8d} "
+                         f"{entry['errors']:6d} {entry['bytes_received'] / 1024:9.1f} "
+                         f"{latency['p50'] * 1000:8.1f} {latency['p95'] * 1000:8.1f} {latency['p99'] * 1000:8.1f}  "
+                         f"{statuses}")
+        lines.append('')
+        lines.append(f"{'Stage':32s} {'Runs':>8s} {'Total s':>9s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s}")
+        for name, summary in snapshot['stages'].items():
+            lines.append(f"{name:32s} {summary['count']:8d} {summary['sum']:9.2f} {summary['p50'] * 1000:8.1f} "
+                         f"{summary['p95'] * 1000:8.1f} {summary['p99'] * 1000:8.1f}")
+        return lines
+    
+    def write(self, path: str):
+        """Dump to a file: JSON for .json paths, Prometheus text otherwise"""
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith('.json'):
+                json.dump(self.snapshot(), f, indent=2)
+            else:
+                f.write(self.to_prometheus())
+
+def _histogram_lines(name: str, labels: str, histogram: LatencyHistogram) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f'{name}_sum{{{labels}}} {histogram.total:.6f}')
+    lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+    return lines
+
+_shared_telemetry: Optional[Telemetry] = None
+_shared_lock = threading.Lock()
+
+def get_telemetry() -> Telemetry:
+    """Return the process-wide telemetry, creating it on first use"""
+    global _shared_telemetry
+    with _shared_lock:
+        if _shared_telemetry is None:
+            _shared_telemetry = Telemetry()
+        return _shared_telemetry